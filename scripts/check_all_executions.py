@@ -2,20 +2,27 @@
 """
 scripts/check_all_executions.py
 모든 체결 내역 확인 (필터 없음)
+
+로컬 execution 캐시(logs/executions/*.jsonl)를 증분 sync 후 캐시에서 조회
+(두 번째 실행부터는 마지막 체결 이후만 REST 조회)
 """
 
 import sys
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
 
 import os
 from dotenv import load_dotenv
-from src.infrastructure.exchange.bybit_rest_client import BybitRestClient
+from infrastructure.exchange.bybit_rest_client import BybitRestClient
+from infrastructure.exchange.execution_sync import ExecutionHistorySync
+from infrastructure.storage.execution_store import ExecutionStore
 
 load_dotenv()
 
+CACHE_DIR = project_root / "logs" / "executions"
+
 
 def check_all_executions():
     """모든 체결 내역 확인 (symbol/category 필터 없음)"""
@@ -42,15 +49,17 @@ def check_all_executions():
     # Test 1: Linear BTCUSDT
     print("\n1️⃣ Linear BTCUSDT:")
     try:
-        response = rest_client.get_execution_list(
+        sync = ExecutionHistorySync(
+            rest_client,
+            ExecutionStore(CACHE_DIR / "testnet_linear_BTCUSDT.jsonl"),
             category="linear",
             symbol="BTCUSDT",
-            limit=10
         )
-        executions = response.get("result", {}).get("list", [])
-        print(f"   Found {len(executions)} executions")
+        new_executions = sync.sync()
+        executions = sync.store.range()
+        print(f"   Found {len(executions)} executions ({len(new_executions)} new, {sync.request_count} requests)")
         if executions:
-            latest = executions[0]
+            latest = executions[-1]
             print(f"   Latest: {latest.get('side')} {latest.get('execQty')} @ ${latest.get('execPrice')}")
     except Exception as e:
         print(f"   ❌ Error: {e}")
@@ -58,12 +67,15 @@ def check_all_executions():
     # Test 2: Linear 전체 (symbol 필터 없음)
     print("\n2️⃣ Linear All Symbols:")
     try:
-        response = rest_client.get_execution_list(
+        sync = ExecutionHistorySync(
+            rest_client,
+            ExecutionStore(CACHE_DIR / "testnet_linear_all.jsonl"),
             category="linear",
-            limit=10
+            symbol=None,
         )
-        executions = response.get("result", {}).get("list", [])
-        print(f"   Found {len(executions)} executions")
+        new_executions = sync.sync()
+        executions = sync.store.range()[::-1]  # 최신순
+        print(f"   Found {len(executions)} executions ({len(new_executions)} new, {sync.request_count} requests)")
         if executions:
             for i, exec in enumerate(executions[:3], 1):
                 print(f"   {i}. {exec.get('symbol')} {exec.get('side')} {exec.get('execQty')} @ ${exec.get('execPrice')}")
@@ -6,20 +6,27 @@ scripts/check_closed_pnl.py
 목적:
 - Closed PnL 확인
 - 청산 시각, 가격 확인
+
+로컬 execution 캐시(logs/executions/*.jsonl)를 증분 sync 후 캐시 전체를 집계
+(두 번째 실행부터는 마지막 체결 이후만 REST 조회)
 """
 
 import sys
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
 
 import os
 from dotenv import load_dotenv
-from src.infrastructure.exchange.bybit_rest_client import BybitRestClient
+from infrastructure.exchange.bybit_rest_client import BybitRestClient
+from infrastructure.exchange.execution_sync import ExecutionHistorySync
+from infrastructure.storage.execution_store import ExecutionStore
 
 load_dotenv()
 
+CACHE_PATH = project_root / "logs" / "executions" / "testnet_linear_BTCUSDT.jsonl"
+
 
 def check_closed_pnl():
     """청산된 거래 내역 확인"""
@@ -44,14 +51,16 @@ def check_closed_pnl():
     )
 
     try:
-        # Execution list 가져오기 (closedSize > 0인 것만)
-        response = rest_client.get_execution_list(
+        # Execution 캐시 증분 sync (watermark 이후 cursor pagination) → 캐시 전체 조회
+        sync = ExecutionHistorySync(
+            rest_client,
+            ExecutionStore(CACHE_PATH),
             category="linear",
             symbol="BTCUSDT",
-            limit=50
         )
-
-        executions = response.get("result", {}).get("list", [])
+        new_executions = sync.sync()
+        executions = sync.store.range()[::-1]  # 최신순
+        print(f"\n🗂️  Cache: {CACHE_PATH} ({len(new_executions)} new, {sync.request_count} requests)")
 
         if not executions:
             print("\n⚠️  No execution history found")
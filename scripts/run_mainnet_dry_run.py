@@ -36,9 +36,15 @@ from typing import Dict, Any
 
 from dotenv import load_dotenv
 from application.orchestrator import Orchestrator
+from application.tick_scheduler import TickScheduler
 from infrastructure.exchange.bybit_rest_client import BybitRestClient
+from infrastructure.exchange.bybit_async_rest_client import AsyncBybitRestClient
 from infrastructure.exchange.bybit_ws_client import BybitWsClient
+from infrastructure.exchange.bybit_public_ws_client import BybitPublicWsClient
 from infrastructure.exchange.bybit_adapter import BybitAdapter
+from infrastructure.exchange.execution_sync import ExecutionHistorySync
+from infrastructure.exchange.kline_cache import KlineDiskCache
+from infrastructure.storage.execution_store import ExecutionStore
 from infrastructure.storage.log_storage import LogStorage
 from infrastructure.notification.telegram_notifier import TelegramNotifier
 from domain.state import State
@@ -262,6 +268,7 @@ def run_mainnet(
         api_secret = os.getenv("BYBIT_API_SECRET", "")
         mainnet_rest_url = "https://api.bybit.com"
         mainnet_ws_url = "wss://stream.bybit.com/v5/private"
+        mainnet_public_ws_url = "wss://stream.bybit.com/v5/public/linear"
 
         rest_client = BybitRestClient(
             api_key=api_key,
@@ -275,13 +282,25 @@ def run_mainnet(
             wss_url=mainnet_ws_url
         )
 
+        # Public market-data stream (tickers + kline, REST polling은 fallback)
+        public_ws_client = BybitPublicWsClient(wss_url=mainnet_public_ws_url)
+
+        # Async REST client (update_market_data 조회 동시 fan-out)
+        async_rest_client = AsyncBybitRestClient(rest_client)
+
         log_storage = LogStorage(log_dir=Path("logs/mainnet"))
 
         # BybitAdapter 초기화 (Mainnet mode)
         bybit_adapter = BybitAdapter(
             rest_client=rest_client,
             ws_client=ws_client,
-            testnet=False  # Mainnet
+            testnet=False,  # Mainnet
+            async_rest_client=async_rest_client,
+            session_risk_checkpoint_path=Path("logs/mainnet/session_risk.json"),
+            execution_sync=ExecutionHistorySync(
+                rest_client, ExecutionStore(Path("logs/mainnet/executions_linear_BTCUSDT.jsonl"))
+            ),
+            kline_cache=KlineDiskCache(Path("logs/mainnet/klines")),
         )
 
         # Market data 초기 로드 (equity, mark price 조회)
@@ -313,13 +332,24 @@ def run_mainnet(
 
         # WebSocket 시작 (execution events 수신)
         logger.info("🔌 Starting WebSocket connection...")
-        ws_client.start()
+        ws_client.start(
+            on_position=bybit_adapter.on_position_update,
+            on_wallet=bybit_adapter.on_wallet_update,
+            on_order=bybit_adapter.on_order_update,
+            gap_fill=bybit_adapter.fetch_missed_executions,
+        )
         time.sleep(3)  # Wait for connection/auth/subscribe
         if ws_client.is_connected():
-            logger.info("✅ WebSocket connected and subscribed to execution.linear")
+            logger.info("✅ WebSocket connected and subscribed to execution/position/order.linear + wallet")
         else:
             logger.warning("⚠️ WebSocket connection in progress...")
 
+        # Public stream 시작 (tickers/kline → adapter 캐시, 초기 kline은 REST로 seed 완료)
+        public_ws_client.start(
+            on_ticker=bybit_adapter.on_ticker_update,
+            on_kline=bybit_adapter.on_kline_update,
+        )
+
         # Monitor 초기화
         monitor = MainnetMonitor(initial_equity=initial_equity)
 
@@ -381,7 +411,13 @@ def run_mainnet(
 
     start_time = time.time()
 
-    tick_interval = 1.0  # 1초마다 tick (WS 이벤트 처리용)
+    # Event-driven tick (execution/가격 변동/pending timeout 즉시, 이벤트 없으면 1초 heartbeat)
+    tick_scheduler = TickScheduler(
+        wait_for_events=ws_client.wait_for_events,
+        get_price=bybit_adapter.get_current_price,
+        get_pending_deadline=orchestrator.get_pending_order_deadline,
+        heartbeat_s=1.0,
+    )
     market_data_refresh_interval = 30.0  # 30초마다 시장 데이터 갱신
     last_market_refresh = 0.0  # 즉시 첫 갱신 트리거
 
@@ -395,8 +431,12 @@ def run_mainnet(
         tick_count = 0
 
         while True:
+            wakeup_reason = tick_scheduler.wait_next()
             tick_count += 1
-            logger.info(f"🔄 Tick {tick_count} (trades: {monitor.total_trades}/{target_trades})")
+            if wakeup_reason == "heartbeat":
+                logger.info(f"🔄 Tick {tick_count} (trades: {monitor.total_trades}/{target_trades})")
+            else:
+                logger.info(f"⚡ Tick {tick_count} [{wakeup_reason}] (trades: {monitor.total_trades}/{target_trades})")
 
             # 종료 조건 확인
             if monitor.total_trades >= target_trades:
@@ -426,12 +466,18 @@ def run_mainnet(
 
             # Tick 실행
             try:
-                result = orchestrator.run_tick()
+                tick_started = time.monotonic()
+                try:
+                    result = orchestrator.run_tick()
+                finally:
+                    tick_scheduler.record_tick(time.monotonic() - tick_started)
                 current_state = result.state
 
                 # Tick 결과 로깅 (상태 변경 시 또는 10 tick마다)
                 if tick_count % 10 == 0 or current_state != previous_state:
                     logger.info(f"  → State: {current_state}, Halt: {result.halt_reason}")
+                if tick_count % 600 == 0:
+                    logger.info(f"  ⏱️ Scheduler metrics: {tick_scheduler.get_metrics()}")
 
                 # Entry 차단 이유 로깅 (항상 로깅 - 디버깅용)
                 if result.entry_blocked:
@@ -578,9 +624,6 @@ def run_mainnet(
             # Previous state 업데이트
             previous_state = current_state
 
-            # Sleep
-            time.sleep(tick_interval)
-
     except KeyboardInterrupt:
         logger.info("🛑 Mainnet Dry-Run interrupted by user")
 
@@ -598,9 +641,15 @@ def run_mainnet(
     finally:
         # WebSocket 정리
         ws_client.stop()
+        public_ws_client.stop()
+
+        # REST keep-alive 연결 풀 정리
+        async_rest_client.close()
+        rest_client.close()
 
         # 최종 통계 출력
         monitor.print_summary()
+        logger.info(f"⏱️ Scheduler metrics: {tick_scheduler.get_metrics()}")
 
         # Telegram Summary 전송
         telegram.send_summary(
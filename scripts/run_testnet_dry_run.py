@@ -24,6 +24,9 @@ from application.orchestrator import Orchestrator
 from infrastructure.exchange.bybit_rest_client import BybitRestClient
 from infrastructure.exchange.bybit_ws_client import BybitWsClient
 from infrastructure.exchange.bybit_adapter import BybitAdapter
+from infrastructure.exchange.execution_sync import ExecutionHistorySync
+from infrastructure.exchange.kline_cache import KlineDiskCache
+from infrastructure.storage.execution_store import ExecutionStore
 from infrastructure.storage.log_storage import LogStorage
 from infrastructure.notification.telegram_notifier import TelegramNotifier
 from domain.state import State
@@ -186,7 +189,12 @@ def run_dry_run(target_trades: int = 30, max_duration_hours: int = 72):
     bybit_adapter = BybitAdapter(
         rest_client=rest_client,
         ws_client=ws_client,
-        testnet=True
+        testnet=True,
+        session_risk_checkpoint_path=log_dir / "session_risk.json",
+        execution_sync=ExecutionHistorySync(
+            rest_client, ExecutionStore(log_dir / "executions_linear_BTCUSDT.jsonl")
+        ),
+        kline_cache=KlineDiskCache(log_dir / "klines"),
     )
 
     # Git commit hash + Config hash 계산
@@ -232,11 +240,16 @@ def run_dry_run(target_trades: int = 30, max_duration_hours: int = 72):
 
     # WebSocket 시작 (execution events 수신)
     logger.info("🔌 Starting WebSocket connection...")
-    ws_client.start()
+    ws_client.start(
+        on_position=bybit_adapter.on_position_update,
+        on_wallet=bybit_adapter.on_wallet_update,
+        on_order=bybit_adapter.on_order_update,
+        gap_fill=bybit_adapter.fetch_missed_executions,
+    )
     # Wait for connection/auth/subscribe (3초 대기)
     time.sleep(3)
     if ws_client.is_connected():
-        logger.info("✅ WebSocket connected and subscribed to execution.linear")
+        logger.info("✅ WebSocket connected and subscribed to execution/position/order.linear + wallet")
     else:
         logger.warning("⚠️ WebSocket connection in progress...")
 
@@ -6,6 +6,7 @@ Purpose:
 - Kline 데이터 → ATR 계산
 - ATR percentile 계산 (rolling 100-period)
 - Grid spacing 계산 (Entry signal generation용)
+- ATRState: streaming ATR (bar당 O(1) 갱신, EMA 상태 유지, rolling ATR history)
 
 SSOT:
 - docs/plans/task_plan.md Phase 12a-2 (ATR Calculator)
@@ -13,7 +14,9 @@ SSOT:
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import Deque, Iterable, List, Optional, Sequence
+
+from application.rolling_percentile import RollingPercentile
 
 
 @dataclass
@@ -66,11 +69,7 @@ class ATRCalculator:
         Returns:
             float: True Range
         """
-        high_low = current_kline.high - current_kline.low
-        high_prev_close = abs(current_kline.high - previous_close)
-        prev_close_low = abs(previous_close - current_kline.low)
-
-        return max(high_low, high_prev_close, prev_close_low)
+        return _true_range(current_kline.high, current_kline.low, previous_close)
 
     def calculate_atr(self, klines: List[Kline]) -> float:
         """
@@ -92,23 +91,35 @@ class ATRCalculator:
                 f"Insufficient kline data: {len(klines)} < {self.period + 1}"
             )
 
-        # True Range 계산
-        true_ranges = []
-        for i in range(1, len(klines)):
-            tr = self.calculate_true_range(klines[i], klines[i-1].close)
-            true_ranges.append(tr)
+        return self.calculate_atr_series(klines)[-1]
+
+    def calculate_atr_series(self, klines: List[Kline]) -> List[float]:
+        """
+        ATR 시계열 일괄 계산 (backfill용, O(n) 단일 pass)
+
+        series[j] = calculate_atr(klines[:period + 1 + j]) 와 동일 값
 
-        # ATR 계산 (EMA of True Range)
-        # 첫 번째 ATR = 첫 period개의 평균
-        first_atr = sum(true_ranges[:self.period]) / self.period
-        atr = first_atr
+        Args:
+            klines: Kline 데이터 리스트 (oldest first)
+
+        Returns:
+            List[float]: bar별 ATR (데이터 부족 시 빈 리스트)
+        """
+        state = ATRState(period=self.period, history_size=max(0, len(klines) - self.period))
+        state.backfill(klines)
+        return list(state.history)
+
+    def create_state(self, history_size: int = 100) -> "ATRState":
+        """
+        Streaming ATR state 생성 (period 동일)
 
-        # 나머지는 EMA 방식으로 계산
-        multiplier = 2.0 / (self.period + 1)
-        for i in range(self.period, len(true_ranges)):
-            atr = (true_ranges[i] * multiplier) + (atr * (1 - multiplier))
+        Args:
+            history_size: rolling ATR history 크기 (기본: 100)
 
-        return atr
+        Returns:
+            ATRState: 빈 state
+        """
+        return ATRState(period=self.period, history_size=history_size)
 
     def calculate_atr_percentile(
         self, current_atr: float, atr_history: List[float]
@@ -155,3 +166,192 @@ class ATRCalculator:
             multiplier = self.default_multiplier
 
         return atr * multiplier
+
+
+def _true_range(high: float, low: float, previous_close: float) -> float:
+    """TR = max(H-L, |H-PC|, |PC-L|)"""
+    high_low = high - low
+    high_prev_close = abs(high - previous_close)
+    prev_close_low = abs(previous_close - low)
+
+    return max(high_low, high_prev_close, prev_close_low)
+
+
+class ATRState:
+    """
+    Streaming ATR state
+
+    역할:
+    - 확정 bar 1개당 O(1) 갱신 (update) — EMA 상태를 refresh 간 유지
+    - 진행 중 bar는 상태 변경 없이 ATR만 계산 (peek)
+    - 확정 bar별 ATR을 rolling window(RollingPercentile)로 보관
+      → percentile rank O(log n), 임의 quantile 조회
+
+    calculate_atr와 동일한 정의:
+    - 첫 ATR = 첫 period개 TR의 평균
+    - 이후 ATR = TR * 2/(period+1) + ATR * (1 - 2/(period+1))
+    """
+
+    def __init__(self, period: int = 14, history_size: int = 100):
+        """
+        ATRState 초기화
+
+        Args:
+            period: ATR period (기본: 14)
+            history_size: rolling ATR history 크기 (기본: 100)
+        """
+        self.period = period
+        self._multiplier = 2.0 / (period + 1)
+        self._window = RollingPercentile(window=history_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """상태 초기화 (history 포함)"""
+        self._prev_close: Optional[float] = None
+        self._seed_true_ranges: List[float] = []
+        self._atr: Optional[float] = None
+        self.bar_count = 0
+        self._window.clear()
+
+    @property
+    def history(self) -> Deque[float]:
+        """확정 bar별 ATR (oldest first, 최대 history_size개)"""
+        return self._window.values
+
+    def percentile_rank(self, atr: float) -> float:
+        """
+        ATR percentile (history 대비, calculate_atr_percentile와 동일 정의)
+
+        Args:
+            atr: 조회 ATR (보통 진행 중 bar 포함 현재 ATR)
+
+        Returns:
+            float: Percentile (0~100, history 없으면 50.0)
+        """
+        return self._window.rank(atr)
+
+    def quantile(self, pct: float) -> float:
+        """
+        History 내 ATR quantile (nearest-rank)
+
+        Args:
+            pct: Percentile (0~100)
+
+        Returns:
+            float: ATR (history 없으면 0.0)
+        """
+        return self._window.quantile(pct)
+
+    @property
+    def atr(self) -> Optional[float]:
+        """마지막 확정 bar 기준 ATR (seed 미완료 시 None)"""
+        return self._atr
+
+    def _next_atr(self, tr: float) -> Optional[float]:
+        """현재 상태 + TR 1개 → 다음 ATR (상태 변경 없음)"""
+        if self._atr is None:
+            if len(self._seed_true_ranges) + 1 < self.period:
+                return None
+            return sum(self._seed_true_ranges + [tr]) / self.period
+        return (tr * self._multiplier) + (self._atr * (1 - self._multiplier))
+
+    def update(self, kline: Kline) -> Optional[float]:
+        """
+        확정 bar 반영 (O(1))
+
+        Args:
+            kline: 확정된 Kline (시간 순서대로)
+
+        Returns:
+            Optional[float]: 갱신된 ATR (seed 미완료 시 None)
+        """
+        return self.update_hlc(kline.high, kline.low, kline.close)
+
+    def update_hlc(self, high: float, low: float, close: float) -> Optional[float]:
+        """
+        확정 bar 반영 (high/low/close 직접 입력, O(1))
+
+        Args:
+            high: 고가
+            low: 저가
+            close: 종가
+
+        Returns:
+            Optional[float]: 갱신된 ATR (seed 미완료 시 None)
+        """
+        self.bar_count += 1
+        if self._prev_close is None:
+            self._prev_close = close
+            return None
+
+        tr = _true_range(high, low, self._prev_close)
+        self._prev_close = close
+
+        next_atr = self._next_atr(tr)
+        if next_atr is None:
+            self._seed_true_ranges.append(tr)
+            return None
+
+        self._seed_true_ranges.clear()
+        self._atr = next_atr
+        self._window.add(next_atr)
+        return next_atr
+
+    def peek(self, kline: Kline) -> Optional[float]:
+        """
+        진행 중 bar를 포함한 ATR (상태 변경 없음)
+
+        Args:
+            kline: 진행 중 Kline (마지막 확정 bar 다음)
+
+        Returns:
+            Optional[float]: ATR (seed 미완료 시 None)
+        """
+        return self.peek_hlc(kline.high, kline.low)
+
+    def peek_hlc(self, high: float, low: float) -> Optional[float]:
+        """
+        진행 중 bar를 포함한 ATR (high/low 직접 입력, 상태 변경 없음)
+
+        Args:
+            high: 진행 중 bar 고가
+            low: 진행 중 bar 저가
+
+        Returns:
+            Optional[float]: ATR (seed 미완료 시 None)
+        """
+        if self._prev_close is None:
+            return None
+        return self._next_atr(_true_range(high, low, self._prev_close))
+
+    def backfill(self, klines: Iterable[Kline]) -> Optional[float]:
+        """
+        확정 bar 일괄 반영 (backfill)
+
+        Args:
+            klines: 확정 Kline 목록 (oldest first)
+
+        Returns:
+            Optional[float]: 마지막 ATR
+        """
+        for kline in klines:
+            self.update(kline)
+        return self._atr
+
+    def backfill_arrays(
+        self, highs: Sequence[float], lows: Sequence[float], closes: Sequence[float]
+    ) -> Optional[float]:
+        """
+        확정 bar 일괄 반영 (columnar 입력, 예: KlineSeries numpy view)
+
+        Args:
+            highs: 고가 배열 (oldest first)
+            lows: 저가 배열
+            closes: 종가 배열
+
+        Returns:
+            Optional[float]: 마지막 ATR
+        """
+        for high, low, close in zip(highs, lows, closes):
+            self.update_hlc(float(high), float(low), float(close))
+        return self._atr
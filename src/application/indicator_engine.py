@@ -0,0 +1,156 @@
+"""
+src/application/indicator_engine.py
+Indicator Engine (lazy dependency graph + bar 단위 memoization)
+
+Purpose:
+- 지표(ATR, ATR percentile, MA slope, ...)가 입력(kline interval, 외부 값, 다른 지표)을 선언
+- 읽을 때만(get) 계산, 입력이 바뀐 경우에만 재계산 (같은 bar에서는 memoized 값 반환)
+- interval별 kline series를 공유 → 지표 추가 시 REST 조회/전체 재계산 증가 없음
+
+Design:
+- source: kline series (KlineStore.series(interval), version 속성 필요) / input(set_input 값)
+- node: compute(series, deps) → value
+  - memo key = (series.version, 의존 node/input stamp)
+  - key 변경 시에만 compute 실행, 결과 stamp 증가 → 하위 node 무효화
+- 의존 node는 먼저 등록되어야 함 (등록 순서 = 위상 정렬, cycle 불가)
+
+Exports:
+- IndicatorEngine: lazy indicator graph
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class _Node:
+    """등록된 지표 (memo 상태 포함)"""
+    name: str
+    compute: Callable[[Any, Dict[str, Any]], Any]
+    interval: Optional[str]
+    depends_on: Tuple[str, ...]
+    key: Optional[Tuple[Any, ...]] = None
+    value: Any = None
+    stamp: int = 0
+    compute_count: int = 0
+    default: Any = None
+
+
+class IndicatorEngine:
+    """
+    Lazy indicator dependency graph
+
+    역할:
+    - register(name, compute, interval, depends_on, default): 지표 등록
+    - set_input(name, value): 외부 입력 (mark price 등) 갱신
+    - get(name): 필요한 경우에만 재계산 후 값 반환
+    """
+
+    def __init__(self, kline_store: Any):
+        """
+        Args:
+            kline_store: interval → series 제공자 (series(interval) 메서드, series.version 필요)
+        """
+        self.kline_store = kline_store
+        self._nodes: Dict[str, _Node] = {}
+        self._inputs: Dict[str, Tuple[int, Any]] = {}
+
+    def register(
+        self,
+        name: str,
+        compute: Callable[[Any, Dict[str, Any]], Any],
+        interval: Optional[str] = None,
+        depends_on: Tuple[str, ...] = (),
+        default: Any = None,
+    ) -> None:
+        """
+        지표 등록
+
+        Args:
+            name: 지표 이름 (예: "atr")
+            compute: (series, deps) → value
+                (series는 interval 없으면 None, deps는 이름 → 값, 의존 지표 None은 default로 전달)
+            interval: 입력 kline interval (예: "60", 없으면 kline 비의존)
+            depends_on: 의존 지표/입력 이름 (지표는 먼저 등록되어 있어야 함)
+            default: compute가 None을 반환할 때 get이 돌려줄 값
+
+        Raises:
+            ValueError: 중복 이름 (이미 등록된 지표 / 먼저 등록된 지표가 input으로 선언한 이름)
+        """
+        if name in self._nodes or name in self._inputs:
+            raise ValueError(f"Indicator already registered: {name}")
+        for dep in depends_on:
+            if dep not in self._nodes and dep not in self._inputs:
+                # 아직 값이 없는 입력도 선언 가능하도록 input으로 예약
+                self._inputs[dep] = (0, None)
+        self._nodes[name] = _Node(
+            name=name,
+            compute=compute,
+            interval=interval,
+            depends_on=tuple(depends_on),
+            default=default,
+        )
+
+    def set_input(self, name: str, value: Any) -> None:
+        """
+        외부 입력 갱신 (값이 바뀐 경우에만 하위 지표 무효화)
+
+        Args:
+            name: 입력 이름 (예: "mark_price")
+            value: 입력 값
+
+        Raises:
+            ValueError: 지표 이름과 충돌
+        """
+        if name in self._nodes:
+            raise ValueError(f"{name} is an indicator, not an input")
+        stamp, current = self._inputs.get(name, (0, None))
+        if current != value or stamp == 0:
+            self._inputs[name] = (stamp + 1, value)
+
+    def _refresh(self, name: str) -> _Node:
+        """node 최신화 (입력 변경 시에만 compute)"""
+        node = self._nodes[name]
+        series = self.kline_store.series(node.interval) if node.interval is not None else None
+
+        dep_stamps = []
+        deps: Dict[str, Any] = {}
+        for dep in node.depends_on:
+            if dep in self._nodes:
+                dep_node = self._refresh(dep)
+                dep_stamps.append(dep_node.stamp)
+                deps[dep] = dep_node.default if dep_node.value is None else dep_node.value
+            else:
+                stamp, value = self._inputs[dep]
+                dep_stamps.append(stamp)
+                deps[dep] = value
+
+        key = (series.version if series is not None else None, tuple(dep_stamps))
+        if key != node.key:
+            value = node.compute(series, deps)
+            node.key = key
+            node.compute_count += 1
+            if value != node.value:
+                node.value = value
+                node.stamp += 1
+        return node
+
+    def get(self, name: str) -> Any:
+        """
+        지표 값 (필요 시 재계산)
+
+        Args:
+            name: 지표 이름
+
+        Returns:
+            Any: 지표 값 (None이면 등록 시 default)
+
+        Raises:
+            KeyError: 미등록 지표
+        """
+        node = self._refresh(name)
+        return node.default if node.value is None else node.value
+
+    def get_compute_counts(self) -> Dict[str, int]:
+        """지표별 compute 실행 횟수 (memoization 관측용)"""
+        return {name: node.compute_count for name, node in self._nodes.items()}
@@ -10,14 +10,17 @@ Design:
 - MA slope: SMA 기반 추세 강도 계산
 - Regime 분류: MA slope + ATR percentile 조합
 - Stateless calculator (입력 데이터 → 분류 결과)
+- RollingMA: 다중 period(20/50/200) rolling-sum SMA state
+  (bar당 O(1) 갱신, 진행 중 bar/tick 가격은 상태 변경 없이 peek → slope/acceleration)
 
 SSOT:
 - docs/plans/task_plan.md Phase 12a-2
 - docs/specs/account_builder_policy.md Section 11 (Entry Flow)
 """
 
+from collections import deque
 from dataclasses import dataclass
-from typing import List
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 @dataclass
@@ -35,6 +38,147 @@ class Kline:
     low: float = 0.0
 
 
+@dataclass
+class MAReading:
+    """
+    단일 period SMA 상태
+
+    Attributes:
+        period: SMA 기간
+        ma: 현재 SMA
+        slope_pct: MA slope (%, calculate_ma_slope와 동일 정의)
+        accel_pct: slope 변화량 (%p, 현재 slope - 1 bar 전 slope, 데이터 부족 시 0.0)
+    """
+    period: int
+    ma: float
+    slope_pct: float
+    accel_pct: float
+
+
+class RollingMA:
+    """
+    Rolling-sum SMA state (다중 period)
+
+    역할:
+    - update(close): 확정 bar 반영 (period별 running sum, O(1))
+    - peek(price): 진행 중 bar/tick 가격 포함 reading (상태 변경 없음)
+    - reading은 period+1개 이상 close가 있는 period만 포함
+
+    Running sum 부동소수 오차는 resum_interval bar마다 buffer 재합산으로 제한한다.
+    """
+
+    def __init__(self, periods: Iterable[int] = (20, 50, 200), resum_interval: int = 1000):
+        """
+        Args:
+            periods: SMA 기간 목록 (기본: 20/50/200)
+            resum_interval: running sum 재합산 주기 (bar, 기본: 1000)
+        """
+        self.periods: Tuple[int, ...] = tuple(sorted(set(periods)))
+        self.resum_interval = resum_interval
+        self._closes: Deque[float] = deque(maxlen=self.periods[-1] + 2)
+        self._sums: Dict[int, float] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """상태 초기화"""
+        self._closes.clear()
+        self._sums = {period: 0.0 for period in self.periods}
+        self._updates_since_resum = 0
+        self.bar_count = 0
+
+    def update(self, close: float) -> Dict[int, MAReading]:
+        """
+        확정 bar 반영 (O(period 수))
+
+        Args:
+            close: 확정 bar 종가 (시간 순서대로)
+
+        Returns:
+            Dict[int, MAReading]: period → reading (데이터 충분한 period만)
+        """
+        closes = self._closes
+        closes.append(close)
+        self.bar_count += 1
+        for period in self.periods:
+            self._sums[period] += close
+            if len(closes) > period:
+                self._sums[period] -= closes[-(period + 1)]
+
+        self._updates_since_resum += 1
+        if self._updates_since_resum >= self.resum_interval:
+            for period in self.periods:
+                self._sums[period] = sum(list(closes)[-period:])
+            self._updates_since_resum = 0
+
+        return self._readings(None)
+
+    def backfill(self, closes: Iterable[float]) -> Dict[int, MAReading]:
+        """
+        확정 bar 일괄 반영
+
+        Args:
+            closes: 종가 목록 (oldest first, numpy view 허용)
+
+        Returns:
+            Dict[int, MAReading]: 마지막 bar 기준 reading
+        """
+        for close in closes:
+            self.update(float(close))
+        return self._readings(None)
+
+    def peek(self, price: float) -> Dict[int, MAReading]:
+        """
+        진행 중 bar(또는 tick 가격)를 마지막 close로 간주한 reading (상태 변경 없음)
+
+        Args:
+            price: 진행 중 bar 종가 / 최신 체결가
+
+        Returns:
+            Dict[int, MAReading]: period → reading (데이터 충분한 period만)
+        """
+        return self._readings(price)
+
+    def _readings(self, extra: Optional[float]) -> Dict[int, MAReading]:
+        """확정 close (+ extra 가상 bar) 기준 period별 reading"""
+        closes = self._closes
+        count = len(closes) + (1 if extra is not None else 0)
+
+        def at(i: int) -> float:
+            """가상 series 음수 index 조회"""
+            if extra is None:
+                return closes[i]
+            return extra if i == -1 else closes[i + 1]
+
+        readings: Dict[int, MAReading] = {}
+        for period in self.periods:
+            if count < period + 1:
+                continue
+
+            window_sum = self._sums[period]
+            if extra is not None:
+                window_sum += extra - closes[-period]
+
+            previous_sum = window_sum - at(-1) + at(-(period + 1))
+            ma = window_sum / period
+            previous_ma = previous_sum / period
+            slope_pct = _slope_pct(ma, previous_ma)
+
+            accel_pct = 0.0
+            if count >= period + 2:
+                older_ma = (previous_sum - at(-2) + at(-(period + 2))) / period
+                accel_pct = slope_pct - _slope_pct(previous_ma, older_ma)
+
+            readings[period] = MAReading(period=period, ma=ma, slope_pct=slope_pct, accel_pct=accel_pct)
+        return readings
+
+
+def _slope_pct(current_ma: float, previous_ma: float) -> float:
+    """(current - previous) / previous * 100 (previous=0 → 0.0)"""
+    if previous_ma == 0:
+        return 0.0
+    return (current_ma - previous_ma) / previous_ma * 100.0
+
+
 class MarketRegimeAnalyzer:
     """
     Market Regime Analyzer — Kline → Regime classification
@@ -86,17 +230,34 @@ class MarketRegimeAnalyzer:
         Raises:
             ValueError: klines 데이터가 부족한 경우
         """
-        if len(klines) < self.ma_period:
+        return self.calculate_ma_slope_from_closes(
+            [kline.close for kline in klines[-(self.ma_period + 1):]]
+        )
+
+    def calculate_ma_slope_from_closes(self, closes: Sequence[float]) -> float:
+        """
+        MA slope 계산 (종가 배열 입력, 예: KlineSeries.close() numpy view)
+
+        Args:
+            closes: 종가 배열 (oldest first, 최소 ma_period개 필요)
+
+        Returns:
+            float: MA slope (%)
+
+        Raises:
+            ValueError: 데이터가 부족한 경우
+        """
+        if len(closes) < self.ma_period:
             raise ValueError(
-                f"Insufficient kline data: {len(klines)} < {self.ma_period}"
+                f"Insufficient kline data: {len(closes)} < {self.ma_period}"
             )
 
         # 현재 MA (최근 N개)
-        current_closes = [kline.close for kline in klines[-self.ma_period:]]
+        current_closes = closes[-self.ma_period:]
         current_ma = sum(current_closes) / len(current_closes)
 
         # 이전 MA (최근 N-1개, 1개 이전부터)
-        previous_closes = [kline.close for kline in klines[-(self.ma_period + 1):-1]]
+        previous_closes = closes[-(self.ma_period + 1):-1]
         previous_ma = sum(previous_closes) / len(previous_closes)
 
         # Slope 계산 (%)
@@ -105,7 +266,39 @@ class MarketRegimeAnalyzer:
 
         slope_pct = (current_ma - previous_ma) / previous_ma * 100.0
 
-        return slope_pct
+        return float(slope_pct)
+
+    def create_ma_state(self, periods: Iterable[int] = (20, 50, 200)) -> RollingMA:
+        """
+        Rolling SMA state 생성 (ma_period 항상 포함)
+
+        Args:
+            periods: 추가 SMA 기간 목록 (기본: 20/50/200)
+
+        Returns:
+            RollingMA: 빈 state
+        """
+        return RollingMA(periods=set(periods) | {self.ma_period})
+
+    def evaluate(
+        self,
+        readings: Dict[int, MAReading],
+        atr_percentile: float
+    ) -> Optional[str]:
+        """
+        RollingMA reading → regime 분류 (ma_period slope 사용)
+
+        Args:
+            readings: RollingMA.update/peek 결과
+            atr_percentile: ATR percentile (0~100)
+
+        Returns:
+            Optional[str]: Regime 분류 (ma_period reading 없으면 None)
+        """
+        reading = readings.get(self.ma_period)
+        if reading is None:
+            return None
+        return self.classify_regime(reading.slope_pct, atr_percentile)
 
     def classify_regime(
         self,
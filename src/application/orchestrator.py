@@ -84,6 +84,9 @@ class Orchestrator:
         - degraded/normal 분리, degraded 60s → halt
     """
 
+    # Pending order WS 체결 대기 timeout (초과 시 REST fallback)
+    PENDING_ORDER_WS_TIMEOUT_S = 10.0
+
     def __init__(
         self,
         market_data: MarketDataInterface,
@@ -341,6 +344,18 @@ class Orchestrator:
             current_timestamp=self.current_timestamp,
         )
 
+    def get_pending_order_deadline(self) -> Optional[float]:
+        """
+        Pending order WS timeout 시각 (REST fallback 시작 시각, TickScheduler wakeup용)
+
+        Returns:
+            Optional[float]: epoch seconds (pending order 없으면 None)
+        """
+        if (self.state not in [State.ENTRY_PENDING, State.EXIT_PENDING] or
+                self.pending_order is None or self.pending_order_timestamp is None):
+            return None
+        return self.pending_order_timestamp + self.PENDING_ORDER_WS_TIMEOUT_S
+
     def _process_events(self) -> None:
         """
         Events 처리 (FILL -> Position update)
@@ -351,7 +366,7 @@ class Orchestrator:
         from application.rest_fallback import check_pending_order_fallback, _NO_CHANGE
 
         # (1) REST API polling fallback (WebSocket timeout 시)
-        WEBSOCKET_TIMEOUT = 10.0
+        WEBSOCKET_TIMEOUT = self.PENDING_ORDER_WS_TIMEOUT_S
         skip_ws = False
         if (self.state in [State.ENTRY_PENDING, State.EXIT_PENDING] and
             self.pending_order is not None and
@@ -430,6 +445,21 @@ class Orchestrator:
             self.pending_order = None
             self.pending_order_timestamp = None
 
+    def _get_exchange_position_list(self) -> list:
+        """
+        거래소 실포지션 목록 (REST get_position result.list 구조)
+
+        Private WS position stream이 살아 있으면 adapter의 메모리 사본을 사용하고,
+        아니면 REST로 조회한다 (tick마다 REST 호출 방지).
+        """
+        if hasattr(self.market_data, "get_live_position"):
+            live_position = self.market_data.get_live_position()
+            if isinstance(live_position, dict):
+                return [live_position]
+
+        pos_resp = self.rest_client.get_position(category="linear", symbol="BTCUSDT")
+        return pos_resp.get("result", {}).get("list", [])
+
     def _manage_position(self) -> Optional[ExitIntent]:
         """
         Position 관리 (stop 갱신 + exit decision)
@@ -449,8 +479,7 @@ class Orchestrator:
         # 거래소 실포지션과 내부 상태 동기화 (레이스컨디션 방어)
         if self.rest_client is not None:
             try:
-                pos_resp = self.rest_client.get_position(category="linear", symbol="BTCUSDT")
-                plist = pos_resp.get("result", {}).get("list", [])
+                plist = self._get_exchange_position_list()
                 ex_size = float(plist[0].get("size", "0") or 0) if plist else 0.0
                 if ex_size == 0.0:
                     logger.warning("IN_POSITION but exchange size=0 -> sync to FLAT")
@@ -617,8 +646,7 @@ class Orchestrator:
                     # 거래소 기준 "제로 포지션"이면 stop 복구 실패로 누적하지 말고 상태 동기화
                     if "zero position" in err.lower() and self.rest_client is not None:
                         try:
-                            pos_resp = self.rest_client.get_position(category="linear", symbol="BTCUSDT")
-                            plist = pos_resp.get("result", {}).get("list", [])
+                            plist = self._get_exchange_position_list()
                             size = 0.0
                             if plist:
                                 size = float(plist[0].get("size", "0") or 0)
@@ -668,8 +696,7 @@ class Orchestrator:
         # 거래소 실포지션 재확인 (고스트 진입 방지)
         if self.rest_client is not None:
             try:
-                pos_resp = self.rest_client.get_position(category="linear", symbol="BTCUSDT")
-                plist = pos_resp.get("result", {}).get("list", [])
+                plist = self._get_exchange_position_list()
                 ex_size = float(plist[0].get("size", "0") or 0) if plist else 0.0
                 if ex_size > 0.0:
                     return {"blocked": True, "reason": "exchange_position_not_flat"}
@@ -0,0 +1,95 @@
+"""
+src/application/rolling_percentile.py
+Rolling Percentile (sliding window order statistics)
+
+Purpose:
+- 최근 N개 값에 대한 percentile rank / quantile 조회
+- ATR percentile (rolling 100-period) 매 bar 재정렬·선형 scan 제거
+
+Design:
+- 입력 순서 deque(maxlen 없음, 직접 evict) + 정렬 list 동시 유지
+- add: bisect insort + 가장 오래된 값 bisect 제거 (탐색 O(log n))
+- rank: bisect_left (O(log n)), quantile: 정렬 list index (O(1), nearest-rank)
+
+Exports:
+- RollingPercentile: sliding window percentile 구조
+"""
+
+import bisect
+import math
+from collections import deque
+from typing import Deque, List
+
+
+class RollingPercentile:
+    """
+    Sliding window percentile
+
+    역할:
+    - add(value): 값 추가 (window 초과 시 가장 오래된 값 evict)
+    - rank(value): window 내 value보다 작은 값 비율 (0~100)
+    - quantile(pct): window 내 pct percentile 값 (nearest-rank)
+    """
+
+    def __init__(self, window: int = 100):
+        """
+        Args:
+            window: Sliding window 크기 (기본: 100)
+        """
+        self.window = window
+        self.values: Deque[float] = deque()
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        self.values.clear()
+        self._sorted.clear()
+
+    def add(self, value: float) -> None:
+        """
+        값 추가 (window 초과 시 가장 오래된 값 evict)
+
+        Args:
+            value: 추가할 값
+        """
+        if self.window <= 0:
+            return
+        if len(self.values) >= self.window:
+            oldest = self.values.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self.values.append(value)
+        bisect.insort(self._sorted, value)
+
+    def rank(self, value: float) -> float:
+        """
+        Percentile rank (value보다 작은 값 비율)
+
+        ATRCalculator.calculate_atr_percentile와 동일 정의.
+
+        Args:
+            value: 조회 값
+
+        Returns:
+            float: Percentile (0~100, 값 없으면 50.0)
+        """
+        if not self._sorted:
+            return 50.0
+        return (bisect.bisect_left(self._sorted, value) / len(self._sorted)) * 100.0
+
+    def quantile(self, pct: float) -> float:
+        """
+        Window 내 pct percentile 값 (nearest-rank)
+
+        Args:
+            pct: Percentile (0~100, 예: 70.0)
+
+        Returns:
+            float: 값 (window 비어 있으면 0.0)
+        """
+        if not self._sorted:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * len(self._sorted)))
+        return self._sorted[min(rank, len(self._sorted)) - 1]
@@ -9,16 +9,24 @@ Purpose:
 Design:
 - UTC boundary 인식 (Daily/Weekly PnL)
 - Rolling window 기반 metrics (Fee, Slippage)
-- Stateless calculator (입력 데이터 → 메트릭 출력)
+- SessionRiskTracker: Stateless calculator (입력 데이터 → 메트릭 출력)
+- SessionRiskAggregator: 체결마다 O(1) 누적 (거래 수와 무관하게 주간 PnL 정확)
+  - UTC day / ISO week 경계에서 rollover, execId 중복 무시 (WS + REST gap-fill 중복)
+  - JSON checkpoint (tmp write + fsync + os.replace) → 재시작 후 누적값 복원
 
 SSOT:
 - docs/plans/task_plan.md Phase 12a-2
 - docs/specs/account_builder_policy.md Section 9 (Session Risk Policy)
 """
 
+import json
+import os
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import Callable, Deque, List, Dict, Any, Optional
 
 
 @dataclass
@@ -237,3 +245,239 @@ class SessionRiskTracker:
                 })
 
         return slippage_history
+
+
+def _utc_day_start(ts: float) -> float:
+    """ts가 속한 UTC 날짜 시작 (00:00:00 UTC, Unix seconds)"""
+    return ts - (ts % 86400.0)
+
+
+def _utc_week_start(ts: float) -> float:
+    """ts가 속한 ISO week 시작 (Monday 00:00:00 UTC, Unix seconds)"""
+    day_start = _utc_day_start(ts)
+    weekday = datetime.fromtimestamp(day_start, tz=timezone.utc).isoweekday()  # 1~7
+    return day_start - (weekday - 1) * 86400.0
+
+
+class SessionRiskAggregator:
+    """
+    Session Risk Aggregator — 체결 단위 증분 누적 (stateful)
+
+    역할:
+    - mark_execution(exec_id): 처음 보는 체결인지 판정 (WS + REST gap-fill 중복 방지)
+    - record_trade(closed_pnl, timestamp): Daily/Weekly PnL + Loss streak 누적
+    - record_fill(event, fee_rate): Fee ratio (actual / estimated) + Slippage 누적
+    - daily_pnl/weekly_pnl/loss_streak/fee_ratio_history/slippage_history: 조회 (UTC rollover 반영)
+    - checkpoint()/load(): JSON 파일로 누적 상태 저장/복원
+
+    규칙:
+    - 현재 day/week보다 과거 거래는 해당 구간 합계에만 반영 (이미 지난 구간은 무시)
+    - Loss streak은 가장 최근 거래 기준 (마지막 거래보다 과거 거래는 streak에 영향 없음)
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Optional[Path] = None,
+        fee_history_size: int = 100,
+        slippage_window_seconds: int = 600,
+        seen_exec_ids_size: int = 2000,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Args:
+            checkpoint_path: JSON checkpoint 경로 (None이면 저장/복원 안 함, 파일 있으면 복원)
+            fee_history_size: Fee ratio 히스토리 최대 길이
+            slippage_window_seconds: Slippage 히스토리 윈도우 (seconds, default: 600 = 10분)
+            seen_exec_ids_size: 중복 판정용 execId 보관 개수
+            clock: 현재 시각 함수 (기본: time.time)
+        """
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        self.slippage_window_seconds = slippage_window_seconds
+        self.clock = clock or time.time
+
+        self._day_start: float = 0.0
+        self._week_start: float = 0.0
+        self._daily_pnl: float = 0.0
+        self._weekly_pnl: float = 0.0
+        self._loss_streak: int = 0
+        self._last_trade_ts: float = 0.0
+        self._trade_count: int = 0
+        self._fee_ratios: Deque[float] = deque(maxlen=fee_history_size)
+        self._slippage: Deque[Dict[str, Any]] = deque()
+        self._seen_exec_ids: Deque[str] = deque(maxlen=seen_exec_ids_size)
+        self._seen_exec_id_set: set = set()
+
+        if self.checkpoint_path is not None and self.checkpoint_path.exists():
+            self.load()
+
+    @property
+    def trade_count(self) -> int:
+        """누적 반영된 거래 수 (checkpoint 포함)"""
+        return self._trade_count
+
+    def mark_execution(self, exec_id: Optional[str]) -> bool:
+        """
+        체결 ID 등록
+
+        Args:
+            exec_id: 체결 ID (빈 값이면 검사 안 함)
+
+        Returns:
+            bool: 처음 보는 체결이면 True (이미 반영된 execId면 False)
+        """
+        if not exec_id:
+            return True
+        if exec_id in self._seen_exec_id_set:
+            return False
+        if len(self._seen_exec_ids) == self._seen_exec_ids.maxlen:
+            self._seen_exec_id_set.discard(self._seen_exec_ids[0])
+        self._seen_exec_ids.append(exec_id)
+        self._seen_exec_id_set.add(exec_id)
+        return True
+
+    def _roll(self, now: float) -> None:
+        """UTC day/week 경계 통과 시 누적값 초기화"""
+        day_start = _utc_day_start(now)
+        if day_start > self._day_start:
+            self._day_start = day_start
+            self._daily_pnl = 0.0
+        week_start = _utc_week_start(now)
+        if week_start > self._week_start:
+            self._week_start = week_start
+            self._weekly_pnl = 0.0
+
+    def record_trade(self, closed_pnl: float, timestamp: float) -> None:
+        """
+        종료 거래 반영 (O(1))
+
+        Args:
+            closed_pnl: 종료된 PnL (USD)
+            timestamp: 거래 타임스탬프 (Unix timestamp, seconds)
+        """
+        self._roll(max(timestamp, self.clock()))
+        if timestamp >= self._day_start:
+            self._daily_pnl += closed_pnl
+        if timestamp >= self._week_start:
+            self._weekly_pnl += closed_pnl
+
+        if timestamp >= self._last_trade_ts:
+            self._loss_streak = self._loss_streak + 1 if closed_pnl < 0 else 0
+            self._last_trade_ts = timestamp
+        self._trade_count += 1
+
+    def record_fill(self, event: FillEvent, fee_rate: float) -> None:
+        """
+        체결 반영 (Fee ratio + Slippage)
+
+        Fee ratio = actual fee / (notional × fee_rate) (FLOW Section 6.2, 1.5 초과 = spike)
+        Slippage (USD) = (filled_price - expected_price) × 체결 수량 (notional / filled_price)
+        (expected_price 0이면 기록 안 함)
+
+        Args:
+            event: FillEvent (fee/notional 단위 USDT)
+            fee_rate: 예상 수수료율 (예: 0.00055 = taker)
+        """
+        estimated_fee = event.notional * fee_rate
+        if estimated_fee > 0:
+            self._fee_ratios.append(event.fee / estimated_fee)
+        if event.expected_price > 0 and event.filled_price > 0:
+            self._slippage.append({
+                "slippage_usd": (event.filled_price - event.expected_price) * event.notional / event.filled_price,
+                "timestamp": event.timestamp,
+            })
+        self._prune_slippage(self.clock())
+
+    def _prune_slippage(self, now: float) -> None:
+        window_start = now - self.slippage_window_seconds
+        while self._slippage and self._slippage[0]["timestamp"] < window_start:
+            self._slippage.popleft()
+
+    def daily_pnl(self, now: Optional[float] = None) -> float:
+        """당일 realized PnL (USD, UTC 날짜 기준)"""
+        self._roll(self.clock() if now is None else now)
+        return self._daily_pnl
+
+    def weekly_pnl(self, now: Optional[float] = None) -> float:
+        """주간 realized PnL (USD, ISO week 기준)"""
+        self._roll(self.clock() if now is None else now)
+        return self._weekly_pnl
+
+    def loss_streak(self) -> int:
+        """연속 손실 카운트 (가장 최근 거래부터)"""
+        return self._loss_streak
+
+    def fee_ratio_history(self) -> List[float]:
+        """Fee ratio 히스토리 (오래된 순, 마지막이 최신)"""
+        return list(self._fee_ratios)
+
+    def slippage_history(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Slippage 히스토리 (윈도우 내 이벤트만, 오래된 순)"""
+        self._prune_slippage(self.clock() if now is None else now)
+        return list(self._slippage)
+
+    # ========== Checkpoint ==========
+
+    def to_dict(self) -> Dict[str, Any]:
+        """누적 상태 → dict (checkpoint 형식)"""
+        return {
+            "day_start": self._day_start,
+            "week_start": self._week_start,
+            "daily_pnl": self._daily_pnl,
+            "weekly_pnl": self._weekly_pnl,
+            "loss_streak": self._loss_streak,
+            "last_trade_ts": self._last_trade_ts,
+            "trade_count": self._trade_count,
+            "fee_ratios": list(self._fee_ratios),
+            "slippage": list(self._slippage),
+            "seen_exec_ids": list(self._seen_exec_ids),
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """dict (to_dict 형식) → 누적 상태"""
+        self._day_start = float(state.get("day_start", 0.0))
+        self._week_start = float(state.get("week_start", 0.0))
+        self._daily_pnl = float(state.get("daily_pnl", 0.0))
+        self._weekly_pnl = float(state.get("weekly_pnl", 0.0))
+        self._loss_streak = int(state.get("loss_streak", 0))
+        self._last_trade_ts = float(state.get("last_trade_ts", 0.0))
+        self._trade_count = int(state.get("trade_count", 0))
+        self._fee_ratios.clear()
+        self._fee_ratios.extend(float(ratio) for ratio in state.get("fee_ratios", []))
+        self._slippage = deque(state.get("slippage", []))
+        self._seen_exec_ids.clear()
+        self._seen_exec_id_set.clear()
+        for exec_id in state.get("seen_exec_ids", []):
+            self.mark_execution(exec_id)
+
+    def checkpoint(self) -> None:
+        """
+        누적 상태 저장 (atomic: tmp write + fsync + os.replace)
+
+        checkpoint_path가 None이면 아무것도 하지 않음
+        """
+        if self.checkpoint_path is None:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def load(self) -> bool:
+        """
+        checkpoint 복원
+
+        Returns:
+            bool: 복원 성공 여부 (파일 없음/손상 시 False, 상태 유지)
+        """
+        if self.checkpoint_path is None:
+            return False
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        self.restore(state)
+        return True
@@ -0,0 +1,193 @@
+"""
+src/application/tick_scheduler.py
+Event-driven Tick Scheduler — 고정 1초 sleep 대신 이벤트 기반 run_tick wakeup
+
+Purpose:
+- WS execution event 도착 즉시 tick (FILL → state 전환 지연 ms 단위)
+- 가격이 threshold 이상 움직이면 tick (stop breach / grid signal 즉시 반응)
+- Pending order WS timeout 도달 시 tick (REST fallback 즉시 실행)
+- Heartbeat floor: 이벤트가 없어도 heartbeat_s마다 최소 1회 tick
+
+Design:
+- wait_for_events(timeout) (BybitWsClient/BoundedChannel)로 poll_s 단위 대기
+  → execution은 put 즉시 wakeup, 가격/timeout은 poll_s 해상도로 감지
+- wakeup 사유별 카운트 + tick duration 통계 (p50/p95/max)
+
+Exports:
+- TickScheduler: 이벤트 기반 tick scheduler
+- WAKEUP_REASONS: wakeup 사유 목록
+"""
+
+import math
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Any
+
+
+WAKEUP_REASONS = ("execution", "price_move", "pending_timeout", "heartbeat")
+
+
+class TickScheduler:
+    """
+    Event-driven Tick Scheduler
+
+    역할:
+    - wait_next(): 다음 tick까지 대기 → wakeup 사유 반환
+    - record_tick(duration_s): tick 실행 결과 기록
+    - get_metrics(): wakeup 사유별 카운트 + tick duration 통계
+    """
+
+    def __init__(
+        self,
+        wait_for_events: Callable[[float], bool],
+        get_price: Callable[[], float],
+        get_pending_deadline: Optional[Callable[[], Optional[float]]] = None,
+        heartbeat_s: float = 1.0,
+        poll_s: float = 0.05,
+        price_move_pct: float = 0.05,
+        clock: Optional[Callable[[], float]] = None,
+        wall_clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+        duration_window: int = 1000,
+    ):
+        """
+        Args:
+            wait_for_events: execution 도착까지 최대 timeout초 대기 → 도착 여부
+                (예: BybitWsClient.wait_for_events)
+            get_price: 현재 가격 (예: BybitAdapter.get_current_price)
+            get_pending_deadline: pending order WS timeout 시각 (epoch seconds, 없으면 None)
+                (예: Orchestrator.get_pending_order_deadline)
+            heartbeat_s: 최대 tick 간격 (초, 기본: 1.0)
+            poll_s: 가격/timeout 감지 해상도 (초, 기본: 0.05)
+            price_move_pct: 마지막 tick 가격 대비 wakeup threshold (%, 기본: 0.05)
+            clock: 대기 시간 측정용 monotonic clock (기본: time.monotonic)
+            wall_clock: pending deadline 비교용 epoch clock (기본: time.time)
+            sleep: 대기 함수 (기본: time.sleep, 미소비 이벤트가 남은 경우 spin 방지용)
+            duration_window: tick duration 통계 sample 수 (기본: 1000)
+        """
+        self.wait_for_events = wait_for_events
+        self.get_price = get_price
+        self.get_pending_deadline = get_pending_deadline
+        self.heartbeat_s = heartbeat_s
+        self.poll_s = poll_s
+        self.price_move_pct = price_move_pct
+        self.clock = clock or time.monotonic
+        self.wall_clock = wall_clock or time.time
+        self.sleep = sleep or time.sleep
+
+        self._last_tick_at: Optional[float] = None
+        self._last_tick_price: float = 0.0
+        self._last_pending_deadline_fired: Optional[float] = None
+        # tick이 이벤트를 소비하지 않고 끝난 경우 (예: entry cooldown early return)
+        # → 다음 heartbeat까지 execution wakeup 대신 poll sleep (busy loop 방지)
+        self._events_left_after_tick = False
+
+        self._wakeup_counts: Dict[str, int] = {reason: 0 for reason in WAKEUP_REASONS}
+        self._durations: Deque[float] = deque(maxlen=duration_window)
+
+    def _price_moved(self) -> bool:
+        """마지막 tick 가격 대비 price_move_pct 이상 변동 여부"""
+        if self._last_tick_price <= 0:
+            return False
+        price = self.get_price()
+        if price <= 0:
+            return False
+        move_pct = abs(price - self._last_tick_price) / self._last_tick_price * 100.0
+        return move_pct >= self.price_move_pct
+
+    def _pending_timed_out(self) -> bool:
+        """Pending order WS timeout 도달 여부 (deadline당 1회만 wakeup)"""
+        if self.get_pending_deadline is None:
+            return False
+        deadline = self.get_pending_deadline()
+        if deadline is None or deadline == self._last_pending_deadline_fired:
+            return False
+        if self.wall_clock() >= deadline:
+            self._last_pending_deadline_fired = deadline
+            return True
+        return False
+
+    def wait_next(self) -> str:
+        """
+        다음 tick까지 대기
+
+        Returns:
+            str: wakeup 사유 ("execution" | "price_move" | "pending_timeout" | "heartbeat")
+                첫 호출은 즉시 "heartbeat"
+        """
+        if self._last_tick_at is None:
+            return self._wakeup("heartbeat")
+
+        heartbeat_at = self._last_tick_at + self.heartbeat_s
+        while True:
+            if self._pending_timed_out():
+                return self._wakeup("pending_timeout")
+            if self._price_moved():
+                return self._wakeup("price_move")
+
+            remaining = heartbeat_at - self.clock()
+            if remaining <= 0:
+                return self._wakeup("heartbeat")
+
+            if self._events_left_after_tick:
+                self.sleep(min(self.poll_s, remaining))
+            elif self.wait_for_events(min(self.poll_s, remaining)):
+                return self._wakeup("execution")
+
+    def _wakeup(self, reason: str) -> str:
+        """wakeup 사유 카운트"""
+        self._wakeup_counts[reason] += 1
+        return reason
+
+    def record_tick(self, duration_s: float) -> None:
+        """
+        Tick 실행 기록 (다음 heartbeat/가격 기준점 갱신)
+
+        Args:
+            duration_s: run_tick 실행 시간 (초)
+        """
+        self._last_tick_at = self.clock()
+        self._last_tick_price = self.get_price()
+        self._events_left_after_tick = self.wait_for_events(0.0)
+        self._durations.append(duration_s)
+
+    def run_once(self, tick: Callable[[], Any]) -> Any:
+        """
+        wait_next() → tick() → record_tick() (편의 메서드)
+
+        Args:
+            tick: tick 함수 (예: Orchestrator.run_tick)
+
+        Returns:
+            Any: tick() 반환값
+        """
+        self.wait_next()
+        started = self.clock()
+        try:
+            return tick()
+        finally:
+            self.record_tick(self.clock() - started)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Scheduler metrics
+
+        Returns:
+            Dict: {"wakeups": {reason: count}, "tick_duration_s": {"count", "p50", "p95", "max"}}
+        """
+        ordered = sorted(self._durations)
+
+        def nearest_rank(pct: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[max(1, math.ceil(pct / 100.0 * len(ordered))) - 1]
+
+        return {
+            "wakeups": dict(self._wakeup_counts),
+            "tick_duration_s": {
+                "count": len(ordered),
+                "p50": nearest_rank(50.0),
+                "p95": nearest_rank(95.0),
+                "max": ordered[-1] if ordered else 0.0,
+            },
+        }
@@ -0,0 +1,192 @@
+"""
+src/application/vectorized_indicators.py
+Vectorized Indicators (numpy 배열 입력, 장기 history 일괄 계산)
+
+Purpose:
+- 수개월~수년 kline으로 지표 시계열 일괄 계산 (T_TREND / F_EXTREME 등 threshold calibration)
+- 실시간 경로(ATRState / RollingPercentile / MarketRegimeAnalyzer)와 bit 단위 동일 결과
+
+Design:
+- true_range: numpy elementwise (H-L, |H-PC|, |PC-L| 최대값)
+- atr_series: seed(첫 period개 TR 평균)만 순차 합, 이후 EMA/Wilder 재귀는 float list 단일 pass
+  (재귀식은 벡터화 시 반올림 순서가 달라짐 → scalar와 동일 연산 순서 유지)
+- rolling_percentile_rank: sliding window 비교 count (chunk 단위, 메모리 상한)
+- sma_slope_series: window 합을 열 단위 누적(왼쪽→오른쪽 순차 합과 동일 반올림) → slope(%)
+
+동일성 기준:
+- atr_series(smoothing="ema") == ATRCalculator.calculate_atr_series
+- rolling_percentile_rank == RollingPercentile.add → rank (같은 값)
+- sma_slope_series[i] == MarketRegimeAnalyzer.calculate_ma_slope_from_closes(closes[:i + 1])
+
+Exports:
+- true_range, atr_series, rolling_percentile_rank, sma_series, sma_slope_series
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+# rolling_percentile_rank 비교 행렬 chunk 크기 (행 수)
+_RANK_CHUNK_ROWS = 65536
+
+
+def true_range(high: Sequence[float], low: Sequence[float], close: Sequence[float]) -> np.ndarray:
+    """
+    True Range 시계열
+
+    TR[i] = max(H-L, |H-PC|, |PC-L|) (PC = close[i-1]), TR[0] = NaN (이전 종가 없음)
+
+    Args:
+        high: 고가 배열 (oldest first)
+        low: 저가 배열
+        close: 종가 배열
+
+    Returns:
+        np.ndarray: TR (float64, 길이 n)
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    tr = np.full(len(close), np.nan)
+    if len(close) < 2:
+        return tr
+    previous_close = close[:-1]
+    tr[1:] = np.maximum(
+        np.maximum(high[1:] - low[1:], np.abs(high[1:] - previous_close)),
+        np.abs(previous_close - low[1:]),
+    )
+    return tr
+
+
+def atr_series(
+    high: Sequence[float],
+    low: Sequence[float],
+    close: Sequence[float],
+    period: int = 14,
+    smoothing: str = "ema",
+) -> np.ndarray:
+    """
+    ATR 시계열 (bar index 정렬)
+
+    - 첫 ATR (bar index = period) = TR[1..period] 평균
+    - 이후 ATR = TR * alpha + ATR * (1 - alpha)
+      (ema: alpha = 2/(period+1), ATRState와 동일 / wilder: alpha = 1/period)
+
+    Args:
+        high: 고가 배열 (oldest first)
+        low: 저가 배열
+        close: 종가 배열
+        period: ATR period (기본: 14)
+        smoothing: "ema" | "wilder"
+
+    Returns:
+        np.ndarray: ATR (float64, 길이 n, seed 이전은 NaN)
+            atr[period:] == ATRCalculator(period).calculate_atr_series(klines)
+
+    Raises:
+        ValueError: 알 수 없는 smoothing
+    """
+    if smoothing == "ema":
+        alpha = 2.0 / (period + 1)
+    elif smoothing == "wilder":
+        alpha = 1.0 / period
+    else:
+        raise ValueError(f"Unknown smoothing: {smoothing}")
+
+    tr = true_range(high, low, close)
+    atr = np.full(len(tr), np.nan)
+    if len(tr) < period + 1:
+        return atr
+
+    tr_values = tr.tolist()
+    current = sum(tr_values[1:period + 1]) / period
+    values = [current]
+    keep = 1 - alpha
+    for value in tr_values[period + 1:]:
+        current = (value * alpha) + (current * keep)
+        values.append(current)
+    atr[period:] = values
+    return atr
+
+
+def rolling_percentile_rank(values: Sequence[float], window: int = 100) -> np.ndarray:
+    """
+    Rolling percentile rank 시계열
+
+    rank[i] = values[max(0, i-window+1) .. i] 중 values[i]보다 작은 값 비율 × 100
+    (RollingPercentile에 values[i]를 add한 직후 rank(values[i])와 동일)
+
+    Args:
+        values: 유한값 배열 (NaN 불가, 예: atr[period:])
+        window: Sliding window 크기 (기본: 100)
+
+    Returns:
+        np.ndarray: Percentile (0~100, float64, 길이 n)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    ranks = np.empty(n)
+    if n == 0:
+        return ranks
+
+    # 앞쪽 부분 window는 +inf로 채움 → 비교 count에 포함되지 않음
+    padded = np.concatenate([np.full(window - 1, np.inf), values])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+    lengths = np.minimum(np.arange(1, n + 1), window).astype(np.float64)
+    for lo in range(0, n, _RANK_CHUNK_ROWS):
+        hi = min(lo + _RANK_CHUNK_ROWS, n)
+        below = (windows[lo:hi] < values[lo:hi, None]).sum(axis=1)
+        ranks[lo:hi] = (below / lengths[lo:hi]) * 100.0
+    return ranks
+
+
+def sma_series(closes: Sequence[float], period: int) -> np.ndarray:
+    """
+    SMA 시계열 (window 합을 oldest부터 순차 누적 → scalar sum()과 동일 반올림)
+
+    Args:
+        closes: 종가 배열 (oldest first)
+        period: SMA 기간
+
+    Returns:
+        np.ndarray: SMA (float64, 길이 n, 처음 period-1개는 NaN)
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    sma = np.full(len(closes), np.nan)
+    if len(closes) < period:
+        return sma
+
+    windows = np.lib.stride_tricks.sliding_window_view(closes, period)
+    sums = np.zeros(len(windows))
+    for k in range(period):
+        sums += windows[:, k]
+    sma[period - 1:] = sums / period
+    return sma
+
+
+def sma_slope_series(closes: Sequence[float], period: int = 20) -> np.ndarray:
+    """
+    MA slope 시계열 (%)
+
+    slope[i] = (SMA[i] - SMA[i-1]) / SMA[i-1] × 100 (SMA[i-1] = 0 → 0.0)
+
+    Args:
+        closes: 종가 배열 (oldest first)
+        period: SMA 기간 (기본: 20)
+
+    Returns:
+        np.ndarray: slope (%, float64, 길이 n, 처음 period개는 NaN)
+            slope[i] == MarketRegimeAnalyzer(ma_period=period).calculate_ma_slope_from_closes(closes[:i + 1])
+    """
+    sma = sma_series(closes, period)
+    slope = np.full(len(sma), np.nan)
+    if len(sma) < period + 1:
+        return slope
+
+    current = sma[period:]
+    previous = sma[period - 1:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = (current - previous) / previous * 100.0
+    slope[period:] = np.where(previous == 0, 0.0, values)
+    return slope
@@ -8,6 +8,11 @@ Purpose:
 
 Design:
 - BybitRestClient + BybitWsClient를 사용
+- BybitPublicWsClient(tickers/kline stream) 콜백으로 캐시 갱신, REST polling은 fallback
+- Private stream(position/wallet/order) 콜백으로 계정 상태 갱신 (REST는 저빈도 resync)
+- Kline은 누락 tail만 REST 조회 (get_kline start), KlineDiskCache 주입 시 시작 시 디스크에서 즉시 적재
+- Session risk(Daily/Weekly PnL, loss streak, fee, slippage)는 체결마다 증분 누적 + checkpoint
+  (execution list REST 조회는 시작 시 1회 seed만, ExecutionHistorySync 주입 시 로컬 캐시 기반)
 - MarketDataInterface Protocol 구현
 - 상태 캐싱 (mark_price, equity, position 등)
 
@@ -18,15 +23,23 @@ SSOT:
 
 import time
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
+
+import numpy as np
 
 from infrastructure.exchange.bybit_rest_client import BybitRestClient, RateLimitError
+from infrastructure.exchange.bybit_async_rest_client import AsyncBybitRestClient
 from infrastructure.exchange.bybit_ws_client import BybitWsClient
+from infrastructure.exchange.execution_sync import ExecutionHistorySync
+from infrastructure.exchange.kline_cache import KlineDiskCache
+from infrastructure.exchange.kline_store import KlineSeries, KlineStore
+from infrastructure.exchange.price_history import PriceHistory
 from domain.events import ExecutionEvent, EventType
-from application.atr_calculator import ATRCalculator, Kline as ATRKline
-from application.session_risk_tracker import SessionRiskTracker, Trade, FillEvent
-from application.market_regime import MarketRegimeAnalyzer, Kline as RegimeKline
+from application.atr_calculator import ATRCalculator
+from application.indicator_engine import IndicatorEngine
+from application.session_risk_tracker import SessionRiskAggregator, SessionRiskTracker, FillEvent
+from application.market_regime import MarketRegimeAnalyzer, MAReading
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +54,42 @@ class BybitAdapter:
     - MarketDataInterface 모든 메서드 구현 (캐싱)
     """
 
+    # 지표(ATR/Regime) kline 간격 + 캐시 크기 (REST get_kline interval/limit과 동일)
+    _KLINE_INTERVAL = "60"
+    _KLINE_CACHE_SIZE = 200
+
+    # 조회 이름 → (REST 메서드, kwargs). 반영 순서 = 정의 순서
+    _REFRESH_CALLS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+        "tickers": ("get_tickers", {"category": "linear", "symbol": "BTCUSDT"}),
+        "wallet": ("get_wallet_balance", {"accountType": "UNIFIED"}),
+        "position": ("get_position", {"category": "linear", "symbol": "BTCUSDT"}),
+        "executions": ("get_execution_list", {"category": "linear", "symbol": "BTCUSDT", "limit": 50}),
+        "kline": ("get_kline", {
+            "category": "linear", "symbol": "BTCUSDT", "interval": _KLINE_INTERVAL, "limit": _KLINE_CACHE_SIZE,
+        }),
+    }
+
+    # 예상 수수료율 (Linear USDT, fee ratio = actual / estimated 계산용)
+    _MAKER_FEE_RATE = 0.0002
+    _TAKER_FEE_RATE = 0.00055
+
+    # Private stream 연결 중 wallet/position REST resync 주기 (초)
+    _PRIVATE_STREAM_RESYNC_S = 300.0
+
+    # 주문 종료 상태 (order topic orderStatus) → open order 캐시에서 제거
+    _TERMINAL_ORDER_STATUSES = frozenset({
+        "Filled", "Cancelled", "PartiallyFilledCanceled", "Rejected", "Deactivated",
+    })
+
     def __init__(
         self,
         rest_client: BybitRestClient,
         ws_client: BybitWsClient,
         testnet: bool = True,
+        async_rest_client: Optional[AsyncBybitRestClient] = None,
+        session_risk_checkpoint_path: Optional[Path] = None,
+        execution_sync: Optional[ExecutionHistorySync] = None,
+        kline_cache: Optional[KlineDiskCache] = None,
     ):
         """
         BybitAdapter 초기화
@@ -54,14 +98,22 @@ class BybitAdapter:
             rest_client: Bybit REST client
             ws_client: Bybit WebSocket client
             testnet: Testnet 여부 (default: True)
+            async_rest_client: Async REST client (주입 시 update_market_data 조회 동시 fan-out)
+            session_risk_checkpoint_path: Session risk 누적 상태 JSON 경로 (None이면 메모리만 유지)
+            execution_sync: Execution history 로컬 캐시 sync (주입 시 seed/gap-fill을 캐시 기반으로 수행)
+            kline_cache: Kline 디스크 캐시 (주입 시 시작 시 적재 + kline refresh마다 저장)
         """
         self.rest_client = rest_client
         self.ws_client = ws_client
         self.testnet = testnet
+        self.async_rest_client = async_rest_client
+        self.execution_sync = execution_sync
+        self.kline_cache = kline_cache
 
         # Market Data Provider 컴포넌트 (Phase 12a-2 통합)
         self.atr_calculator = ATRCalculator(period=14, default_multiplier=0.5)
         self.session_risk_tracker = SessionRiskTracker()
+        self.session_risk = SessionRiskAggregator(checkpoint_path=session_risk_checkpoint_path)
         self.market_regime_analyzer = MarketRegimeAnalyzer(
             ma_period=20,
             trend_threshold_pct=0.2,
@@ -70,18 +122,34 @@ class BybitAdapter:
 
         # 상태 캐싱
         self._mark_price: float = 0.0
+        self._price_history = PriceHistory(window_s=900.0, resolution_s=1.0)  # price_drop_1m/5m
         self._equity_usdt: float = 0.0  # Linear USDT-Margined equity
         self._available_usdt: float = 0.0  # FIX: Available balance
         self._last_update_ts: float = 0.0
 
-        # REST 호출 분산/백오프 (Bybit rate limit 대응)
-        self._next_rest_retry_ts: float = 0.0
+        # REST 호출 분산/백오프 (Bybit rate limit 대응, 조회별 backoff)
+        self._refresh_retry_ts: Dict[str, float] = {}
         self._last_ticker_refresh_ts: float = 0.0
         self._last_wallet_refresh_ts: float = 0.0
         self._last_position_refresh_ts: float = 0.0
-        self._last_execution_refresh_ts: float = 0.0
         self._last_kline_refresh_ts: float = 0.0
 
+        # Kline 캐시 (interval별 columnar ring buffer) — REST seed + public stream 병합
+        self._kline_store = KlineStore(capacity=self._KLINE_CACHE_SIZE)
+        self._klines = self._kline_store.series(self._KLINE_INTERVAL)
+        if kline_cache is not None:
+            loaded = kline_cache.load(self._klines, "BTCUSDT")
+            logger.info(f"Kline cache loaded: {loaded} bars (interval={self._KLINE_INTERVAL})")
+
+        # Streaming ATR / rolling SMA (확정 bar만 반영, 진행 중 bar·tick 가격은 peek) — refresh 간 상태 유지
+        self._atr_state = self.atr_calculator.create_state(history_size=100)
+        self._ma_state = self.market_regime_analyzer.create_ma_state(periods=(20, 50, 200))
+        self._kline_committed_start: Optional[int] = None
+
+        # 지표 graph (getter 호출 시 lazy 계산, 같은 bar/입력이면 memoized)
+        self.indicators = IndicatorEngine(self._kline_store)
+        self._register_indicators()
+
         # WS health tracking
         self._ws_last_heartbeat_ts: float = time.time()
         self._ws_event_drop_count: int = 0
@@ -90,25 +158,21 @@ class BybitAdapter:
 
         # Position tracking
         self._current_position: Optional[Dict[str, Any]] = None
+        self._open_orders: Dict[str, Dict[str, Any]] = {}  # orderId → order (order topic)
         self._last_fill_price: Optional[float] = None
 
-        # Session Risk tracking
-        self._daily_realized_pnl_usd: Optional[float] = None
-        self._weekly_realized_pnl_usd: Optional[float] = None
-        self._loss_streak_count: Optional[int] = None
+        # Session Risk tracking (checkpoint 복원 전/seed 전에는 None 반환)
+        self._session_risk_ready: bool = self.session_risk.trade_count > 0
+        self._session_risk_seeded: bool = False
         self._trades_today: int = 0
 
         # Entry Flow tracking
-        self._atr: Optional[float] = None
-        self._atr_pct_24h: float = 0.0
         self._winrate: float = 0.5
         self._position_mode: str = "MergedSingle"
 
         # Trade Log tracking (Phase 11b)
         self._funding_rate: float = 0.0001
         self._index_price: float = 0.0
-        self._ma_slope_pct: float = 0.0
-        self._atr_percentile: float = 50.0
         self._exchange_server_time_offset_ms: float = 0.0
 
         logger.info(f"BybitAdapter initialized (testnet={testnet})")
@@ -127,10 +191,21 @@ class BybitAdapter:
         """가용 잔고 (USDT 단위)"""
         return self._available_usdt
 
+    def get_price_drop_1m(self) -> float:
+        """1분 가격 변화율 ((현재 - 1분 전) / 1분 전, mark price history 기준)"""
+        return self._price_history.return_over(60.0)
+
+    def get_price_drop_5m(self) -> float:
+        """5분 가격 변화율 ((현재 - 5분 전) / 5분 전, mark price history 기준)"""
+        return self._price_history.return_over(300.0)
+
     def get_rest_latency_p95_1m(self) -> float:
-        """REST API latency p95 (1분 윈도우, seconds)"""
-        # TODO: REST client의 latency tracker에서 가져오기
-        return 0.15  # Temporary default
+        """REST API latency p95 (1분 윈도우, seconds, sample 없으면 0.0)"""
+        return self.rest_client.latency_tracker.get_percentile(95.0)
+
+    def get_rest_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Endpoint별/전체 REST latency p50/p95/p99 (1분 윈도우, 모니터링용)"""
+        return self.rest_client.get_latency_stats()
 
     def get_ws_last_heartbeat_ts(self) -> float:
         """WebSocket 마지막 heartbeat timestamp"""
@@ -152,25 +227,33 @@ class BybitAdapter:
 
     def get_daily_realized_pnl_usd(self) -> Optional[float]:
         """당일 realized PnL (USD 단위)"""
-        return self._daily_realized_pnl_usd
+        if not self._session_risk_ready:
+            return None
+        return self.session_risk.daily_pnl()
 
     def get_weekly_realized_pnl_usd(self) -> Optional[float]:
         """주간 realized PnL (USD 단위)"""
-        return self._weekly_realized_pnl_usd
+        if not self._session_risk_ready:
+            return None
+        return self.session_risk.weekly_pnl()
 
     def get_loss_streak_count(self) -> Optional[int]:
         """연속 손실 카운트"""
-        return self._loss_streak_count
+        if not self._session_risk_ready:
+            return None
+        return self.session_risk.loss_streak()
 
     def get_fee_ratio_history(self) -> Optional[List[float]]:
-        """Fee ratio 히스토리 (최근 순서)"""
-        # TODO: Trade history에서 fee ratio 계산
-        return None
+        """Fee ratio 히스토리 (actual / estimated, 마지막이 최신)"""
+        if not self._session_risk_ready:
+            return None
+        return self.session_risk.fee_ratio_history()
 
     def get_slippage_history(self) -> Optional[List[Dict[str, Any]]]:
-        """Slippage 히스토리 (시간 윈도우 내)"""
-        # TODO: Trade history에서 slippage 계산
-        return None
+        """Slippage 히스토리 (시간 윈도우 내, filled - mark price)"""
+        if not self._session_risk_ready:
+            return None
+        return self.session_risk.slippage_history()
 
     def is_degraded_timeout(self) -> bool:
         """DEGRADED 모드 60초 timeout 여부"""
@@ -192,7 +275,7 @@ class BybitAdapter:
 
     def get_atr(self) -> Optional[float]:
         """ATR (Average True Range) 값"""
-        return self._atr
+        return self.indicators.get("atr")
 
     def get_last_fill_price(self) -> Optional[float]:
         """마지막 체결 가격 (Grid 기준점)"""
@@ -204,7 +287,8 @@ class BybitAdapter:
 
     def get_atr_pct_24h(self) -> float:
         """24시간 ATR (pct)"""
-        return self._atr_pct_24h
+        self.indicators.set_input("mark_price", self._mark_price)
+        return self.indicators.get("atr_pct_24h")
 
     def get_winrate(self) -> float:
         """현재 winrate (0.0~1.0)"""
@@ -233,11 +317,11 @@ class BybitAdapter:
 
     def get_ma_slope_pct(self) -> float:
         """MA slope (%) - market_regime 계산용"""
-        return self._ma_slope_pct
+        return self.indicators.get("ma_slope_pct")
 
     def get_atr_percentile(self) -> float:
         """ATR percentile (0-100) - market_regime 계산용"""
-        return self._atr_percentile
+        return self.indicators.get("atr_percentile")
 
     def get_exchange_server_time_offset_ms(self) -> float:
         """거래소 서버 시간 오프셋 (ms)"""
@@ -252,124 +336,427 @@ class BybitAdapter:
         호출은 외부 루프(현재 30초)에서 오지만, 엔드포인트별로 추가 분산한다.
         - tickers: 10초
         - wallet/position: 30초
-        - execution list: 60초
-        - kline(ATR/Regime): 120초
+        - execution list: 시작 시 1회 (session risk seed, 이후 WS 체결로 증분 누적)
+        - kline(ATR/Regime): 120초 (캐시 마지막 bar 이후 tail만 조회)
+
+        async_rest_client가 주입되면 due 상태인 조회를 동시에 fan-out한다
+        (round trip 1회 비용). 결과 반영 순서는 순차 버전과 동일하다.
+
+        RateLimitError는 해당 조회만 retry_after 동안 보류한다
+        (다른 endpoint group의 조회는 계속 갱신).
         """
         now = time.time()
 
-        # Rate limit 백오프 윈도우 중에는 즉시 반환
-        if now < self._next_rest_retry_ts:
-            return
-
         try:
-            # 1) Mark/Index/Funding (상대적으로 자주)
-            if now - self._last_ticker_refresh_ts >= 10.0 or self._mark_price <= 0:
-                tickers_response = self.rest_client.get_tickers(category="linear", symbol="BTCUSDT")
-                result = tickers_response.get("result", {})
-                ticker_list = result.get("list", [])
-                if ticker_list:
-                    ticker = ticker_list[0]
-                    self._mark_price = float(ticker.get("markPrice", 0.0))
-                    self._index_price = float(ticker.get("indexPrice", 0.0))
-                    self._funding_rate = float(ticker.get("fundingRate", 0.0001))
-                self._last_ticker_refresh_ts = now
-
-            # 2) Equity + Position (중간 빈도)
-            if now - self._last_wallet_refresh_ts >= 30.0 or self._equity_usdt <= 0:
-                wallet_response = self.rest_client.get_wallet_balance(accountType="UNIFIED")
-                result = wallet_response.get("result", {})
-                wallet_list = result.get("list", [])
-                if wallet_list:
-                    wallet_data = wallet_list[0]
-                    self._equity_usdt = float(wallet_data.get("totalEquity", 0.0))
-                    avail_str = wallet_data.get("totalAvailableBalance", "")
-                    if avail_str and avail_str.strip():
-                        self._available_usdt = float(avail_str)
-                    else:
-                        self._available_usdt = float(wallet_data.get("totalEquity", 0.0))
-                self._last_wallet_refresh_ts = now
-
-            if now - self._last_position_refresh_ts >= 30.0 or self._current_position is None:
-                position_response = self.rest_client.get_position(category="linear", symbol="BTCUSDT")
-                result = position_response.get("result", {})
-                position_list = result.get("list", [])
-                if position_list:
-                    self._current_position = position_list[0]
-                self._last_position_refresh_ts = now
-
-            # 3) Trade history/PnL (저빈도)
-            if now - self._last_execution_refresh_ts >= 60.0:
-                execution_response = self.rest_client.get_execution_list(category="linear", symbol="BTCUSDT", limit=50)
-                result = execution_response.get("result", {})
-                trade_list = result.get("list", [])
-
-                if trade_list:
-                    latest_exec = trade_list[0]
-                    exec_price_str = latest_exec.get("execPrice")
-                    if exec_price_str:
-                        self._last_fill_price = float(exec_price_str)
-
-                trades = []
-                for trade_data in trade_list:
-                    closed_pnl = trade_data.get("closedPnl")
-                    exec_time = trade_data.get("execTime")
-                    if closed_pnl is not None and exec_time is not None:
-                        timestamp = float(exec_time) / 1000.0
-                        trades.append(Trade(closed_pnl=float(closed_pnl), timestamp=timestamp))
-
-                current_date = datetime.now(timezone.utc)
-                self._daily_realized_pnl_usd = self.session_risk_tracker.track_daily_pnl(trades, current_date)
-                self._weekly_realized_pnl_usd = self.session_risk_tracker.track_weekly_pnl(trades, current_date)
-                self._loss_streak_count = self.session_risk_tracker.calculate_loss_streak(trades)
-                self._last_execution_refresh_ts = now
-
-            # 4) Kline/ATR/Regime (가장 저빈도)
-            if now - self._last_kline_refresh_ts >= 120.0 or self._atr is None:
-                kline_response = self.rest_client.get_kline(
-                    category="linear",
-                    symbol="BTCUSDT",
-                    interval="60",
-                    limit=200
-                )
-                result = kline_response.get("result", {})
-                kline_list = result.get("list", [])
-
-                if kline_list and len(kline_list) >= 20:
-                    klines_atr = []
-                    klines_regime = []
-                    for kline_data in reversed(kline_list):
-                        high = float(kline_data[2])
-                        low = float(kline_data[3])
-                        close = float(kline_data[4])
-                        klines_atr.append(ATRKline(high=high, low=low, close=close))
-                        klines_regime.append(RegimeKline(close=close, high=high, low=low))
-
-                    if len(klines_atr) >= 15:
-                        self._atr = self.atr_calculator.calculate_atr(klines_atr)
-                        if self._mark_price > 0:
-                            self._atr_pct_24h = (self._atr / self._mark_price) * 100.0
-
-                        atr_history = []
-                        for i in range(max(15, len(klines_atr) - 100), len(klines_atr)):
-                            if i >= 15:
-                                atr_history.append(self.atr_calculator.calculate_atr(klines_atr[:i]))
-                        if atr_history:
-                            self._atr_percentile = self.atr_calculator.calculate_atr_percentile(self._atr, atr_history)
-
-                    if len(klines_regime) >= 21:
-                        self._ma_slope_pct = self.market_regime_analyzer.calculate_ma_slope(klines_regime)
-
-                self._last_kline_refresh_ts = now
+            due = self._get_due_refreshes(now)
+
+            if self.async_rest_client is not None and len(due) > 1:
+                # 독립 조회 동시 실행 → 순차 버전과 같은 순서로 반영 (첫 예외에서 중단)
+                calls = {name: self._refresh_call(name, now) for name in due}
+                responses = self.async_rest_client.run_fan_out(calls)
+                for name in due:
+                    response = responses[name]
+                    if isinstance(response, RateLimitError):
+                        self._back_off_refresh(name, response)
+                        continue
+                    if isinstance(response, BaseException):
+                        raise response
+                    self._apply_refresh(name, response, now)
+            else:
+                for name in due:
+                    method_name, kwargs = self._refresh_call(name, now)
+                    try:
+                        response = getattr(self.rest_client, method_name)(**kwargs)
+                    except RateLimitError as e:
+                        self._back_off_refresh(name, e)
+                        continue
+                    self._apply_refresh(name, response, now)
+
+            if self._is_history_seed_due(now):
+                try:
+                    self._seed_session_risk_from_history(now)
+                except RateLimitError as e:
+                    self._back_off_refresh("executions", e)
 
             self._last_update_ts = now
 
-        except RateLimitError as e:
-            retry_after = max(5.0, float(getattr(e, "retry_after", 10.0) or 10.0))
-            self._next_rest_retry_ts = time.time() + retry_after
-            logger.warning(f"Rate limit hit, backing off {retry_after:.1f}s: {e}")
         except Exception as e:
             logger.error(f"Market data update failed: {e}")
 
+    def _back_off_refresh(self, name: str, error: RateLimitError) -> None:
+        """Rate limit → 해당 조회만 retry_after 동안 보류"""
+        retry_after = max(1.0, float(getattr(error, "retry_after", 10.0) or 10.0))
+        self._refresh_retry_ts[name] = time.time() + retry_after
+        logger.warning(f"Rate limit hit on {name}, backing off {retry_after:.1f}s: {error}")
+
+    def _get_due_refreshes(self, now: float) -> List[str]:
+        """갱신 주기가 도래한 조회 이름 목록 (_REFRESH_CALLS 순서, backoff 중 제외)"""
+        due = []
+        # 1) Mark/Index/Funding (상대적으로 자주)
+        if now - self._last_ticker_refresh_ts >= 10.0 or self._mark_price <= 0:
+            due.append("tickers")
+        # 2) Equity + Position (중간 빈도, private stream 연결 중에는 저빈도 resync)
+        account_interval = self._PRIVATE_STREAM_RESYNC_S if self._is_private_stream_live() else 30.0
+        if now - self._last_wallet_refresh_ts >= account_interval or self._equity_usdt <= 0:
+            due.append("wallet")
+        if now - self._last_position_refresh_ts >= account_interval or self._current_position is None:
+            due.append("position")
+        # 3) Trade history/PnL (시작 시 1회 seed, 이후 WS 체결로 증분 누적)
+        if not self._session_risk_seeded and self.execution_sync is None:
+            due.append("executions")
+        # 4) Kline/ATR/Regime (가장 저빈도)
+        if now - self._last_kline_refresh_ts >= 120.0 or self.get_atr() is None:
+            due.append("kline")
+        return [name for name in due if now >= self._refresh_retry_ts.get(name, 0.0)]
+
+    def _refresh_call(self, name: str, now: float) -> Tuple[str, Dict[str, Any]]:
+        """조회 이름 → (REST 메서드, kwargs) (kline은 캐시에 없는 tail만 조회)"""
+        method_name, kwargs = self._REFRESH_CALLS[name]
+        if name == "kline":
+            kwargs = {**kwargs, **KlineDiskCache.tail_request(self._klines, int(now * 1000))}
+        return method_name, kwargs
+
+    def _is_history_seed_due(self, now: float) -> bool:
+        """ExecutionHistorySync 기반 session risk seed 필요 여부 (backoff 중 제외)"""
+        return (
+            self.execution_sync is not None
+            and not self._session_risk_seeded
+            and now >= self._refresh_retry_ts.get("executions", 0.0)
+        )
+
+    def _seed_session_risk_from_history(self, now: float) -> None:
+        """
+        로컬 execution 캐시 증분 sync → 최근 7일 체결로 session risk seed
+
+        ISO week는 최대 7일 → 주간 PnL은 거래 수와 무관하게 정확
+        (checkpoint와 겹치는 체결은 execId로 무시)
+        """
+        self.execution_sync.sync(now_ms=int(now * 1000))
+        executions = self.execution_sync.store.range(start_ms=int((now - 7 * 86400) * 1000))
+        for execution in executions:
+            self._record_session_execution(execution)
+        if executions and executions[-1].get("execPrice"):
+            self._last_fill_price = float(executions[-1]["execPrice"])
+        self.session_risk.checkpoint()
+        self._session_risk_ready = True
+        self._session_risk_seeded = True
+
+    def _apply_refresh(self, name: str, response: Dict[str, Any], now: float) -> None:
+        """조회 응답을 캐시에 반영"""
+        result = response.get("result", {})
+
+        if name == "tickers":
+            ticker_list = result.get("list", [])
+            if ticker_list:
+                ticker = ticker_list[0]
+                self._mark_price = float(ticker.get("markPrice", 0.0))
+                self._price_history.record(self._mark_price)
+                self._index_price = float(ticker.get("indexPrice", 0.0))
+                self._funding_rate = float(ticker.get("fundingRate", 0.0001))
+            self._last_ticker_refresh_ts = now
+
+        elif name == "wallet":
+            wallet_list = result.get("list", [])
+            if wallet_list:
+                wallet_data = wallet_list[0]
+                self._equity_usdt = float(wallet_data.get("totalEquity", 0.0))
+                avail_str = wallet_data.get("totalAvailableBalance", "")
+                if avail_str and avail_str.strip():
+                    self._available_usdt = float(avail_str)
+                else:
+                    self._available_usdt = float(wallet_data.get("totalEquity", 0.0))
+            self._last_wallet_refresh_ts = now
+
+        elif name == "position":
+            position_list = result.get("list", [])
+            if position_list:
+                self._current_position = position_list[0]
+            self._last_position_refresh_ts = now
+
+        elif name == "executions":
+            trade_list = result.get("list", [])
+
+            if trade_list:
+                latest_exec = trade_list[0]
+                exec_price_str = latest_exec.get("execPrice")
+                if exec_price_str:
+                    self._last_fill_price = float(exec_price_str)
+
+            # REST는 최신순 → 오래된 순으로 누적 (checkpoint와 겹치는 체결은 execId로 무시)
+            for trade_data in sorted(trade_list, key=lambda e: int(e.get("execTime", 0) or 0)):
+                self._record_session_execution(trade_data)
+            self.session_risk.checkpoint()
+            self._session_risk_ready = True
+            self._session_risk_seeded = True
+
+        elif name == "kline":
+            kline_list = result.get("list", [])
+            if kline_list:
+                self._klines.merge_rows(kline_list)
+                self.indicators.set_input("last_price", float(self._klines.close()[-1]))
+                if self.kline_cache is not None:
+                    self.kline_cache.save(self._klines, "BTCUSDT")
+            self._last_kline_refresh_ts = now
+
+    def _register_indicators(self) -> None:
+        """
+        지표 graph 등록 (interval = _KLINE_INTERVAL)
+
+        - kline_states: 새로 확정된 bar를 ATR/SMA state에 반영 (값 = 마지막 확정 bar start)
+        - atr / atr_percentile / atr_pct_24h: ATR state peek (진행 중 bar 포함)
+        - ma_readings / ma_slope_pct / market_regime: SMA state peek (최신 체결가 = 진행 중 bar close)
+        """
+        interval = self._KLINE_INTERVAL
+        engine = self.indicators
+        engine.register("kline_states", self._compute_kline_states, interval=interval)
+        engine.register("atr", self._compute_atr, interval=interval, depends_on=("kline_states",))
+        engine.register(
+            "atr_percentile", self._compute_atr_percentile,
+            depends_on=("atr", "kline_states"), default=50.0,
+        )
+        engine.register(
+            "atr_pct_24h", self._compute_atr_pct_24h,
+            depends_on=("atr", "mark_price"), default=0.0,
+        )
+        engine.register(
+            "ma_readings", self._compute_ma_readings, interval=interval,
+            depends_on=("kline_states", "last_price"), default={},
+        )
+        engine.register("ma_slope_pct", self._compute_ma_slope_pct, depends_on=("ma_readings",), default=0.0)
+        engine.register(
+            "market_regime",
+            lambda _, deps: self.market_regime_analyzer.evaluate(deps["ma_readings"], deps["atr_percentile"]),
+            depends_on=("ma_readings", "atr_percentile"),
+        )
+
+    def _compute_kline_states(self, klines: KlineSeries, deps: Dict[str, Any]) -> Optional[int]:
+        """새로 확정된 bar → ATR/SMA state (20 bar 미만이면 보류)"""
+        if len(klines) >= 20:
+            self._advance_kline_states(klines.starts(), klines.high(), klines.low(), klines.close())
+        return self._kline_committed_start
+
+    def _compute_atr(self, klines: KlineSeries, deps: Dict[str, Any]) -> Optional[float]:
+        """진행 중 bar 포함 ATR"""
+        if len(klines) < 20:
+            return None
+        return self._atr_state.peek_hlc(float(klines.high()[-1]), float(klines.low()[-1]))
+
+    def _compute_atr_percentile(self, _: Any, deps: Dict[str, Any]) -> Optional[float]:
+        """현재 ATR의 history 대비 percentile"""
+        if deps["atr"] is None or not self._atr_state.history:
+            return None
+        return self._atr_state.percentile_rank(deps["atr"])
+
+    def _compute_atr_pct_24h(self, _: Any, deps: Dict[str, Any]) -> Optional[float]:
+        """ATR / mark price (%)"""
+        if deps["atr"] is None or not deps["mark_price"]:
+            return None
+        return (deps["atr"] / deps["mark_price"]) * 100.0
+
+    def _compute_ma_readings(self, klines: KlineSeries, deps: Dict[str, Any]) -> Optional[Dict[int, MAReading]]:
+        """최신 체결가(없으면 진행 중 bar close) 기준 SMA reading"""
+        if len(klines) < 20:
+            return None
+        price = deps["last_price"] or float(klines.close()[-1])
+        return self._ma_state.peek(price) or None
+
+    def _compute_ma_slope_pct(self, _: Any, deps: Dict[str, Any]) -> Optional[float]:
+        """ma_period SMA slope (%)"""
+        reading = deps["ma_readings"].get(self.market_regime_analyzer.ma_period)
+        return reading.slope_pct if reading is not None else None
+
+    def _advance_kline_states(
+        self, starts: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray
+    ) -> None:
+        """
+        ATR / SMA state에 새로 확정된 bar만 반영 (oldest first, 마지막 bar = 진행 중)
+
+        마지막 반영 bar가 캐시에 없으면 (최초 seed / 캐시 단절) 캐시 전체로 재구성한다.
+        """
+        committed = len(starts) - 1
+        if committed <= 0:
+            return
+
+        last = self._kline_committed_start
+        idx = int(np.searchsorted(starts[:committed], last)) if last is not None else committed
+        if idx < committed and starts[idx] == last:
+            first_new = idx + 1
+        else:
+            self._atr_state.reset()
+            self._ma_state.reset()
+            first_new = 0
+
+        self._atr_state.backfill_arrays(
+            highs[first_new:committed], lows[first_new:committed], closes[first_new:committed]
+        )
+        self._ma_state.backfill(closes[first_new:committed])
+        self._kline_committed_start = int(starts[committed - 1])
+
+    def get_ma_readings(self) -> Dict[int, MAReading]:
+        """Period별 SMA reading (ma / slope / acceleration, 최신 tick 반영)"""
+        return dict(self.indicators.get("ma_readings"))
+
+    def get_market_regime(self) -> Optional[str]:
+        """현재 market regime (MA slope + ATR percentile, 데이터 부족 시 None)"""
+        return self.indicators.get("market_regime")
+
+    # ========== Public Stream Integration (tickers / kline) ==========
+
+    def on_ticker_update(self, ticker: Dict[str, Any]) -> None:
+        """
+        Public stream ticker 반영 (BybitPublicWsClient on_ticker 콜백)
+
+        Args:
+            ticker: snapshot + delta 병합 ticker (markPrice, indexPrice, fundingRate, ...)
+
+        Note:
+            stream이 살아 있는 동안 tickers REST polling은 due 되지 않는다
+            (_last_ticker_refresh_ts 갱신 → REST는 fallback).
+            lastPrice(없으면 markPrice)를 진행 중 bar close로 보고 MA slope를 갱신한다.
+        """
+        mark_price = ticker.get("markPrice")
+        if mark_price:
+            self._mark_price = float(mark_price)
+            self._price_history.record(self._mark_price)
+        index_price = ticker.get("indexPrice")
+        if index_price:
+            self._index_price = float(index_price)
+        funding_rate = ticker.get("fundingRate")
+        if funding_rate:
+            self._funding_rate = float(funding_rate)
+        self._last_ticker_refresh_ts = time.time()
+
+        # 진행 중 bar close = 최신 체결가 → SMA slope/regime은 다음 조회 시 O(1) 재계산
+        last_price = ticker.get("lastPrice") or mark_price
+        if last_price:
+            self.indicators.set_input("last_price", float(last_price))
+
+    def on_kline_update(self, rows: List[List[Any]]) -> None:
+        """
+        Public stream kline 반영 (BybitPublicWsClient on_kline 콜백)
+
+        Args:
+            rows: REST 형식 kline row 목록 ([startTime, o, h, l, c, vol, turnover, confirm])
+
+        Note:
+            - startTime 기준으로 캐시에 병합 (진행 중 bar는 덮어쓰기)
+            - 지표는 여기서 계산하지 않음 (getter 조회 시 IndicatorEngine이 lazy 재계산)
+            - REST kline 캐시가 비어 있으면 병합하지 않음 (history는 REST로 seed)
+        """
+        if not len(self._klines):
+            return
+
+        self._klines.merge_rows(rows)
+        self.indicators.set_input("last_price", float(self._klines.close()[-1]))
+        self._last_kline_refresh_ts = time.time()
+
+    # ========== Private Stream Integration (position / wallet / order) ==========
+
+    def _is_private_stream_live(self) -> bool:
+        """Private WS 연결/구독 완료 + DEGRADED 아님"""
+        try:
+            return self.ws_client.is_connected() is True and self.ws_client.is_degraded() is False
+        except Exception:
+            return False
+
+    def on_position_update(self, positions: List[Dict[str, Any]]) -> None:
+        """
+        Private stream position 반영 (BybitWsClient on_position 콜백)
+
+        Args:
+            positions: position topic data (Bybit V5 WS position 구조)
+
+        Note:
+            WS position은 진입가를 entryPrice로 보내므로 REST 구조(avgPrice)로 정규화한다.
+        """
+        for position in positions:
+            if position.get("symbol") != "BTCUSDT":
+                continue
+            normalized = dict(position)
+            if not normalized.get("avgPrice") and normalized.get("entryPrice"):
+                normalized["avgPrice"] = normalized["entryPrice"]
+            self._current_position = normalized
+            self._last_position_refresh_ts = time.time()
+
+    def on_wallet_update(self, wallets: List[Dict[str, Any]]) -> None:
+        """
+        Private stream wallet 반영 (BybitWsClient on_wallet 콜백)
+
+        Args:
+            wallets: wallet topic data (accountType별 잔고)
+        """
+        for wallet_data in wallets:
+            if wallet_data.get("accountType", "UNIFIED") != "UNIFIED":
+                continue
+            total_equity = wallet_data.get("totalEquity")
+            if total_equity:
+                self._equity_usdt = float(total_equity)
+            avail_str = wallet_data.get("totalAvailableBalance", "")
+            if avail_str and str(avail_str).strip():
+                self._available_usdt = float(avail_str)
+            elif total_equity:
+                self._available_usdt = float(total_equity)
+            self._last_wallet_refresh_ts = time.time()
+
+    def on_order_update(self, orders: List[Dict[str, Any]]) -> None:
+        """
+        Private stream order 반영 (BybitWsClient on_order 콜백)
+
+        Args:
+            orders: order topic data (orderId, orderLinkId, orderStatus, ...)
+        """
+        for order in orders:
+            order_id = order.get("orderId")
+            if not order_id:
+                continue
+            if order.get("orderStatus") in self._TERMINAL_ORDER_STATUSES:
+                self._open_orders.pop(order_id, None)
+            else:
+                self._open_orders[order_id] = order
+
+    def get_live_position(self) -> Optional[Dict[str, Any]]:
+        """
+        Private stream으로 최신 상태가 유지되는 포지션 (hot-path REST 대체용)
+
+        Returns:
+            Optional[Dict]: 포지션 (REST get_position list 원소 구조)
+                - None: private stream 미연결/DEGRADED 또는 아직 seed 전 → REST 조회 필요
+        """
+        if not self._is_private_stream_live() or self._last_position_refresh_ts <= 0:
+            return None
+        return self.get_position()
+
+    def get_open_orders(self) -> List[Dict[str, Any]]:
+        """order topic 기준 미종료 주문 목록"""
+        return list(self._open_orders.values())
+
+    def fetch_missed_executions(self, start_ts: float, end_ts: float) -> List[Dict[str, Any]]:
+        """
+        WS 재연결 gap-fill: 끊김 구간 execution을 REST로 조회 (BybitWsClient gap_fill hook)
+
+        Args:
+            start_ts: 구간 시작 (seconds)
+            end_ts: 구간 종료 (seconds)
+
+        Returns:
+            List[Dict]: execution 목록 (WS execution data 구조, 오래된 순)
+        """
+        if self.execution_sync is not None:
+            # 로컬 캐시 증분 sync (watermark 이후만 조회) → 구간 조회
+            self.execution_sync.sync()
+            return self.execution_sync.store.range(int(start_ts * 1000), int(end_ts * 1000))
+
+        response = self.rest_client.get_execution_list(
+            category="linear",
+            symbol="BTCUSDT",
+            limit=100,
+            startTime=int(start_ts * 1000),
+            endTime=int(end_ts * 1000),
+        )
+        executions = response.get("result", {}).get("list", [])
+        # REST는 최신순 → WS 수신 순서(오래된 순)로 정렬
+        return sorted(executions, key=lambda e: int(e.get("execTime", 0) or 0))
+
     # ========== Phase 12a-1: WebSocket Integration ==========
 
     def get_fill_events(self) -> List[ExecutionEvent]:
@@ -380,6 +767,7 @@ class BybitAdapter:
             List[ExecutionEvent]: FILL event 목록 (소비 후 clear)
         """
         fill_events: List[ExecutionEvent] = []
+        recorded = 0
 
         # WS client에서 execution event 가져오기
         raw_events = self.ws_client.get_execution_events()
@@ -422,6 +810,8 @@ class BybitAdapter:
                 )
 
                 fill_events.append(execution_event)
+                if self._record_session_execution(raw_event):
+                    recorded += 1
 
                 # last_fill_price 업데이트
                 if event_type == EventType.FILL:
@@ -430,8 +820,51 @@ class BybitAdapter:
             except Exception as e:
                 logger.error(f"Failed to convert execution event: {e}, raw_event={raw_event}")
 
+        if recorded:
+            self._session_risk_ready = True
+            self.session_risk.checkpoint()
+
         return fill_events
 
+    def _record_session_execution(self, execution: Dict[str, Any]) -> bool:
+        """
+        체결 1건 → Session risk 누적 (PnL/loss streak + fee ratio/slippage)
+
+        Args:
+            execution: Bybit execution (WS execution.linear / REST execution list 구조)
+
+        Returns:
+            bool: 누적 여부 (Trade 외 execType, 중복 execId, execTime 없음 → False)
+        """
+        exec_time = execution.get("execTime")
+        if execution.get("execType", "Trade") != "Trade" or exec_time is None:
+            return False
+        if not self.session_risk.mark_execution(execution.get("execId")):
+            return False
+        timestamp = float(exec_time) / 1000.0
+
+        # closedPnl 없으면 청산 체결(closedSize > 0)의 execPnl 사용 (진입 체결은 PnL 없음)
+        closed_pnl = execution.get("closedPnl")
+        if closed_pnl is None and float(execution.get("closedSize") or 0) > 0:
+            closed_pnl = execution.get("execPnl")
+        if closed_pnl is not None:
+            self.session_risk.record_trade(float(closed_pnl), timestamp)
+
+        exec_price = float(execution.get("execPrice") or 0)
+        notional = float(execution.get("execValue") or 0) or exec_price * float(execution.get("execQty") or 0)
+        is_maker = str(execution.get("isMaker", "")).lower() == "true"
+        self.session_risk.record_fill(
+            FillEvent(
+                fee=float(execution.get("execFee") or 0),
+                notional=notional,
+                expected_price=float(execution.get("markPrice") or 0),
+                filled_price=exec_price,
+                timestamp=timestamp,
+            ),
+            fee_rate=self._MAKER_FEE_RATE if is_maker else self._TAKER_FEE_RATE,
+        )
+        return True
+
     # ========== Internal Helper Methods ==========
 
     def set_ws_degraded(self, degraded: bool):
@@ -0,0 +1,244 @@
+"""
+src/infrastructure/exchange/bybit_async_rest_client.py
+Bybit Async REST API Client (asyncio 인터페이스 + 동시 fan-out)
+
+Purpose:
+- BybitRestClient의 asyncio counterpart
+- 독립적인 조회(tickers, wallet, position, execution, kline)를 동시에 실행
+  → 5번의 순차 round trip 대신 1번의 round trip 비용
+
+Design:
+- 서명/rate limit/retry/연결 풀은 BybitRestClient를 그대로 공유 (semantics 동일)
+- blocking I/O는 전용 ThreadPoolExecutor에서 실행 (tick thread 비차단)
+- fan_out(): 여러 호출을 asyncio.gather로 동시 실행, 예외는 결과로 반환
+
+SSOT:
+- docs/plans/task_plan.md Phase 12a-1 (REST API Integration)
+
+Exports:
+- AsyncBybitRestClient: asyncio REST API client
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from infrastructure.exchange.bybit_rest_client import BybitRestClient
+
+
+class AsyncBybitRestClient:
+    """
+    Bybit Async REST API Client
+
+    역할:
+    - BybitRestClient 메서드의 async 버전 제공 (동일 시그니처)
+    - fan_out(): 독립 호출 동시 실행 (asyncio.gather)
+    - run_fan_out(): sync 호출자(BybitAdapter)용 진입점
+    """
+
+    def __init__(self, rest_client: BybitRestClient, max_concurrency: int = 5):
+        """
+        Async REST Client 초기화
+
+        Args:
+            rest_client: 서명/rate limit/연결 풀을 공유할 sync REST client
+            max_concurrency: 동시 요청 최대 개수 (기본: 5, pool_maxsize 이하 권장)
+        """
+        self.rest_client = rest_client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="bybit-rest",
+        )
+
+    async def _call(self, method_name: str, *args, **kwargs) -> Dict[str, Any]:
+        """sync REST 메서드를 executor에서 실행"""
+        loop = asyncio.get_running_loop()
+        func = functools.partial(getattr(self.rest_client, method_name), *args, **kwargs)
+        return await loop.run_in_executor(self._executor, func)
+
+    async def fan_out(
+        self, calls: Dict[str, Tuple[str, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        독립 REST 호출 동시 실행
+
+        Args:
+            calls: {이름: (메서드 이름, kwargs)}
+                예: {"tickers": ("get_tickers", {"symbol": "BTCUSDT"})}
+
+        Returns:
+            Dict: {이름: 응답 JSON 또는 발생한 Exception}
+                (하나가 실패해도 나머지 결과는 보존, 호출자가 순서대로 처리)
+        """
+        names = list(calls.keys())
+        results = await asyncio.gather(
+            *(self._call(method_name, **kwargs) for method_name, kwargs in calls.values()),
+            return_exceptions=True,
+        )
+        return dict(zip(names, results))
+
+    def run_fan_out(
+        self, calls: Dict[str, Tuple[str, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        fan_out() sync 진입점 (tick thread 등 event loop 밖에서 호출)
+
+        Args:
+            calls: {이름: (메서드 이름, kwargs)}
+
+        Returns:
+            Dict: {이름: 응답 JSON 또는 Exception}
+        """
+        return asyncio.run(self.fan_out(calls))
+
+    def close(self) -> None:
+        """Executor 정리 (프로세스 종료 시 호출)"""
+        self._executor.shutdown(wait=False)
+
+    # ========================================================================
+    # Order / Position
+    # ========================================================================
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        qty: str,
+        order_link_id: str,
+        order_type: str = "Market",
+        time_in_force: str = "GoodTillCancel",
+        price: Optional[str] = None,
+        category: str = "linear",
+        reduce_only: bool = False,
+        position_idx: int = 0,
+    ) -> Dict[str, Any]:
+        """주문 발주 (BybitRestClient.place_order)"""
+        return await self._call(
+            "place_order",
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            order_link_id=order_link_id,
+            order_type=order_type,
+            time_in_force=time_in_force,
+            price=price,
+            category=category,
+            reduce_only=reduce_only,
+            position_idx=position_idx,
+        )
+
+    async def cancel_order(
+        self,
+        symbol: str,
+        order_id: str,
+        category: str = "linear",
+    ) -> Dict[str, Any]:
+        """주문 취소 (BybitRestClient.cancel_order)"""
+        return await self._call("cancel_order", symbol=symbol, order_id=order_id, category=category)
+
+    async def set_trading_stop(
+        self,
+        symbol: str,
+        stop_loss: str,
+        category: str = "linear",
+        position_idx: int = 0,
+        sl_trigger_by: str = "MarkPrice",
+    ) -> Dict[str, Any]:
+        """포지션 Stop Loss 설정 (BybitRestClient.set_trading_stop)"""
+        return await self._call(
+            "set_trading_stop",
+            symbol=symbol,
+            stop_loss=stop_loss,
+            category=category,
+            position_idx=position_idx,
+            sl_trigger_by=sl_trigger_by,
+        )
+
+    # ========================================================================
+    # Market / Account Data
+    # ========================================================================
+
+    async def get_tickers(
+        self,
+        category: str = "linear",
+        symbol: str = "BTCUSDT",
+    ) -> Dict[str, Any]:
+        """시장 데이터 조회 (BybitRestClient.get_tickers)"""
+        return await self._call("get_tickers", category=category, symbol=symbol)
+
+    async def get_open_orders(
+        self,
+        category: str = "linear",
+        symbol: Optional[str] = None,
+        orderId: Optional[str] = None,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """미체결 주문 조회 (BybitRestClient.get_open_orders)"""
+        return await self._call(
+            "get_open_orders", category=category, symbol=symbol, orderId=orderId, limit=limit
+        )
+
+    async def get_wallet_balance(
+        self,
+        accountType: str = "UNIFIED",
+        coin: str = "USDT",
+    ) -> Dict[str, Any]:
+        """계정 Equity 조회 (BybitRestClient.get_wallet_balance)"""
+        return await self._call("get_wallet_balance", accountType=accountType, coin=coin)
+
+    async def get_position(
+        self,
+        category: str = "linear",
+        symbol: str = "BTCUSDT",
+    ) -> Dict[str, Any]:
+        """현재 포지션 조회 (BybitRestClient.get_position)"""
+        return await self._call("get_position", category=category, symbol=symbol)
+
+    async def get_execution_list(
+        self,
+        category: str = "linear",
+        symbol: Optional[str] = None,
+        orderId: Optional[str] = None,
+        limit: int = 50,
+        startTime: Optional[int] = None,
+        endTime: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """거래 내역 조회 (BybitRestClient.get_execution_list)"""
+        return await self._call(
+            "get_execution_list",
+            category=category,
+            symbol=symbol,
+            orderId=orderId,
+            limit=limit,
+            startTime=startTime,
+            endTime=endTime,
+        )
+
+    async def get_order_history(
+        self,
+        category: str = "linear",
+        symbol: str = "BTCUSDT",
+        orderId: Optional[str] = None,
+        limit: int = 1,
+    ) -> Dict[str, Any]:
+        """주문 이력 조회 (BybitRestClient.get_order_history)"""
+        return await self._call(
+            "get_order_history", category=category, symbol=symbol, orderId=orderId, limit=limit
+        )
+
+    async def get_kline(
+        self,
+        category: str = "linear",
+        symbol: str = "BTCUSDT",
+        interval: str = "60",
+        limit: int = 200,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Kline 조회 (BybitRestClient.get_kline, start/end는 지정 시에만 전달)"""
+        window = {key: value for key, value in (("start", start), ("end", end)) if value is not None}
+        return await self._call(
+            "get_kline", category=category, symbol=symbol, interval=interval, limit=limit, **window
+        )
@@ -0,0 +1,323 @@
+"""
+src/infrastructure/exchange/bybit_public_ws_client.py
+Bybit Public WebSocket Client (tickers + kline market-data stream)
+
+Purpose:
+- REST polling(tickers 10초, kline 120초) 대신 public stream으로 시장 데이터 수신
+- tickers.{symbol}: mark/index/last price, funding rate (100ms push)
+- kline.{interval}.{symbol}: 진행 중/확정 캔들
+
+Design:
+- 인증 없음 (public stream)
+- tickers: snapshot + delta 병합 → 전체 ticker dict로 콜백
+- kline: Bybit WS 형식 → REST kline row 형식으로 변환 후 콜백
+  ([startTime, open, high, low, close, volume, turnover], 문자열)
+- 콜백은 WS thread에서 호출 (가벼운 캐시 갱신만 수행할 것)
+- REST polling은 fallback으로 유지 (stream이 끊기면 adapter가 REST로 갱신)
+
+SSOT:
+- Bybit V5 WebSocket Public: https://bybit-exchange.github.io/docs/v5/websocket/public/ticker
+- docs/constitution/FLOW.md Section 2 (Market Data Provider)
+
+Exports:
+- BybitPublicWsClient: Public WebSocket client
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import websocket  # websocket-client 라이브러리
+
+from infrastructure.exchange.bybit_rest_client import FatalConfigError
+from infrastructure.exchange import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+class BybitPublicWsClient:
+    """
+    Bybit Public WebSocket Client (tickers + kline)
+
+    SSOT: Bybit V5 WebSocket Public
+    - subscribe topic: tickers.{symbol}, kline.{interval}.{symbol}
+    - disconnect/error → DEGRADED 플래그
+    - ping 20초 주기
+    - Testnet/Mainnet WSS URL 일치성 강제
+    """
+
+    def __init__(
+        self,
+        wss_url: str,
+        symbol: str = "BTCUSDT",
+        kline_interval: str = "60",
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Bybit Public WS Client 초기화
+
+        Args:
+            wss_url: Public WebSocket URL (예: wss://stream.bybit.com/v5/public/linear)
+            symbol: 심볼 (기본: BTCUSDT)
+            kline_interval: Kline 간격 (기본: "60")
+            clock: Timestamp 생성 함수 (기본: time.time)
+
+        Raises:
+            FatalConfigError: BYBIT_TESTNET 설정과 wss_url 불일치
+        """
+        testnet_mode = os.getenv("BYBIT_TESTNET", "true").lower() == "true"
+
+        if testnet_mode and "stream-testnet.bybit.com" not in wss_url:
+            raise FatalConfigError(
+                "BYBIT_TESTNET=true but wss_url is not Testnet. "
+                "Use 'wss://stream-testnet.bybit.com/v5/public/linear' for Testnet."
+            )
+
+        if not testnet_mode and "stream.bybit.com" not in wss_url:
+            raise FatalConfigError(
+                "BYBIT_TESTNET=false but wss_url is not Mainnet. "
+                "Use 'wss://stream.bybit.com/v5/public/linear' for Mainnet."
+            )
+
+        self.wss_url = wss_url
+        self.symbol = symbol
+        self.kline_interval = kline_interval
+        self.clock = clock or time.time
+
+        # DEGRADED 상태 추적
+        self._degraded = False
+        self._degraded_entered_at: Optional[float] = None
+
+        # 수신 상태
+        self._ticker: Dict[str, Any] = {}  # snapshot + delta 병합 결과
+        self._last_message_at: Optional[float] = None
+        self._last_pong_at: Optional[float] = None
+
+        # WebSocket 연결 상태
+        self._ws: Optional[websocket.WebSocketApp] = None
+        self._ws_thread: Optional[threading.Thread] = None
+        self._ping_thread: Optional[threading.Thread] = None
+        self._running = False
+        self._subscribed = False
+
+        # 콜백
+        self._on_ticker: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._on_kline: Optional[Callable[[List[List[str]]], None]] = None
+
+    @property
+    def ticker_topic(self) -> str:
+        """tickers.{symbol}"""
+        return f"tickers.{self.symbol}"
+
+    @property
+    def kline_topic(self) -> str:
+        """kline.{interval}.{symbol}"""
+        return f"kline.{self.kline_interval}.{self.symbol}"
+
+    def get_subscribe_payload(self) -> Dict[str, Any]:
+        """
+        Subscribe payload 생성
+
+        Returns:
+            Dict: {"op": "subscribe", "args": ["tickers.BTCUSDT", "kline.60.BTCUSDT"]}
+        """
+        return {
+            "op": "subscribe",
+            "args": [self.ticker_topic, self.kline_topic],
+        }
+
+    def is_degraded(self) -> bool:
+        """DEGRADED 상태 확인"""
+        return self._degraded
+
+    def is_connected(self) -> bool:
+        """연결/구독 완료 여부"""
+        return self._running and self._subscribed
+
+    def get_last_message_at(self) -> Optional[float]:
+        """마지막 data 메시지 수신 시각 (stream staleness 판단용)"""
+        return self._last_message_at
+
+    def get_ticker(self) -> Dict[str, Any]:
+        """현재 병합된 ticker (snapshot + delta)"""
+        return dict(self._ticker)
+
+    def _mark_degraded(self) -> None:
+        """DEGRADED 진입"""
+        self._degraded = True
+        if self._degraded_entered_at is None:
+            self._degraded_entered_at = self.clock()
+
+    def handle_message(self, msg: Dict[str, Any]) -> None:
+        """
+        파싱된 메시지 처리 (ticker 병합 / kline 변환 → 콜백)
+
+        Args:
+            msg: WS 메시지 (dict)
+
+        Message Types:
+        - op=subscribe 응답: {"success": true, "op": "subscribe"}
+        - op=pong 응답: {"success": true, "op": "pong"}
+        - tickers: {"topic": "tickers.BTCUSDT", "type": "snapshot"|"delta", "data": {...}}
+        - kline: {"topic": "kline.60.BTCUSDT", "type": "snapshot", "data": [{...}]}
+        """
+        op = msg.get("op")
+        if op == "subscribe":
+            if msg.get("success"):
+                self._subscribed = True
+                self._degraded = False
+                self._degraded_entered_at = None
+            else:
+                logger.error(f"Public WS subscribe failed: {msg.get('ret_msg')}")
+            return
+
+        if op in ("pong", "ping"):
+            self._last_pong_at = self.clock()
+            return
+
+        topic = msg.get("topic")
+        if topic == self.ticker_topic:
+            data = msg.get("data") or {}
+            if msg.get("type") == "snapshot":
+                self._ticker = dict(data)
+            else:
+                self._ticker.update(data)
+            self._last_message_at = self.clock()
+            if self._on_ticker:
+                self._on_ticker(dict(self._ticker))
+            return
+
+        if topic == self.kline_topic:
+            rows = [self._to_rest_kline_row(bar) for bar in msg.get("data") or []]
+            self._last_message_at = self.clock()
+            if rows and self._on_kline:
+                self._on_kline(rows)
+            return
+
+    @staticmethod
+    def _to_rest_kline_row(bar: Dict[str, Any]) -> List[Any]:
+        """
+        WS kline bar → REST kline row 형식
+
+        Returns:
+            List: [startTime, open, high, low, close, volume, turnover, confirm]
+                (앞 7개는 GET /v5/market/kline list 원소와 동일)
+        """
+        return [
+            str(bar.get("start")),
+            str(bar.get("open")),
+            str(bar.get("high")),
+            str(bar.get("low")),
+            str(bar.get("close")),
+            str(bar.get("volume")),
+            str(bar.get("turnover")),
+            bool(bar.get("confirm", False)),
+        ]
+
+    def _send_subscribe(self) -> None:
+        """Subscribe 메시지 전송"""
+        if not self._ws:
+            return
+        self._ws.send(json_codec.dumps(self.get_subscribe_payload()))
+
+    def _send_ping(self) -> None:
+        """Ping 메시지 전송 (실패 시 DEGRADED)"""
+        if not self._ws or not self._running:
+            return
+        try:
+            self._ws.send(json_codec.dumps({"op": "ping"}))
+        except Exception:
+            self._mark_degraded()
+
+    def _ping_loop(self) -> None:
+        """Ping loop (background thread, 20초마다)"""
+        while self._running:
+            time.sleep(20.0)
+            if self._running:
+                self._send_ping()
+
+    def _on_ws_open(self, ws: websocket.WebSocketApp) -> None:
+        """연결 성공 → 즉시 subscribe (public stream은 auth 없음)"""
+        self._send_subscribe()
+
+    def _on_ws_message(self, ws: websocket.WebSocketApp, message: str) -> None:
+        """WebSocket 메시지 수신 콜백"""
+        # pong/ack control frame → 전체 파싱 생략 (fast path)
+        msg = json_codec.parse_control_frame(message)
+        if msg is None:
+            try:
+                msg = json_codec.loads(message)
+            except ValueError:
+                return
+
+        try:
+            self.handle_message(msg)
+        except Exception as e:
+            logger.error(f"Public WS message handling failed: {e}")
+
+    def _on_ws_error(self, ws: websocket.WebSocketApp, error: Exception) -> None:
+        """WebSocket 에러 → DEGRADED"""
+        self._mark_degraded()
+
+    def _on_ws_close(
+        self, ws: websocket.WebSocketApp, close_status_code: int, close_msg: str
+    ) -> None:
+        """WebSocket 종료 → DEGRADED"""
+        self._mark_degraded()
+        self._subscribed = False
+
+    def start(
+        self,
+        on_ticker: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_kline: Optional[Callable[[List[List[str]]], None]] = None,
+    ) -> None:
+        """
+        WebSocket 연결 시작 (background thread)
+
+        Args:
+            on_ticker: 병합된 ticker dict 콜백 (예: BybitAdapter.on_ticker_update)
+            on_kline: REST 형식 kline row 목록 콜백 (예: BybitAdapter.on_kline_update)
+        """
+        if self._running:
+            return
+
+        self._running = True
+        self._on_ticker = on_ticker
+        self._on_kline = on_kline
+
+        self._ws = websocket.WebSocketApp(
+            self.wss_url,
+            on_open=self._on_ws_open,
+            on_message=self._on_ws_message,
+            on_error=self._on_ws_error,
+            on_close=self._on_ws_close,
+        )
+
+        self._ws_thread = threading.Thread(target=self._ws.run_forever, daemon=True)
+        self._ws_thread.start()
+
+        self._ping_thread = threading.Thread(target=self._ping_loop, daemon=True)
+        self._ping_thread.start()
+
+    def stop(self) -> None:
+        """WebSocket 연결 종료 (thread join timeout=5.0)"""
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._ws:
+            self._ws.close()
+
+        if self._ws_thread and self._ws_thread.is_alive():
+            self._ws_thread.join(timeout=5.0)
+
+        if self._ping_thread and self._ping_thread.is_alive():
+            self._ping_thread.join(timeout=5.0)
+
+        self._ws = None
+        self._ws_thread = None
+        self._ping_thread = None
+        self._subscribed = False
@@ -11,20 +11,29 @@ SSOT:
 2. Testnet base_url 강제 assert (mainnet 접근 차단)
 3. API key 누락 → 프로세스 시작 거부 (fail-fast)
 4. Clock 주입 (deterministic timestamp)
-5. Rate limit 헤더 기반 throttle (X-Bapi-*)
+5. Rate limit 헤더 기반 throttle (X-Bapi-*, endpoint group별 token bucket)
+6. Keep-alive 연결 풀 재사용 (요청마다 TCP+TLS handshake 방지)
 
 Exports:
 - BybitRestClient: REST API client
+- PooledHTTPAdapter: 연결 재사용/신규 카운터가 있는 HTTPAdapter
 - FatalConfigError: 설정 오류 (프로세스 시작 불가)
 - RateLimitError: Rate limit 초과
 """
 
 import hashlib
 import hmac
+import threading
 import time
 import os
 from typing import Callable, Dict, Any, Optional
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+
+from infrastructure.exchange import json_codec
+from infrastructure.exchange.latency_tracker import LatencyTracker
+from infrastructure.exchange.rate_limiter import RateLimiter
 
 
 class FatalConfigError(Exception):
@@ -49,6 +58,62 @@ class RateLimitError(Exception):
         self.retry_after = retry_after
 
 
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Keep-alive 연결 풀 HTTPAdapter (host별 연결 재사용 카운터 포함)
+
+    urllib3 connection pool의 num_connections 증가 여부로
+    요청이 신규 연결(handshake 발생)인지 재사용 연결인지 판별한다.
+    """
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 10):
+        """
+        Args:
+            pool_connections: 유지할 host별 pool 개수
+            pool_maxsize: host당 최대 keep-alive 연결 수
+        """
+        # 재시도는 BybitRestClient._make_request의 retry loop가 담당 (urllib3 retry 비활성)
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+            pool_block=False,
+        )
+        self._stats_lock = threading.Lock()
+        self._host_stats: Dict[str, Dict[str, int]] = {}
+
+    def send(self, request, **kwargs):
+        """요청 전송 + 신규/재사용 연결 카운트"""
+        pool = self.get_connection(request.url, kwargs.get("proxies"))
+        connections_before = pool.num_connections
+
+        response = super().send(request, **kwargs)
+
+        host = urlsplit(request.url).netloc
+        key = "new" if pool.num_connections > connections_before else "reused"
+        with self._stats_lock:
+            host_stats = self._host_stats.setdefault(host, {"new": 0, "reused": 0})
+            host_stats[key] += 1
+
+        return response
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        연결 재사용 통계 반환
+
+        Returns:
+            Dict: {"new_connections", "reused_connections", "per_host": {host: {"new", "reused"}}}
+        """
+        with self._stats_lock:
+            per_host = {host: dict(stats) for host, stats in self._host_stats.items()}
+
+        return {
+            "new_connections": sum(stats["new"] for stats in per_host.values()),
+            "reused_connections": sum(stats["reused"] for stats in per_host.values()),
+            "per_host": per_host,
+        }
+
+
 class BybitRestClient:
     """
     Bybit REST API Client (골격만, Contract tests only)
@@ -62,6 +127,8 @@ class BybitRestClient:
     - Testnet base_url 강제 assert
     - API key 누락 → 프로세스 시작 거부
     - Clock 주입 (determinism)
+    - Keep-alive 연결 풀 (requests.Session + PooledHTTPAdapter)
+    - Endpoint별 latency rolling window (LatencyTracker)
     """
 
     def __init__(
@@ -72,6 +139,10 @@ class BybitRestClient:
         clock: Optional[Callable[[], float]] = None,
         timeout: float = 10.0,
         max_retries: int = 3,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
     ):
         """
         Bybit REST Client 초기화
@@ -83,6 +154,10 @@ class BybitRestClient:
             clock: Timestamp 생성 함수 (기본: time.time)
             timeout: 요청 타임아웃 (초)
             max_retries: 최대 재시도 횟수
+            pool_connections: 유지할 host별 connection pool 개수 (기본: 4)
+            pool_maxsize: host당 최대 keep-alive 연결 수 (기본: 10)
+            rate_limiter: Client-side rate limiter (기본: X-Bapi-* 헤더 기반 RateLimiter)
+            latency_tracker: REST latency tracker (기본: 1분 rolling window)
 
         Raises:
             FatalConfigError: API key/secret 누락 또는 mainnet URL
@@ -120,6 +195,43 @@ class BybitRestClient:
         # Rate limit 정보 추적
         self._last_rate_limit_info: Optional[Dict[str, Any]] = None
 
+        # Client-side token bucket (거래소 거절 전에 pacing, 주문/Stop 우선)
+        self.rate_limiter = rate_limiter or RateLimiter(clock=self.clock)
+
+        # Endpoint별 REST latency (1분 rolling window → Emergency gate)
+        self.latency_tracker = latency_tracker or LatencyTracker(window_s=60.0)
+
+        # Keep-alive 연결 풀 (요청마다 TCP+TLS handshake 방지)
+        self._http_adapter = PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", self._http_adapter)
+        self._session.mount("http://", self._http_adapter)
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        연결 재사용 통계 반환
+
+        Returns:
+            Dict: {"new_connections", "reused_connections", "per_host"}
+        """
+        return self._http_adapter.get_connection_stats()
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Endpoint별/전체 REST latency 요약 (1분 window)
+
+        Returns:
+            Dict: {endpoint: {"count", "p50", "p95", "p99", "max"}, "overall": {...}}
+        """
+        return self.latency_tracker.get_summary()
+
+    def close(self) -> None:
+        """Keep-alive 연결 풀 정리 (프로세스 종료 시 호출)"""
+        self._session.close()
+
     def _get_timestamp(self) -> int:
         """
         현재 timestamp (milliseconds)
@@ -215,7 +327,8 @@ class BybitRestClient:
             Dict: 응답 JSON
 
         Raises:
-            RateLimitError: retCode 10006 (rate limit)
+            RateLimitError: retCode 10006 (rate limit) 또는 client-side token 부족
+                (background 호출만, 네트워크 호출 없이 선제 거절)
             requests.exceptions.Timeout: Timeout (max_retries 초과)
         """
         params = params or {}
@@ -236,44 +349,61 @@ class BybitRestClient:
 
         # Retry loop
         for attempt in range(self.max_retries):
+            # Client-side rate limit (critical은 대기 후 진행, background는 선제 거절)
+            granted, wait = self.rate_limiter.acquire(endpoint)
+            if not granted:
+                raise RateLimitError(
+                    f"Client-side rate limit: {endpoint}",
+                    retry_after=wait,
+                )
+
             try:
-                if method == "POST":
-                    # POST: JSON body를 직렬화해서 전송 (서명과 동일한 형식)
-                    import json
-                    json_body = json.dumps(params, separators=(',', ':'), sort_keys=True)
-                    response = requests.post(
-                        url,
-                        data=json_body,
-                        headers=headers,
-                        timeout=self.timeout,
-                    )
-                else:
-                    response = requests.get(
-                        url,
-                        params=params,
-                        headers=headers,
-                        timeout=self.timeout,
-                    )
-
-                # Rate limit 헤더 파싱
+                request_started_at = time.perf_counter()
+                try:
+                    if method == "POST":
+                        # POST: JSON body를 직렬화해서 전송 (서명과 동일한 형식)
+                        import json
+                        json_body = json.dumps(params, separators=(',', ':'), sort_keys=True)
+                        response = self._session.post(
+                            url,
+                            data=json_body,
+                            headers=headers,
+                            timeout=self.timeout,
+                        )
+                    else:
+                        response = self._session.get(
+                            url,
+                            params=params,
+                            headers=headers,
+                            timeout=self.timeout,
+                        )
+                finally:
+                    # Wall-clock latency 기록 (timeout 포함, 실패한 시도도 실제 지연)
+                    self.latency_tracker.record(endpoint, time.perf_counter() - request_started_at)
+
+                # Rate limit 헤더 파싱 (+ token bucket 보정)
                 self._parse_rate_limit_headers(response.headers)
+                self.rate_limiter.update_from_headers(endpoint, response.headers)
 
-                # 응답 처리
-                response_json = response.json()
+                # 응답 처리 (json_codec: fast backend 있으면 사용)
+                response_json = json_codec.decode_response(response)
 
                 # Phase 13b: API 응답 디버깅 (231 bytes 문제 추적)
                 if endpoint == "/v5/account/wallet-balance":
                     import logging
                     logger = logging.getLogger(__name__)
-                    logger.info(f"🔍 API Response: endpoint={endpoint}, retCode={response_json.get('retCode')}, retMsg={response_json.get('retMsg')}, len={len(str(response_json))}")
+                    logger.info(f"🔍 API Response: endpoint={endpoint}, retCode={response_json.get('retCode')}, retMsg={response_json.get('retMsg')}, len={len(response.content)}")
 
                 # retCode 10006 → RateLimitError
                 if response_json.get("retCode") == 10006:
                     retry_after = 60.0  # 기본값 60초
+                    reset_timestamp = None
                     if self._last_rate_limit_info is not None:
                         reset_timestamp = self._last_rate_limit_info.get("reset_timestamp", 0)
                         current_timestamp = self._get_timestamp()
                         retry_after = (reset_timestamp - current_timestamp) / 1000.0
+                    # 해당 endpoint group만 reset까지 차단 (다른 group은 계속 동작)
+                    self.rate_limiter.on_rate_limited(endpoint, reset_timestamp)
                     raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
 
                 return response_json
@@ -572,6 +702,9 @@ class BybitRestClient:
         symbol: Optional[str] = None,
         orderId: Optional[str] = None,  # Phase 12a-4c: orderId 필터 지원
         limit: int = 50,
+        startTime: Optional[int] = None,
+        endTime: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         거래 내역 조회 (PnL, Loss streak 계산용)
@@ -581,6 +714,9 @@ class BybitRestClient:
             symbol: 심볼 (Optional, 미지정 시 전체 조회)
             orderId: 주문 ID 필터 (Phase 12a-4c: REST API polling fallback용)
             limit: 조회 개수 (기본: 50)
+            startTime: 조회 시작 시각 (ms, Optional, WS 재연결 gap-fill용)
+            endTime: 조회 종료 시각 (ms, Optional, startTime과 간격 최대 7일)
+            cursor: 다음 페이지 cursor (이전 응답 result.nextPageCursor, Optional)
 
         Returns:
             Dict: 응답 JSON
@@ -589,7 +725,8 @@ class BybitRestClient:
                         "list": [
                             {"closedPnl": "5.0", "symbol": "BTCUSDT"},
                             {"closedPnl": "-3.0", "symbol": "BTCUSDT"}
-                        ]
+                        ],
+                        "nextPageCursor": "..."
                     }
                 }
 
@@ -606,6 +743,15 @@ class BybitRestClient:
         if orderId is not None:
             params["orderId"] = orderId
 
+        if startTime is not None:
+            params["startTime"] = startTime
+
+        if endTime is not None:
+            params["endTime"] = endTime
+
+        if cursor:
+            params["cursor"] = cursor
+
         return self._make_request("GET", "/v5/execution/list", params)
 
     def get_order_history(
@@ -640,6 +786,8 @@ class BybitRestClient:
         symbol: str = "BTCUSDT",
         interval: str = "60",
         limit: int = 200,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Kline/캔들스틱 데이터 조회 (ATR/Regime 계산용)
@@ -649,6 +797,8 @@ class BybitRestClient:
             symbol: 심볼 (기본: BTCUSDT)
             interval: 간격 (1, 3, 5, 15, 30, 60, 120, 240, 360, 720, D, W, M)
             limit: 조회 개수 (기본: 200, 최대: 1000)
+            start: 조회 시작 bar startTime (ms, Optional, 캐시 tail 조회용)
+            end: 조회 종료 시각 (ms, Optional)
 
         Returns:
             Dict: 응답 JSON
@@ -678,6 +828,12 @@ class BybitRestClient:
             "limit": limit,
         }
 
+        if start is not None:
+            params["start"] = start
+
+        if end is not None:
+            params["end"] = end
+
         return self._make_request("GET", "/v5/market/kline", params)
 
     def set_margin_mode(
@@ -10,9 +10,10 @@ SSOT:
 1. 실제 WS 연결 금지 (Phase 7에서는 contract tests만)
 2. Testnet WSS URL 강제 assert (mainnet 접근 차단)
 3. API key 누락 → 프로세스 시작 거부 (fail-fast)
-4. WS queue maxsize + overflow 정책 (실거래 함정 1)
+4. WS queue maxsize + overflow 정책 (실거래 함정 1, BoundedChannel: block/drop/spill)
 5. Clock 주입 (determinism) (실거래 함정 2)
 6. Ping-pong timeout 처리
+7. 연결 끊김 → 재연결 supervisor (jittered exponential backoff + re-auth/resubscribe + gap-fill)
 
 Exports:
 - BybitWsClient: WebSocket client
@@ -22,15 +23,21 @@ Exports:
 import time
 import hmac
 import hashlib
-import json
+import logging
 import os
+import random
 import threading
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List
 from collections import deque
+from pathlib import Path
 import websocket  # websocket-client 라이브러리
 
 # FatalConfigError는 bybit_rest_client에서 import
 from infrastructure.exchange.bybit_rest_client import FatalConfigError
+from infrastructure.exchange import json_codec
+from infrastructure.exchange.spsc_channel import BoundedChannel
+
+logger = logging.getLogger(__name__)
 
 
 class BybitWsClient:
@@ -55,6 +62,13 @@ class BybitWsClient:
         pong_timeout: float = 20.0,
         queue_maxsize: int = 1000,
         category: str = "linear",
+        reconnect_initial_backoff_s: float = 1.0,
+        reconnect_max_backoff_s: float = 30.0,
+        gap_fill_margin_s: float = 5.0,
+        rng: Optional[random.Random] = None,
+        overflow_policy: str = "block",
+        block_timeout_s: float = 5.0,
+        spill_path: Optional[Path] = None,
     ):
         """
         Bybit WS Client 초기화
@@ -67,6 +81,13 @@ class BybitWsClient:
             pong_timeout: Pong timeout (초, 기본: 20.0)
             queue_maxsize: 메시지 큐 최대 크기 (기본: 1000)
             category: Futures category ("linear" or "inverse", 기본: "linear")
+            reconnect_initial_backoff_s: 첫 재연결 대기 상한 (초, 기본: 1.0)
+            reconnect_max_backoff_s: 재연결 대기 상한 최대값 (초, 기본: 30.0)
+            gap_fill_margin_s: gap-fill 조회 시작을 disconnect 이전으로 당기는 여유 (초, 기본: 5.0)
+            rng: Backoff jitter 난수 생성기 (기본: random.Random(), 테스트 주입용)
+            overflow_policy: 큐 overflow 정책 ("block" | "drop_newest" | "drop_oldest" | "spill", 기본: block)
+            block_timeout_s: "block" 정책 최대 대기 (초, 기본: 5.0, 초과 시 drop 카운트)
+            spill_path: "spill" 정책 JSONL 경로
 
         Raises:
             FatalConfigError: API key/secret 누락 또는 mainnet URL
@@ -109,9 +130,13 @@ class BybitWsClient:
         # Ping-pong 추적
         self._last_pong_at: Optional[float] = None
 
-        # 메시지 큐 (FIFO, maxsize 제한)
-        self._message_queue: deque = deque(maxlen=queue_maxsize)
-        self._drop_count = 0  # Overflow로 드랍된 메시지 수
+        # 메시지 큐 (SPSC FIFO: WS thread → tick thread, maxsize + overflow 정책)
+        self._message_queue = BoundedChannel(
+            maxsize=queue_maxsize,
+            overflow_policy=overflow_policy,
+            block_timeout_s=block_timeout_s,
+            spill_path=spill_path,
+        )
 
         # WebSocket 연결 상태
         self._ws: Optional[websocket.WebSocketApp] = None
@@ -121,25 +146,55 @@ class BybitWsClient:
         self._subscribed = False
         self._on_message_callback: Optional[Callable[[Dict[str, Any]], None]] = None
 
+        # Private topic handler (position/wallet/order → data list)
+        # execution은 큐 경유 (tick thread에서 drain), 나머지는 WS thread에서 즉시 콜백
+        self._on_position: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self._on_wallet: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self._on_order: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+
         # Ping thread
         self._ping_thread: Optional[threading.Thread] = None
 
+        # 재연결 supervisor
+        self.reconnect_initial_backoff_s = reconnect_initial_backoff_s
+        self.reconnect_max_backoff_s = reconnect_max_backoff_s
+        self.gap_fill_margin_s = gap_fill_margin_s
+        self._rng = rng or random.Random()
+        self._stop_event = threading.Event()
+        self._disconnected_at: Optional[float] = None  # 끊김 시각 (복구 시 None)
+        self._reconnect_attempt_count = 0  # 재연결 시도 수
+        self._reconnect_count = 0  # 재연결 성공 수 (resubscribe 완료 기준)
+        self._last_time_to_recover_s: Optional[float] = None
+        self._max_time_to_recover_s = 0.0
+        self._gap_fill: Optional[Callable[[float, float], List[Dict[str, Any]]]] = None
+        self._gap_fill_event_count = 0
+
+        # 최근 execution execId (WS 수신분과 gap-fill 중복 제거용, bounded)
+        self._recent_exec_ids: deque = deque(maxlen=queue_maxsize)
+        self._recent_exec_id_set: set = set()
+
     def get_subscribe_payload(self) -> Dict[str, Any]:
         """
-        Subscribe payload 생성 (execution.{category} topic)
+        Subscribe payload 생성 (execution/position/order.{category} + wallet topic)
 
         Returns:
             Dict: Subscribe payload
 
         SSOT: docs/plans/task_plan.md Phase 7 - subscribe topic 정확성
-        Bybit V5 WebSocket Execution Topics:
-        - Linear: "execution.linear" (USDT-margined futures)
-        - Inverse: "execution.inverse" (Coin-margined futures)
+        Bybit V5 WebSocket Private Topics:
+        - "execution.{category}": 체결 (Linear: execution.linear)
+        - "position.{category}": 포지션 변경
+        - "order.{category}": 주문 상태 변경
+        - "wallet": 계정 잔고 (category 무관)
         """
-        topic = f"execution.{self.category}"
         return {
             "op": "subscribe",
-            "args": [topic],
+            "args": [
+                f"execution.{self.category}",
+                f"position.{self.category}",
+                f"order.{self.category}",
+                "wallet",
+            ],
         }
 
     def on_disconnect(self) -> None:
@@ -206,7 +261,7 @@ class BybitWsClient:
 
     def enqueue_message(self, message: Dict[str, Any]) -> None:
         """
-        메시지 큐에 추가 (overflow 시 가장 오래된 메시지 드랍)
+        메시지 큐에 추가 (overflow 시 overflow_policy 적용)
 
         Args:
             message: WS 메시지
@@ -214,12 +269,14 @@ class BybitWsClient:
         SSOT: docs/plans/task_plan.md Phase 7 - WS queue maxsize + overflow 정책
         실거래 함정 1: 큐가 무한히 쌓이면 메모리 터짐
         """
-        if len(self._message_queue) >= self.queue_maxsize:
-            # Overflow → 가장 오래된 메시지 드랍
-            self._message_queue.popleft()
-            self._drop_count += 1
-
-        self._message_queue.append(message)
+        drops_before = self._message_queue.drop_count
+        self._message_queue.put(message)
+        if self._message_queue.drop_count > drops_before:
+            # drop_oldest 포함, 드랍은 항상 ERROR로 남긴다 (체결 유실 = 포지션 상태 오염)
+            logger.error(
+                f"WS queue overflow ({self._message_queue.overflow_policy}): message dropped, "
+                f"drop_count={self._message_queue.drop_count}"
+            )
 
     def dequeue_message(self) -> Optional[Dict[str, Any]]:
         """
@@ -228,9 +285,19 @@ class BybitWsClient:
         Returns:
             Optional[Dict]: 메시지 (큐가 비어있으면 None)
         """
-        if len(self._message_queue) == 0:
-            return None
-        return self._message_queue.popleft()
+        return self._message_queue.get_nowait()
+
+    def wait_for_events(self, timeout: Optional[float] = None) -> bool:
+        """
+        메시지 도착까지 대기 (tick loop wakeup)
+
+        Args:
+            timeout: 최대 대기 (초)
+
+        Returns:
+            bool: 큐에 메시지가 있으면 True
+        """
+        return self._message_queue.wait(timeout)
 
     def get_queue_size(self) -> int:
         """
@@ -248,7 +315,16 @@ class BybitWsClient:
         Returns:
             int: Drop count
         """
-        return self._drop_count
+        return self._message_queue.drop_count
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """
+        메시지 큐 통계 (high-water mark, drop/spill count)
+
+        Returns:
+            Dict: BoundedChannel.get_stats()
+        """
+        return self._message_queue.get_stats()
 
     def _generate_auth_signature(self, expires: int) -> str:
         """
@@ -289,7 +365,7 @@ class BybitWsClient:
             "op": "auth",
             "args": [self.api_key, expires, signature],
         }
-        self._ws.send(json.dumps(auth_message))
+        self._ws.send(json_codec.dumps(auth_message))
 
     def _send_subscribe(self) -> None:
         """
@@ -302,7 +378,7 @@ class BybitWsClient:
             return
 
         subscribe_message = self.get_subscribe_payload()
-        self._ws.send(json.dumps(subscribe_message))
+        self._ws.send(json_codec.dumps(subscribe_message))
 
     def _send_ping(self) -> None:
         """
@@ -317,7 +393,7 @@ class BybitWsClient:
 
         ping_message = {"op": "ping"}
         try:
-            self._ws.send(json.dumps(ping_message))
+            self._ws.send(json_codec.dumps(ping_message))
         except Exception:
             # Ping 전송 실패 (연결 끊김) → DEGRADED
             self._degraded = True
@@ -350,17 +426,20 @@ class BybitWsClient:
         - op=subscribe 응답: {"success": true, "op": "subscribe"}
         - op=pong 응답: {"success": true, "op": "pong"}
         - execution 메시지: {"topic": "execution.{category}", "data": [...]}
+        - position/order/wallet 메시지: {"topic": "position.{category}", "data": [...]}
         """
-        try:
-            msg = json.loads(message)
-        except json.JSONDecodeError:
-            # Invalid JSON → 무시
-            return
+        # pong/ack control frame → 전체 파싱 생략 (fast path)
+        msg = json_codec.parse_control_frame(message)
+        if msg is None:
+            try:
+                msg = json_codec.loads(message)
+            except ValueError:
+                # Invalid JSON → 무시
+                return
 
-        # Debug logging (temporary)
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.debug(f"WS message received: {msg}")
+        # Debug 문자열은 DEBUG 활성 시에만 생성
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WS message received: %s", msg)
 
         op = msg.get("op")
         success = msg.get("success")
@@ -375,6 +454,7 @@ class BybitWsClient:
         # Subscribe 응답 처리
         if op == "subscribe" and success:
             self._subscribed = True
+            self._on_stream_recovered()
             return
 
         # Pong 응답 처리
@@ -385,6 +465,7 @@ class BybitWsClient:
         # Execution 메시지 처리 (topic 기반)
         topic = msg.get("topic")
         if topic and topic.startswith("execution"):
+            self._remember_exec_ids(msg.get("data", []))
             # 메시지 큐에 추가
             self.enqueue_message(msg)
             # 콜백 호출 (있으면)
@@ -392,6 +473,34 @@ class BybitWsClient:
                 self._on_message_callback(msg)
             return
 
+        # Position/Wallet/Order 메시지 처리 (typed handler)
+        if topic:
+            self._dispatch_private_topic(topic, msg.get("data", []))
+
+    def _dispatch_private_topic(self, topic: str, data: List[Dict[str, Any]]) -> None:
+        """
+        Position/Wallet/Order topic → 등록된 handler 호출
+
+        Args:
+            topic: 메시지 topic (예: "position.linear", "wallet")
+            data: 메시지 data (list)
+        """
+        if topic.startswith("position"):
+            handler = self._on_position
+        elif topic.startswith("wallet"):
+            handler = self._on_wallet
+        elif topic.startswith("order"):
+            handler = self._on_order
+        else:
+            return
+
+        if handler is None:
+            return
+        try:
+            handler(data)
+        except Exception as e:
+            logger.error(f"WS {topic} handler failed: {e}")
+
     def _on_ws_open(self, ws: websocket.WebSocketApp) -> None:
         """
         WebSocket 연결 성공 콜백
@@ -418,6 +527,7 @@ class BybitWsClient:
         self._degraded = True
         if self._degraded_entered_at is None:
             self._degraded_entered_at = self.clock()
+        self._mark_disconnected()
 
     def _on_ws_close(
         self, ws: websocket.WebSocketApp, close_status_code: int, close_msg: str
@@ -431,23 +541,177 @@ class BybitWsClient:
             close_msg: Close message
 
         SSOT: docs/plans/task_plan.md Phase 7 - close 발생 시 DEGRADED
+        재연결은 supervisor(_run_supervisor)가 backoff 후 수행
         """
         self._degraded = True
         if self._degraded_entered_at is None:
             self._degraded_entered_at = self.clock()
         self._authenticated = False
         self._subscribed = False
+        self._mark_disconnected()
+
+    # ========================================================================
+    # Reconnect Supervisor
+    # ========================================================================
+
+    def _mark_disconnected(self) -> None:
+        """끊김 시각 기록 (이미 끊김 상태면 최초 시각 유지)"""
+        if self._running and self._disconnected_at is None:
+            self._disconnected_at = self.clock()
+
+    def get_reconnect_backoff(self, attempt: int) -> float:
+        """
+        재연결 대기 시간 (jittered exponential backoff)
+
+        Args:
+            attempt: 연속 실패 횟수 (0부터)
+
+        Returns:
+            float: 대기 시간 (초), cap = min(max, initial * 2^attempt), [cap/2, cap] 균등 분포
+        """
+        cap = min(self.reconnect_max_backoff_s, self.reconnect_initial_backoff_s * (2 ** attempt))
+        return self._rng.uniform(cap / 2.0, cap)
+
+    def _create_ws_app(self) -> websocket.WebSocketApp:
+        """WebSocketApp 생성 (연결마다 새로 생성)"""
+        return websocket.WebSocketApp(
+            self.wss_url,
+            on_open=self._on_ws_open,
+            on_message=self._on_ws_message,
+            on_error=self._on_ws_error,
+            on_close=self._on_ws_close,
+        )
+
+    def _run_supervisor(self) -> None:
+        """
+        WS Thread 본체: 연결 → (끊김) → backoff → 재연결 반복 (stop() 전까지)
+
+        - 재연결 시 on_open → auth → subscribe 순서로 자동 re-auth/resubscribe
+        - 구독까지 성공했던 연결이 끊기면 backoff를 처음부터 다시 시작
+        """
+        attempt = 0
+        while self._running:
+            self._ws = self._create_ws_app()
+            self._ws.run_forever()
+
+            if not self._running:
+                break
+
+            # run_forever 반환 = 연결 종료 (on_close 미호출 케이스 포함)
+            self._authenticated = False
+            self._mark_disconnected()
+            if self._subscribed:
+                attempt = 0
+            self._subscribed = False
+
+            delay = self.get_reconnect_backoff(attempt)
+            attempt += 1
+            self._reconnect_attempt_count += 1
+            if self._stop_event.wait(delay):
+                break
 
-    def start(self, on_message_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
+    def _on_stream_recovered(self) -> None:
         """
-        WebSocket 연결 시작 (background thread)
+        Resubscribe 완료 → DEGRADED 해제 + 복구 시간 기록 + gap-fill
+
+        gap-fill 구간: [disconnected_at - gap_fill_margin_s, now]
+        """
+        disconnected_at = self._disconnected_at
+        if disconnected_at is None:
+            return
+
+        now = self.clock()
+        self._disconnected_at = None
+        self._reconnect_count += 1
+        self._last_time_to_recover_s = now - disconnected_at
+        self._max_time_to_recover_s = max(self._max_time_to_recover_s, self._last_time_to_recover_s)
+        self.on_reconnect()
+
+        if self._gap_fill is not None:
+            self.gap_fill(disconnected_at - self.gap_fill_margin_s, now)
+
+    def gap_fill(self, start_ts: float, end_ts: float) -> int:
+        """
+        끊김 구간 execution 보충 (gap-fill hook 호출 → 중복 제거 후 큐에 추가)
 
         Args:
-            on_message_callback: 메시지 수신 콜백 (Optional)
+            start_ts: 구간 시작 (seconds)
+            end_ts: 구간 종료 (seconds)
+
+        Returns:
+            int: 큐에 추가된 execution 수 (WS로 이미 수신한 execId 제외)
+        """
+        if self._gap_fill is None:
+            return 0
+
+        try:
+            executions = self._gap_fill(start_ts, end_ts)
+        except Exception as e:
+            logger.error(f"WS gap-fill failed: {e}")
+            return 0
+
+        missed = [
+            event for event in executions
+            if event.get("execId") not in self._recent_exec_id_set
+        ]
+        if not missed:
+            return 0
+
+        self._remember_exec_ids(missed)
+        self.enqueue_message({"topic": f"execution.{self.category}", "data": missed})
+        self._gap_fill_event_count += len(missed)
+        return len(missed)
+
+    def _remember_exec_ids(self, events: List[Dict[str, Any]]) -> None:
+        """execId 기록 (bounded, 가장 오래된 것부터 제거)"""
+        for event in events:
+            exec_id = event.get("execId")
+            if not exec_id or exec_id in self._recent_exec_id_set:
+                continue
+            if len(self._recent_exec_ids) == self._recent_exec_ids.maxlen:
+                self._recent_exec_id_set.discard(self._recent_exec_ids[0])
+            self._recent_exec_ids.append(exec_id)
+            self._recent_exec_id_set.add(exec_id)
+
+    def get_reconnect_stats(self) -> Dict[str, Any]:
+        """
+        재연결 통계 반환
+
+        Returns:
+            Dict: {"reconnect_attempts", "reconnect_count", "last_time_to_recover_s",
+                   "max_time_to_recover_s", "gap_fill_events", "disconnected"}
+        """
+        return {
+            "reconnect_attempts": self._reconnect_attempt_count,
+            "reconnect_count": self._reconnect_count,
+            "last_time_to_recover_s": self._last_time_to_recover_s,
+            "max_time_to_recover_s": self._max_time_to_recover_s,
+            "gap_fill_events": self._gap_fill_event_count,
+            "disconnected": self._disconnected_at is not None,
+        }
+
+    def start(
+        self,
+        on_message_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_position: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        on_wallet: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        on_order: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        gap_fill: Optional[Callable[[float, float], List[Dict[str, Any]]]] = None,
+    ) -> None:
+        """
+        WebSocket 연결 시작 (background thread, 끊기면 자동 재연결)
+
+        Args:
+            on_message_callback: execution 메시지 수신 콜백 (Optional)
+            on_position: position topic data 콜백 (예: BybitAdapter.on_position_update)
+            on_wallet: wallet topic data 콜백 (예: BybitAdapter.on_wallet_update)
+            on_order: order topic data 콜백 (예: BybitAdapter.on_order_update)
+            gap_fill: 재연결 후 끊김 구간 execution 조회 (start_ts, end_ts) → execution list
+                (예: BybitAdapter.fetch_missed_executions)
 
         SSOT: docs/plans/task_plan.md Phase 8 - Thread 모델
         - Main Thread: start() → WS Thread 시작
-        - WS Thread: connect → auth → subscribe → recv_loop
+        - WS Thread: connect → auth → subscribe → recv_loop (끊기면 backoff 후 재연결)
         - Ping Thread: 20초마다 ping 전송
         """
         if self._running:
@@ -456,18 +720,14 @@ class BybitWsClient:
 
         self._running = True
         self._on_message_callback = on_message_callback
-
-        # WebSocketApp 생성
-        self._ws = websocket.WebSocketApp(
-            self.wss_url,
-            on_open=self._on_ws_open,
-            on_message=self._on_ws_message,
-            on_error=self._on_ws_error,
-            on_close=self._on_ws_close,
-        )
-
-        # WS Thread 시작
-        self._ws_thread = threading.Thread(target=self._ws.run_forever, daemon=True)
+        self._on_position = on_position
+        self._on_wallet = on_wallet
+        self._on_order = on_order
+        self._gap_fill = gap_fill
+        self._stop_event.clear()
+
+        # WS Thread 시작 (supervisor: 연결/재연결 loop)
+        self._ws_thread = threading.Thread(target=self._run_supervisor, daemon=True)
         self._ws_thread.start()
 
         # Ping Thread 시작
@@ -484,6 +744,7 @@ class BybitWsClient:
             return
 
         self._running = False
+        self._stop_event.set()
 
         # WebSocket 연결 종료
         if self._ws:
@@ -545,19 +806,11 @@ class BybitWsClient:
         events = []
 
         # Queue에서 모든 메시지 가져오기 (FIFO 순서)
-        while self._message_queue:
-            try:
-                msg = self._message_queue.popleft()
-
-                # execution.{category} topic 필터링
-                expected_topic = f"execution.{self.category}"
-                if msg.get("topic") == expected_topic:
-                    data = msg.get("data", [])
-                    # data는 list 형식 (1개 이상의 execution event)
-                    for event in data:
-                        events.append(event)
-            except IndexError:
-                # Queue가 비어있으면 종료
-                break
+        expected_topic = f"execution.{self.category}"
+        for msg in self._message_queue.drain():
+            # execution.{category} topic 필터링
+            if msg.get("topic") == expected_topic:
+                # data는 list 형식 (1개 이상의 execution event)
+                events.extend(msg.get("data", []))
 
         return events
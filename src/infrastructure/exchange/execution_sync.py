@@ -0,0 +1,113 @@
+"""
+src/infrastructure/exchange/execution_sync.py
+Execution History Sync (cursor pagination → ExecutionStore)
+
+Purpose:
+- GET /v5/execution/list 전체 페이지를 따라가며 로컬 ExecutionStore에 누적
+- 이후 sync는 watermark(마지막 execTime) 이후만 조회 → 스크립트/복구/리스크 집계가 API 재다운로드 없이 캐시 사용
+
+Design:
+- 조회 구간: [watermark, now] (처음이면 [now - initial_lookback_ms, now])
+  - Bybit 제약: startTime~endTime 최대 7일 → 7일 단위 window로 분할
+  - window 내부는 result.nextPageCursor가 빌 때까지 같은 구간으로 반복 조회
+- watermark 시각의 체결은 다시 받아오지만 execId 중복이라 store에 추가되지 않음
+- RateLimitError 등 REST 예외는 그대로 전파 (호출자 backoff), 이번 sync 결과는 저장 안 함
+
+Exports:
+- ExecutionHistorySync: cursor 기반 증분 sync
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from infrastructure.storage.execution_store import ExecutionStore
+
+# Bybit execution list startTime ~ endTime 최대 간격 (7일)
+_MAX_WINDOW_MS = 7 * 86_400_000
+
+
+class ExecutionHistorySync:
+    """
+    Execution history 증분 sync
+
+    역할:
+    - sync(): watermark 이후 체결 전체 조회 (cursor pagination) → store append → 새 체결 반환
+    - store: 조회용 로컬 캐시 (ExecutionStore)
+    """
+
+    def __init__(
+        self,
+        rest_client: Any,
+        store: ExecutionStore,
+        category: str = "linear",
+        symbol: Optional[str] = "BTCUSDT",
+        page_limit: int = 100,
+        initial_lookback_ms: int = _MAX_WINDOW_MS,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Args:
+            rest_client: get_execution_list(category, symbol, limit, startTime, endTime, cursor) 제공자
+            store: 로컬 ExecutionStore
+            category: 카테고리 (기본: linear)
+            symbol: 심볼 (None이면 category 전체)
+            page_limit: 페이지당 조회 개수 (Bybit 최대 100)
+            initial_lookback_ms: store가 비어 있을 때 조회 시작 (now - lookback, 기본: 7일)
+            clock: 현재 시각 함수 (기본: time.time)
+        """
+        self.rest_client = rest_client
+        self.store = store
+        self.category = category
+        self.symbol = symbol
+        self.page_limit = page_limit
+        self.initial_lookback_ms = initial_lookback_ms
+        self.clock = clock or time.time
+
+        # 디버그/테스트용 카운터
+        self.request_count = 0
+
+    def sync(self, now_ms: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        watermark 이후 체결 조회 → store 반영
+
+        Args:
+            now_ms: 조회 종료 시각 (ms, 기본: clock())
+
+        Returns:
+            List[Dict]: 새로 저장된 체결 (execTime 오래된 순)
+        """
+        end_ms = int(self.clock() * 1000) if now_ms is None else now_ms
+        watermark = self.store.watermark
+        start_ms = end_ms - self.initial_lookback_ms if watermark is None else watermark
+
+        fetched: List[Dict[str, Any]] = []
+        window_start = start_ms
+        while window_start <= end_ms:
+            window_end = min(window_start + _MAX_WINDOW_MS, end_ms)
+            fetched.extend(self._fetch_window(window_start, window_end))
+            window_start = window_end + 1
+
+        return self.store.append(fetched)
+
+    def _fetch_window(self, start_ms: int, end_ms: int) -> List[Dict[str, Any]]:
+        """단일 window(≤7일) 전체 페이지 조회"""
+        rows: List[Dict[str, Any]] = []
+        cursor: Optional[str] = None
+        while True:
+            response = self.rest_client.get_execution_list(
+                category=self.category,
+                symbol=self.symbol,
+                limit=self.page_limit,
+                startTime=start_ms,
+                endTime=end_ms,
+                cursor=cursor,
+            )
+            self.request_count += 1
+            result = response.get("result", {}) or {}
+            page = result.get("list", []) or []
+            rows.extend(page)
+
+            next_cursor = result.get("nextPageCursor") or None
+            if not page or next_cursor is None or next_cursor == cursor:
+                return rows
+            cursor = next_cursor
@@ -0,0 +1,110 @@
+"""
+src/infrastructure/exchange/json_codec.py
+JSON Codec (fast backend 자동 선택 + stdlib fallback)
+
+Purpose:
+- WS frame / REST 응답 JSON 파싱 CPU·GC 비용 감소
+- orjson 설치 시 orjson 사용, 없으면 stdlib json (동작 동일)
+- WS control frame(pong/ack) 전체 파싱 생략 (fast path)
+
+Design:
+- loads(data): bytes/str → 객체 (backend별 예외는 ValueError로 통일)
+- dumps(obj): 객체 → str (WS send / spill 파일용)
+- decode_response(response): requests.Response body → 객체 (content 직접 파싱)
+- parse_control_frame(message): pong/ack 문자열이면 최소 dict 반환, 아니면 None
+
+Exports:
+- BACKEND: 사용 중인 backend 이름 ("orjson" | "json")
+- loads, dumps, decode_response, parse_control_frame
+"""
+
+import json
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional dependency (pip install orjson)
+    _orjson = None
+
+
+BACKEND = "orjson" if _orjson is not None else "json"
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    JSON 파싱
+
+    Args:
+        data: JSON bytes/str
+
+    Returns:
+        Any: 파싱 결과
+
+    Raises:
+        ValueError: 잘못된 JSON (json.JSONDecodeError / orjson.JSONDecodeError 모두 ValueError 하위)
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    JSON 직렬화 (compact)
+
+    Args:
+        obj: 직렬화 대상
+
+    Returns:
+        str: JSON 문자열
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def decode_response(response: Any) -> Any:
+    """
+    requests.Response body → 객체 (response.json() 대체)
+
+    Args:
+        response: requests.Response
+
+    Returns:
+        Any: 파싱 결과
+    """
+    return loads(response.content)
+
+
+# WS control frame (Bybit V5): 전체 파싱 없이 식별 가능한 짧은 응답
+_CONTROL_OPS = ("pong", "ping", "subscribe", "auth")
+_CONTROL_FRAME_MAX_LEN = 256
+
+
+def parse_control_frame(message: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """
+    pong/ack control frame fast path
+
+    Args:
+        message: WS raw message
+
+    Returns:
+        Optional[Dict]: control frame이면 {"op", "success"} (+ ret_msg), data frame이면 None
+            (data frame은 "topic" 키를 포함하므로 loads로 전체 파싱)
+    """
+    if isinstance(message, bytes):
+        message = message.decode("utf-8", errors="replace")
+    if len(message) > _CONTROL_FRAME_MAX_LEN or '"topic"' in message:
+        return None
+
+    for op in _CONTROL_OPS:
+        if f'"op":"{op}"' in message or f'"op": "{op}"' in message:
+            if op in ("pong", "ping"):
+                # heartbeat: 필드 사용 안 함 → 파싱 생략
+                return {"op": op, "success": True}
+            # subscribe/auth ack: success/ret_msg 필요 (연결당 1회라 파싱 비용 무시 가능)
+            try:
+                return loads(message)
+            except ValueError:
+                return None
+    return None
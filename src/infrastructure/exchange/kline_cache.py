@@ -0,0 +1,164 @@
+"""
+src/infrastructure/exchange/kline_cache.py
+Kline Disk Cache (symbol/interval별 columnar .npz 파일)
+
+Purpose:
+- 재시작(redeploy/watchdog)마다 kline 200개 재다운로드 제거
+- 시작 시 디스크에서 즉시 적재 → REST는 누락된 tail만 조회 (get_kline start)
+
+Design:
+- 파일: {directory}/{symbol}_{interval}.npz (starts int64 (n,), ohlcv float64 (5, n), oldest first)
+- save: tmp 파일 write + fsync + os.replace (atomic, 쓰기 중 crash 시 이전 파일 유지)
+- load: 파일 손상/형식 불일치 → 0 (빈 series로 시작, REST 전체 조회로 복구)
+- fetch_kline_history: 장기 구간 일괄 조회 (get_kline end를 과거로 이동하며 1000개 단위 paging)
+  → columnar 배열 (application.vectorized_indicators 입력)
+- tail_request: 캐시 마지막 bar ~ 현재 bar 구간 → get_kline(start, limit) kwargs
+  (series가 capacity 미만이거나, 누락 bar가 capacity보다 많거나, 중간 gap이 있으면
+   start 없이 최근 capacity개 조회 → merge_rows 전체 재적재)
+
+Exports:
+- KlineDiskCache: kline series 디스크 저장/복원
+- fetch_kline_history: 장기 kline 일괄 조회
+"""
+
+import os
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from infrastructure.exchange.kline_store import KlineSeries
+
+
+class KlineDiskCache:
+    """
+    Kline series 디스크 캐시
+
+    역할:
+    - load(series, symbol): 디스크 → series (적재 bar 수)
+    - save(series, symbol): series → 디스크 (atomic)
+    - tail_request(series, now_ms): 누락 tail만 조회하는 get_kline kwargs
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Args:
+            directory: 캐시 디렉토리 (없으면 첫 save 시 생성)
+        """
+        self.directory = Path(directory)
+
+    def path_for(self, symbol: str, interval: str) -> Path:
+        """symbol/interval 캐시 파일 경로"""
+        return self.directory / f"{symbol}_{interval}.npz"
+
+    def load(self, series: KlineSeries, symbol: str) -> int:
+        """
+        디스크 캐시 → series 재적재
+
+        Args:
+            series: 대상 KlineSeries (interval은 series.interval 사용)
+            symbol: 심볼 (예: "BTCUSDT")
+
+        Returns:
+            int: 적재된 bar 수 (파일 없음/손상 시 0)
+        """
+        path = self.path_for(symbol, series.interval)
+        if not path.exists():
+            return 0
+        try:
+            with np.load(path) as data:
+                starts = data["starts"]
+                ohlcv = data["ohlcv"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return 0
+        if starts.ndim != 1 or ohlcv.shape != (5, len(starts)):
+            return 0
+        return series.load_arrays(starts, ohlcv)
+
+    def save(self, series: KlineSeries, symbol: str) -> None:
+        """
+        series → 디스크 캐시 (atomic: tmp write + fsync + os.replace)
+
+        Args:
+            series: 저장할 KlineSeries
+            symbol: 심볼 (예: "BTCUSDT")
+        """
+        path = self.path_for(symbol, series.interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        starts, ohlcv = series.to_arrays()
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, starts=starts, ohlcv=ohlcv)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def tail_request(series: KlineSeries, now_ms: int) -> Dict[str, Any]:
+        """
+        누락 tail 조회 kwargs (get_kline start/limit)
+
+        Args:
+            series: 대상 KlineSeries
+            now_ms: 현재 시각 (ms)
+
+        Returns:
+            Dict: {"start": 마지막 bar startTime, "limit": 마지막 bar ~ 현재 bar 개수}
+                (series가 capacity 미만/누락 bar > capacity/중간 gap 존재/interval 길이 가변이면 {"limit": capacity})
+        """
+        last = series.last_start
+        if last is None or series.interval_ms is None or series.has_gap or len(series) < series.capacity:
+            return {"limit": series.capacity}
+        current_start = now_ms - now_ms % series.interval_ms
+        bars = (current_start - last) // series.interval_ms + 1
+        if bars > series.capacity:
+            return {"limit": series.capacity}
+        return {"start": last, "limit": max(1, int(bars))}
+
+
+def fetch_kline_history(
+    rest_client: Any,
+    start_ms: int,
+    end_ms: int,
+    symbol: str = "BTCUSDT",
+    interval: str = "60",
+    category: str = "linear",
+    page_limit: int = 1000,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    장기 kline 일괄 조회 (newest → oldest paging)
+
+    get_kline(start=start_ms, end=현재 page 끝)은 구간 내 최신 page_limit개를 반환 →
+    가장 오래된 bar 직전으로 end를 옮겨 반복 (page가 page_limit 미만이면 종료)
+
+    Args:
+        rest_client: get_kline(category, symbol, interval, limit, start, end) 제공자
+        start_ms: 조회 시작 (ms, 포함)
+        end_ms: 조회 종료 (ms, 포함)
+        symbol: 심볼 (기본: BTCUSDT)
+        interval: Kline 간격 (기본: "60")
+        category: 카테고리 (기본: linear)
+        page_limit: page당 bar 수 (Bybit 최대 1000)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (starts int64 (n,), ohlcv float64 (5, n)), oldest first, 중복 제거
+    """
+    rows_by_start: Dict[int, Any] = {}
+    page_end = end_ms
+    while page_end >= start_ms:
+        response = rest_client.get_kline(
+            category=category, symbol=symbol, interval=interval,
+            limit=page_limit, start=start_ms, end=page_end,
+        )
+        page = response.get("result", {}).get("list", []) or []
+        for row in page:
+            rows_by_start[int(row[0])] = row
+        if len(page) < page_limit:
+            break
+        page_end = min(int(row[0]) for row in page) - 1
+
+    ordered = [rows_by_start[start] for start in sorted(rows_by_start)]
+    starts = np.array([int(row[0]) for row in ordered], dtype=np.int64)
+    ohlcv = np.array([[float(row[i]) for row in ordered] for i in range(1, 6)], dtype=np.float64).reshape(5, -1)
+    return starts, ohlcv
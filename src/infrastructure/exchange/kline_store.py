@@ -0,0 +1,245 @@
+"""
+src/infrastructure/exchange/kline_store.py
+Kline Store (interval별 columnar OHLCV ring buffer)
+
+Purpose:
+- REST seed + public stream kline을 하나의 columnar 저장소로 병합 (지표 계산 SSOT)
+- ATR / MA slope 계산이 같은 float 배열을 zero-copy view로 공유
+- 새 bar만 파싱/기록 (refresh마다 200 row 전체 재파싱 제거)
+
+Design:
+- KlineSeries: start(int64) + OHLCV(float64, 5 x 2*capacity) mirrored ring buffer
+  - 모든 bar를 pos / pos+capacity 두 곳에 기록 → 최근 n개가 항상 연속 구간
+  - view(): 복사 없이 oldest-first numpy view 반환
+  - version: 기록/초기화마다 증가 → 지표 memoization key (IndicatorEngine)
+- merge_rows: REST/WS kline row 병합 (startTime 기준)
+  - start == 마지막 bar → 덮어쓰기 (진행 중 bar)
+  - start > 마지막 bar → 추가 / start < 마지막 bar → 무시 (확정 bar 불변)
+  - 누락 bar(gap)는 stream 단건 병합 시 그대로 두고, 다음 multi-row batch(REST)에서 전체 재적재로 복구
+  - multi-row batch가 마지막 bar에 이어지지 않으면 (장기 단절) 전체 재적재
+- to_arrays / load_arrays: 디스크 캐시(KlineDiskCache) 저장/복원용 columnar 배열 입출력
+- KlineStore: interval("60", "5", ...) → KlineSeries
+
+Exports:
+- KlineSeries: 단일 interval ring buffer
+- KlineStore: interval별 KlineSeries 모음
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# OHLCV row index (REST kline row: [startTime, open, high, low, close, volume, turnover])
+_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Bybit interval 문자열 → bar 길이 (ms). "M"(월봉)은 길이 가변 → gap 검사 생략
+_INTERVAL_MS = {"D": 86_400_000, "W": 604_800_000}
+
+
+def _interval_ms(interval: str) -> Optional[int]:
+    """Bybit interval ("1", "60", "D", ...) → ms (알 수 없으면 None)"""
+    if interval.isdigit():
+        return int(interval) * 60_000
+    return _INTERVAL_MS.get(interval)
+
+
+class KlineSeries:
+    """
+    단일 interval kline ring buffer (oldest first view)
+
+    역할:
+    - merge_rows(rows): REST 형식 kline row 병합 → 추가된 bar 수
+    - starts()/open()/high()/low()/close()/volume(): 최근 n개 zero-copy view
+    """
+
+    def __init__(self, interval: str, capacity: int = 200):
+        """
+        Args:
+            interval: Kline 간격 (Bybit interval 문자열, 예: "60")
+            capacity: 보관 bar 수 (기본: 200)
+        """
+        self.interval = interval
+        self.interval_ms = _interval_ms(interval)
+        self.capacity = capacity
+        self._starts = np.zeros(2 * capacity, dtype=np.int64)
+        self._ohlcv = np.zeros((len(_FIELDS), 2 * capacity), dtype=np.float64)
+        self._head = 0  # 다음 기록 위치 (0 <= head < capacity)
+        self._count = 0
+        self._has_gap = False
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def has_gap(self) -> bool:
+        """stream 병합 중 누락 bar 발생 여부 (다음 multi-row batch에서 전체 재적재)"""
+        return self._has_gap
+
+    @property
+    def last_start(self) -> Optional[int]:
+        """마지막(최신) bar startTime (ms, 비어 있으면 None)"""
+        if self._count == 0:
+            return None
+        return int(self._starts[self._head - 1 + self.capacity])
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        self._head = 0
+        self._count = 0
+        self._has_gap = False
+        self.version += 1
+
+    def _write(self, pos: int, start: int, row: Sequence[Any]) -> None:
+        """pos / pos+capacity 두 곳에 bar 기록 (mirror)"""
+        values = [float(row[i]) for i in range(1, 6)]
+        for p in (pos, pos + self.capacity):
+            self._starts[p] = start
+            self._ohlcv[:, p] = values
+        self.version += 1
+
+    def _append(self, start: int, row: Sequence[Any]) -> None:
+        last = self.last_start
+        if last is not None and self.interval_ms is not None and start > last + self.interval_ms:
+            self._has_gap = True
+        self._write(self._head, start, row)
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def merge_rows(self, rows: Sequence[Sequence[Any]]) -> int:
+        """
+        Kline row 병합 (startTime 기준)
+
+        Args:
+            rows: REST 형식 kline row 목록 (순서 무관, newest first / oldest first 모두 허용)
+
+        Returns:
+            int: 새로 추가된 bar 수 (진행 중 bar 덮어쓰기는 0)
+        """
+        if not rows:
+            return 0
+
+        last = self.last_start
+        keyed = [(int(row[0]), row) for row in rows]
+        if last is not None and len(keyed) > 1:
+            oldest = min(start for start, _ in keyed)
+            follows = oldest <= last or (self.interval_ms is not None and oldest == last + self.interval_ms)
+            if self._has_gap or not follows:
+                # 누락 bar 존재 / batch가 마지막 bar에 이어지지 않음 → batch로 전체 재적재
+                self.clear()
+                last = None
+
+        fresh = sorted((item for item in keyed if last is None or item[0] >= last), key=lambda item: item[0])
+        added = 0
+        for start, row in fresh:
+            if start == self.last_start:
+                self._write((self._head - 1) % self.capacity, start, row)
+            elif self.last_start is None or start > self.last_start:
+                self._append(start, row)
+                added += 1
+        return added
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        저장된 bar 복사본 (oldest first)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (starts int64 (n,), ohlcv float64 (5, n))
+        """
+        end = self._head + self.capacity
+        return self._starts[end - self._count:end].copy(), self._ohlcv[:, end - self._count:end].copy()
+
+    def load_arrays(self, starts: np.ndarray, ohlcv: np.ndarray) -> int:
+        """
+        columnar 배열로 전체 재적재 (기존 bar 제거, 최근 capacity개만 보관)
+
+        Args:
+            starts: startTime (ms, oldest first, shape (n,))
+            ohlcv: OHLCV (shape (5, n))
+
+        Returns:
+            int: 적재된 bar 수
+        """
+        self.clear()
+        n = min(len(starts), self.capacity)
+        if n == 0:
+            return 0
+        starts = np.asarray(starts, dtype=np.int64)[-n:]
+        ohlcv = np.asarray(ohlcv, dtype=np.float64)[:, -n:]
+        for offset in (0, self.capacity):
+            self._starts[offset:offset + n] = starts
+            self._ohlcv[:, offset:offset + n] = ohlcv
+        self._head = n % self.capacity
+        self._count = n
+        if self.interval_ms is not None and n > 1:
+            self._has_gap = bool(np.any(np.diff(starts) > self.interval_ms))
+        self.version += 1
+        return n
+
+    def _view(self, data: np.ndarray, n: Optional[int]) -> np.ndarray:
+        """최근 n개 (기본: 전체) oldest-first view"""
+        n = self._count if n is None else min(n, self._count)
+        end = self._head + self.capacity
+        return data[end - n:end]
+
+    def starts(self, n: Optional[int] = None) -> np.ndarray:
+        """startTime (ms) view"""
+        return self._view(self._starts, n)
+
+    def open(self, n: Optional[int] = None) -> np.ndarray:
+        """시가 view"""
+        return self._view(self._ohlcv[0], n)
+
+    def high(self, n: Optional[int] = None) -> np.ndarray:
+        """고가 view"""
+        return self._view(self._ohlcv[1], n)
+
+    def low(self, n: Optional[int] = None) -> np.ndarray:
+        """저가 view"""
+        return self._view(self._ohlcv[2], n)
+
+    def close(self, n: Optional[int] = None) -> np.ndarray:
+        """종가 view"""
+        return self._view(self._ohlcv[3], n)
+
+    def volume(self, n: Optional[int] = None) -> np.ndarray:
+        """거래량 view"""
+        return self._view(self._ohlcv[4], n)
+
+
+class KlineStore:
+    """
+    interval별 KlineSeries 모음
+
+    역할:
+    - series(interval): 해당 interval ring buffer (없으면 생성)
+    """
+
+    def __init__(self, capacity: int = 200):
+        """
+        Args:
+            capacity: interval별 보관 bar 수 (기본: 200)
+        """
+        self.capacity = capacity
+        self._series: Dict[str, KlineSeries] = {}
+
+    def series(self, interval: str) -> KlineSeries:
+        """
+        interval ring buffer 조회 (없으면 생성)
+
+        Args:
+            interval: Kline 간격 (예: "60")
+
+        Returns:
+            KlineSeries
+        """
+        series = self._series.get(interval)
+        if series is None:
+            series = KlineSeries(interval, capacity=self.capacity)
+            self._series[interval] = series
+        return series
+
+    def intervals(self) -> List[str]:
+        """저장 중인 interval 목록"""
+        return list(self._series.keys())
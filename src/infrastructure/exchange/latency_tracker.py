@@ -0,0 +1,149 @@
+"""
+src/infrastructure/exchange/latency_tracker.py
+REST Latency Tracker (endpoint별 rolling window, p50/p95/p99)
+
+Purpose:
+- REST 요청 wall-clock latency를 endpoint별로 기록
+- 1분 rolling window percentile 제공 → Emergency gate (latency_rest_p95 >= 5.0s)
+
+Design:
+- endpoint별 bounded ring buffer (deque maxlen) of (recorded_at, latency_s)
+- window 밖 sample은 기록/조회 시 왼쪽부터 evict (O(1) amortized)
+- percentile은 조회 시 window 내 sample 정렬 (nearest-rank, sample ≤ maxlen)
+- Thread-safe (async fan-out executor에서 동시 기록)
+
+SSOT:
+- docs/specs/account_builder_policy.md Section 7.1
+  (exchange_latency_rest_s: REST RTT p95 over 1 minute window)
+
+Exports:
+- LatencyTracker: rolling latency histogram
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+
+class LatencyTracker:
+    """
+    REST Latency Tracker (endpoint별 rolling window)
+
+    역할:
+    - record(endpoint, latency_s): sample 기록
+    - get_percentile(pct, endpoint=None): window 내 percentile (endpoint=None → 전체)
+    - get_summary(): endpoint별/전체 p50/p95/p99 + count
+    """
+
+    def __init__(
+        self,
+        window_s: float = 60.0,
+        max_samples_per_endpoint: int = 1024,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Args:
+            window_s: Rolling window 길이 (초, 기본: 60)
+            max_samples_per_endpoint: endpoint별 ring buffer 크기 (기본: 1024)
+            clock: 기록 시각 함수 (기본: time.monotonic)
+        """
+        self.window_s = window_s
+        self.max_samples_per_endpoint = max_samples_per_endpoint
+        self.clock = clock or time.monotonic
+
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[Tuple[float, float]]] = {}
+
+    def record(self, endpoint: str, latency_s: float) -> None:
+        """
+        Latency sample 기록
+
+        Args:
+            endpoint: API endpoint (예: /v5/order/create)
+            latency_s: wall-clock latency (seconds)
+        """
+        now = self.clock()
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = deque(maxlen=self.max_samples_per_endpoint)
+                self._samples[endpoint] = samples
+            samples.append((now, latency_s))
+            self._evict(samples, now)
+
+    def _evict(self, samples: Deque[Tuple[float, float]], now: float) -> None:
+        """Window 밖 sample 제거 (lock 보유 상태에서 호출)"""
+        cutoff = now - self.window_s
+        while samples and samples[0][0] < cutoff:
+            samples.popleft()
+
+    def _window_latencies(self, endpoint: Optional[str]) -> List[float]:
+        """Window 내 latency 목록 (endpoint=None → 전체)"""
+        now = self.clock()
+        with self._lock:
+            if endpoint is None:
+                buffers = list(self._samples.values())
+            else:
+                buffers = [self._samples[endpoint]] if endpoint in self._samples else []
+
+            latencies: List[float] = []
+            for samples in buffers:
+                self._evict(samples, now)
+                latencies.extend(latency for _, latency in samples)
+        return latencies
+
+    @staticmethod
+    def _nearest_rank(sorted_latencies: List[float], pct: float) -> float:
+        """Nearest-rank percentile (sorted 입력)"""
+        if not sorted_latencies:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * len(sorted_latencies)))
+        return sorted_latencies[rank - 1]
+
+    def get_percentile(self, pct: float, endpoint: Optional[str] = None) -> float:
+        """
+        Window 내 latency percentile
+
+        Args:
+            pct: Percentile (0~100, 예: 95.0)
+            endpoint: API endpoint (None이면 전체)
+
+        Returns:
+            float: latency (seconds, sample 없으면 0.0)
+        """
+        return self._nearest_rank(sorted(self._window_latencies(endpoint)), pct)
+
+    def _summarize(self, latencies: List[float]) -> Dict[str, float]:
+        """p50/p95/p99/max/count 요약"""
+        ordered = sorted(latencies)
+        return {
+            "count": len(ordered),
+            "p50": self._nearest_rank(ordered, 50.0),
+            "p95": self._nearest_rank(ordered, 95.0),
+            "p99": self._nearest_rank(ordered, 99.0),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+    def get_summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Endpoint별/전체 latency 요약
+
+        Returns:
+            Dict: {endpoint: {"count", "p50", "p95", "p99", "max"}, ..., "overall": {...}}
+                (window 내 sample 없는 endpoint는 제외)
+        """
+        with self._lock:
+            endpoints = list(self._samples.keys())
+
+        summary: Dict[str, Dict[str, float]] = {}
+        overall: List[float] = []
+        for endpoint in endpoints:
+            latencies = self._window_latencies(endpoint)
+            if latencies:
+                summary[endpoint] = self._summarize(latencies)
+                overall.extend(latencies)
+
+        summary["overall"] = self._summarize(overall)
+        return summary
@@ -34,6 +34,7 @@ class MarketDataInterface(Protocol):
       - get_ws_last_heartbeat_ts() → float (WS 마지막 heartbeat timestamp)
       - get_ws_event_drop_count() → int (WS event drop 누적 카운트)
       - get_timestamp() → float (현재 timestamp, balance staleness 계산용)
+      - get_price_drop_1m() / get_price_drop_5m() → float (Optional, 없으면 emergency.py가 0.0 처리)
 
     Phase 9 Session Risk 확장 (Optional 메서드):
       - get_btc_mark_price_usd() → float (BTC mark price USD)
@@ -0,0 +1,228 @@
+"""
+src/infrastructure/exchange/price_history.py
+Price History (시간 index ring buffer, 고정 메모리)
+
+Purpose:
+- Mark price stream을 시간 bucket 단위로 보관 → price_drop_1m/5m 실측 (Emergency gate)
+- 추가 REST 호출 없음 (ticker stream / REST ticker refresh 값 재사용)
+
+Design:
+- resolution_s 단위 bucket ring (capacity = window_s / resolution_s + 1, 고정 메모리)
+  - bucket별 close / min / max 기록, 빈 bucket은 직전 close로 carry-forward (기록 시 채움)
+- price_ago(seconds): bucket index 계산 → O(1)
+- window_min/max(seconds): min/max segment tree 구간 질의 → O(log n)
+- return_over(seconds): (현재가 - N초 전 가격) / N초 전 가격 (history 부족 시 가장 오래된 가격 기준)
+
+SSOT:
+- docs/specs/account_builder_policy.md Section 7.1
+  (price_drop_1m/5m: (current_price - price_Nm_ago) / price_Nm_ago)
+
+Exports:
+- PriceHistory: time-indexed price ring buffer
+"""
+
+import math
+import time
+from typing import Callable, List, Optional, Tuple
+
+
+class PriceHistory:
+    """
+    Time-indexed price ring buffer
+
+    역할:
+    - record(price, ts=None): 가격 기록 (같은 bucket은 close/min/max 갱신)
+    - price_ago(seconds): N초 전 bucket close (O(1))
+    - window_min/window_max(seconds): 최근 N초 min/max (O(log n))
+    - return_over(seconds): 최근 N초 수익률
+    """
+
+    def __init__(
+        self,
+        window_s: float = 900.0,
+        resolution_s: float = 1.0,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Args:
+            window_s: 보관 기간 (초, 기본: 900 = 15분)
+            resolution_s: bucket 길이 (초, 기본: 1.0)
+            clock: 조회 기준 시각 함수 (기본: time.time)
+        """
+        self.window_s = window_s
+        self.resolution_s = resolution_s
+        self.clock = clock or time.time
+        self.capacity = int(math.ceil(window_s / resolution_s)) + 1
+
+        self._close: List[float] = [0.0] * self.capacity
+        self._latest_bucket: Optional[int] = None
+        self._count = 0
+
+        # min/max segment tree (leaf = ring slot)
+        self._size = 1
+        while self._size < self.capacity:
+            self._size *= 2
+        self._tree_min: List[float] = [math.inf] * (2 * self._size)
+        self._tree_max: List[float] = [-math.inf] * (2 * self._size)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def latest_price(self) -> Optional[float]:
+        """마지막 기록 가격 (없으면 None)"""
+        if self._latest_bucket is None:
+            return None
+        return self._close[self._latest_bucket % self.capacity]
+
+    def _bucket(self, ts: float) -> int:
+        return int(ts // self.resolution_s)
+
+    def _set_slot(self, bucket: int, close: float, low: float, high: float) -> None:
+        """ring slot 기록 + segment tree 갱신"""
+        slot = bucket % self.capacity
+        self._close[slot] = close
+        i = slot + self._size
+        self._tree_min[i] = low
+        self._tree_max[i] = high
+        i //= 2
+        while i:
+            self._tree_min[i] = min(self._tree_min[2 * i], self._tree_min[2 * i + 1])
+            self._tree_max[i] = max(self._tree_max[2 * i], self._tree_max[2 * i + 1])
+            i //= 2
+
+    def record(self, price: float, ts: Optional[float] = None) -> None:
+        """
+        가격 기록
+
+        Args:
+            price: mark price
+            ts: 기록 시각 (기본: clock())
+
+        Note:
+            latest bucket보다 과거 시각은 latest bucket에 반영 (순서 역전 방어)
+        """
+        if price <= 0:
+            return
+        bucket = self._bucket(self.clock() if ts is None else ts)
+        latest = self._latest_bucket
+
+        if latest is not None and bucket <= latest:
+            slot = latest % self.capacity
+            i = slot + self._size
+            self._set_slot(latest, price, min(self._tree_min[i], price), max(self._tree_max[i], price))
+            return
+
+        if latest is not None:
+            # 빈 bucket carry-forward (최대 capacity개)
+            carry = self._close[latest % self.capacity]
+            for gap_bucket in range(max(latest + 1, bucket - self.capacity + 1), bucket):
+                self._set_slot(gap_bucket, carry, carry, carry)
+            self._count = min(self._count + (bucket - latest), self.capacity)
+        else:
+            self._count = 1
+
+        self._set_slot(bucket, price, price, price)
+        self._latest_bucket = bucket
+
+    def _resolve(self, seconds: float, clamp: bool) -> Optional[Tuple[int, int]]:
+        """N초 전 bucket → (대상 bucket, latest bucket), 보관 범위 밖이면 None (clamp=True면 oldest)"""
+        latest = self._latest_bucket
+        if latest is None:
+            return None
+        target = min(self._bucket(self.clock() - seconds), latest)
+        oldest = latest - self._count + 1
+        if target < oldest:
+            if not clamp:
+                return None
+            target = oldest
+        return target, latest
+
+    def price_ago(self, seconds: float) -> Optional[float]:
+        """
+        N초 전 가격 (해당 bucket close, O(1))
+
+        Args:
+            seconds: 조회 시점 (현재 - seconds)
+
+        Returns:
+            Optional[float]: 가격 (history 부족 시 None)
+        """
+        resolved = self._resolve(seconds, clamp=False)
+        if resolved is None:
+            return None
+        return self._close[resolved[0] % self.capacity]
+
+    def _query(self, seconds: float, tree: List[float], op: Callable, empty: float) -> Optional[float]:
+        """최근 N초 bucket 구간 질의 (ring wrap 시 2구간)"""
+        resolved = self._resolve(seconds, clamp=True)
+        if resolved is None:
+            return None
+        first, last = resolved
+        lo, hi = first % self.capacity, last % self.capacity
+        if lo <= hi:
+            return self._tree_range(tree, op, empty, lo, hi + 1)
+        return op(
+            self._tree_range(tree, op, empty, lo, self.capacity),
+            self._tree_range(tree, op, empty, 0, hi + 1),
+        )
+
+    def _tree_range(self, tree: List[float], op: Callable, empty: float, lo: int, hi: int) -> float:
+        """segment tree [lo, hi) 질의"""
+        result = empty
+        lo += self._size
+        hi += self._size
+        while lo < hi:
+            if lo & 1:
+                result = op(result, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = op(result, tree[hi])
+            lo //= 2
+            hi //= 2
+        return result
+
+    def window_min(self, seconds: float) -> Optional[float]:
+        """
+        최근 N초 최저가 (O(log n))
+
+        Args:
+            seconds: window 길이 (초)
+
+        Returns:
+            Optional[float]: 최저가 (기록 없으면 None)
+        """
+        return self._query(seconds, self._tree_min, min, math.inf)
+
+    def window_max(self, seconds: float) -> Optional[float]:
+        """
+        최근 N초 최고가 (O(log n))
+
+        Args:
+            seconds: window 길이 (초)
+
+        Returns:
+            Optional[float]: 최고가 (기록 없으면 None)
+        """
+        return self._query(seconds, self._tree_max, max, -math.inf)
+
+    def return_over(self, seconds: float) -> float:
+        """
+        최근 N초 수익률
+
+        (latest - price_N초전) / price_N초전, history가 N초보다 짧으면 가장 오래된 가격 기준
+
+        Args:
+            seconds: window 길이 (초)
+
+        Returns:
+            float: 수익률 (예: -0.12 = -12%, 기록 없으면 0.0)
+        """
+        resolved = self._resolve(seconds, clamp=True)
+        if resolved is None:
+            return 0.0
+        base = self._close[resolved[0] % self.capacity]
+        if base <= 0:
+            return 0.0
+        return (self.latest_price - base) / base
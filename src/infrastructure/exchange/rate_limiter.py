@@ -0,0 +1,325 @@
+"""
+src/infrastructure/exchange/rate_limiter.py
+Client-side Token Bucket Rate Limiter (X-Bapi-Limit 헤더 기반)
+
+Purpose:
+- 거래소가 retCode 10006으로 거절하기 전에 클라이언트에서 호출을 pacing/지연
+- endpoint group별 token bucket (Bybit V5는 endpoint 종류별로 한도가 분리됨)
+- 주문/Stop 변경(critical)이 background 조회보다 우선
+
+Design:
+- TokenBucket: capacity/refill 기반, 응답 헤더로 실시간 보정
+  - X-Bapi-Limit: 초당 한도 → capacity/refill rate
+  - X-Bapi-Limit-Status: 남은 요청 수 → 현재 token 수 (서버 값이 authoritative)
+  - X-Bapi-Limit-Reset-Timestamp: 한도 소진 시 reset 시각 → 그때까지 refill 중단
+- Priority:
+  - critical: reserve token까지 사용 가능, 부족하면 max_critical_wait_s까지 대기 후 진행
+  - background: reserve를 침범하지 않음, max_background_wait_s 초과 대기 필요 시
+    거절 (호출자가 RateLimitError(retry_after=...)로 변환, 네트워크 호출 없음)
+- Token debt 허용: 대기 후 소비는 음수 token이 되어 후속 호출을 자연스럽게 지연
+
+SSOT:
+- docs/plans/task_plan.md Phase 7 (Rate limit 헤더 처리, retCode 10006 → backoff)
+- Bybit V5 Rate Limit: https://bybit-exchange.github.io/docs/v5/rate-limit
+
+Exports:
+- TokenBucket: 단일 endpoint group bucket
+- RateLimiter: endpoint → group 라우팅 + priority 처리
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+
+# Endpoint → group (Bybit V5 한도 분류)
+ENDPOINT_GROUPS: Dict[str, str] = {
+    "/v5/order/create": "order",
+    "/v5/order/cancel": "order",
+    "/v5/order/realtime": "order_query",
+    "/v5/order/history": "order_query",
+    "/v5/position/trading-stop": "position",
+    "/v5/position/set-leverage": "position",
+    "/v5/position/list": "position",
+    "/v5/account/wallet-balance": "account",
+    "/v5/execution/list": "execution",
+    "/v5/market/tickers": "market",
+    "/v5/market/kline": "market",
+}
+
+# Group별 기본 초당 한도 (첫 응답 헤더 수신 전까지 사용, 보수적 값)
+DEFAULT_GROUP_LIMITS: Dict[str, int] = {
+    "order": 10,
+    "order_query": 50,
+    "position": 10,
+    "account": 50,
+    "execution": 50,
+    "market": 100,
+    "default": 10,
+}
+
+# 주문 발주/취소, Stop 변경: background 조회보다 우선
+CRITICAL_ENDPOINTS = frozenset({
+    "/v5/order/create",
+    "/v5/order/cancel",
+    "/v5/position/trading-stop",
+})
+
+
+class TokenBucket:
+    """
+    Token Bucket (단일 endpoint group)
+
+    - capacity: 최대 token 수 (= 초당 한도)
+    - refill_per_s: 초당 refill token 수
+    - reserve: background 호출이 침범할 수 없는 critical 전용 token 수
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        clock: Callable[[], float],
+        reserve_ratio: float = 0.2,
+    ):
+        """
+        Args:
+            capacity: 초당 한도 (token 수)
+            clock: 현재 시각 함수 (seconds)
+            reserve_ratio: critical 전용 reserve 비율 (기본: 0.2)
+        """
+        self.clock = clock
+        self.reserve_ratio = reserve_ratio
+        self.capacity = float(capacity)
+        self.refill_per_s = float(capacity)
+        self.tokens = float(capacity)
+        self._last_refill_at = clock()
+        self._blocked_until = 0.0  # 서버 한도 소진 → reset 시각까지 refill 중단
+
+    @property
+    def reserve(self) -> float:
+        """critical 전용 reserve token 수"""
+        return float(math.ceil(self.capacity * self.reserve_ratio))
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 token refill (blocked 구간은 제외)"""
+        start = max(self._last_refill_at, self._blocked_until)
+        if now > start:
+            self.tokens = min(self.capacity, self.tokens + (now - start) * self.refill_per_s)
+        self._last_refill_at = max(now, self._last_refill_at)
+
+    def wait_time(self, critical: bool) -> float:
+        """
+        token 1개 소비까지 필요한 대기 시간 (seconds)
+
+        Args:
+            critical: critical 호출 여부 (reserve 사용 가능)
+
+        Returns:
+            float: 대기 시간 (0.0이면 즉시 소비 가능)
+        """
+        now = self.clock()
+        self._refill(now)
+
+        floor = 0.0 if critical else self.reserve
+        needed = (floor + 1.0) - self.tokens
+        blocked_wait = max(0.0, self._blocked_until - now)
+
+        if needed <= 0:
+            return blocked_wait
+        return blocked_wait + needed / self.refill_per_s
+
+    def consume(self) -> None:
+        """token 1개 소비 (부족하면 debt로 기록)"""
+        self.tokens -= 1.0
+
+    def update_from_headers(
+        self,
+        limit: Optional[int],
+        remaining: Optional[int],
+        reset_timestamp_ms: Optional[int],
+    ) -> None:
+        """
+        응답 헤더로 bucket 보정 (서버 값이 authoritative)
+
+        Args:
+            limit: X-Bapi-Limit (초당 한도)
+            remaining: X-Bapi-Limit-Status (남은 요청 수)
+            reset_timestamp_ms: X-Bapi-Limit-Reset-Timestamp (ms)
+        """
+        now = self.clock()
+        self._refill(now)
+
+        if limit is not None and limit > 0:
+            self.capacity = float(limit)
+            self.refill_per_s = float(limit)
+
+        if remaining is not None:
+            self.tokens = min(self.capacity, float(remaining))
+            if remaining <= 0 and reset_timestamp_ms is not None:
+                self.block_until(reset_timestamp_ms / 1000.0)
+
+    def block_until(self, until: float) -> None:
+        """reset 시각까지 token 0 + refill 중단 (retCode 10006 대응)"""
+        self.tokens = min(self.tokens, 0.0)
+        self._blocked_until = max(self._blocked_until, until)
+
+
+class RateLimiter:
+    """
+    Client-side Rate Limiter (endpoint group별 TokenBucket)
+
+    역할:
+    - acquire(endpoint): 호출 전 token 확보 (pacing/지연/선제 거절)
+    - update_from_headers(endpoint, headers): X-Bapi-* 헤더로 bucket 보정
+    - on_rate_limited(endpoint, reset_ts): retCode 10006 수신 시 reset까지 차단
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+        group_limits: Optional[Dict[str, int]] = None,
+        reserve_ratio: float = 0.2,
+        max_critical_wait_s: float = 2.0,
+        max_background_wait_s: float = 0.25,
+    ):
+        """
+        Args:
+            clock: 현재 시각 함수 (기본: time.time, reset timestamp와 동일 기준)
+            sleep: 대기 함수 (기본: time.sleep, 테스트 주입용)
+            group_limits: group별 초기 초당 한도 (기본: DEFAULT_GROUP_LIMITS)
+            reserve_ratio: critical 전용 reserve 비율 (기본: 0.2)
+            max_critical_wait_s: critical 호출 최대 대기 (초과 시 대기 후 그대로 진행)
+            max_background_wait_s: background 호출 최대 대기 (초과 시 거절)
+        """
+        self.clock = clock or time.time
+        self.sleep = sleep or time.sleep
+        self.group_limits = dict(DEFAULT_GROUP_LIMITS)
+        if group_limits:
+            self.group_limits.update(group_limits)
+        self.reserve_ratio = reserve_ratio
+        self.max_critical_wait_s = max_critical_wait_s
+        self.max_background_wait_s = max_background_wait_s
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+        # 디버그/모니터링용 카운터
+        self.delayed_count = 0
+        self.rejected_count = 0
+
+    @staticmethod
+    def get_group(endpoint: str) -> str:
+        """Endpoint → group (미등록 endpoint는 'default')"""
+        return ENDPOINT_GROUPS.get(endpoint, "default")
+
+    @staticmethod
+    def is_critical(endpoint: str) -> bool:
+        """주문/Stop 변경 여부 (우선순위 높음)"""
+        return endpoint in CRITICAL_ENDPOINTS
+
+    def _get_bucket(self, group: str) -> TokenBucket:
+        """Group bucket lazy 생성 (lock 보유 상태에서 호출)"""
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            limit = self.group_limits.get(group, self.group_limits["default"])
+            bucket = TokenBucket(limit, clock=self.clock, reserve_ratio=self.reserve_ratio)
+            self._buckets[group] = bucket
+        return bucket
+
+    def acquire(self, endpoint: str) -> Tuple[bool, float]:
+        """
+        호출 전 token 확보
+
+        Args:
+            endpoint: API endpoint (예: /v5/order/create)
+
+        Returns:
+            Tuple[bool, float]: (granted, wait)
+                - granted=True: wait초 대기 후 token 확보 완료 (호출 진행)
+                - granted=False: background 호출의 예상 대기가 max_background_wait_s 초과
+                  → 대기/소비 없이 거절, wait = 예상 대기 시간 (retry_after)
+        """
+        critical = self.is_critical(endpoint)
+
+        with self._lock:
+            bucket = self._get_bucket(self.get_group(endpoint))
+            wait = bucket.wait_time(critical)
+
+            if not critical and wait > self.max_background_wait_s:
+                self.rejected_count += 1
+                return False, wait
+
+            # 대기 전에 token 예약 (debt) → 동시 호출 간 순서 보장
+            bucket.consume()
+            if wait > 0:
+                self.delayed_count += 1
+
+        if critical:
+            wait = min(wait, self.max_critical_wait_s)
+        if wait > 0:
+            self.sleep(wait)
+        return True, wait
+
+    def update_from_headers(self, endpoint: str, headers: Mapping[str, str]) -> None:
+        """
+        응답 헤더(X-Bapi-*)로 group bucket 보정
+
+        Args:
+            endpoint: API endpoint
+            headers: 응답 헤더
+        """
+        limit = _parse_int_header(headers, "X-Bapi-Limit")
+        remaining = _parse_int_header(headers, "X-Bapi-Limit-Status")
+        reset_timestamp = _parse_int_header(headers, "X-Bapi-Limit-Reset-Timestamp")
+
+        if limit is None and remaining is None:
+            return
+
+        with self._lock:
+            bucket = self._get_bucket(self.get_group(endpoint))
+            bucket.update_from_headers(limit, remaining, reset_timestamp)
+
+    def on_rate_limited(self, endpoint: str, reset_timestamp_ms: Optional[int]) -> None:
+        """
+        retCode 10006 수신 → 해당 group만 reset 시각까지 차단
+
+        Args:
+            endpoint: API endpoint
+            reset_timestamp_ms: reset 시각 (ms, None이면 1초 차단)
+        """
+        with self._lock:
+            bucket = self._get_bucket(self.get_group(endpoint))
+            if reset_timestamp_ms is None:
+                bucket.block_until(self.clock() + 1.0)
+            else:
+                bucket.block_until(reset_timestamp_ms / 1000.0)
+
+    def get_group_status(self) -> Dict[str, Dict[str, float]]:
+        """
+        Group별 bucket 상태 (모니터링용)
+
+        Returns:
+            Dict: {group: {"tokens", "capacity", "reserve"}}
+        """
+        with self._lock:
+            return {
+                group: {
+                    "tokens": bucket.tokens,
+                    "capacity": bucket.capacity,
+                    "reserve": bucket.reserve,
+                }
+                for group, bucket in self._buckets.items()
+            }
+
+
+def _parse_int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """헤더 값 → int (없거나 파싱 실패 시 None)"""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,292 @@
+"""
+src/infrastructure/exchange/spsc_channel.py
+Bounded SPSC Channel (WS thread → tick thread 메시지 전달)
+
+Purpose:
+- WS thread(producer)가 put, tick thread(consumer)가 drain하는 bounded FIFO
+- 메시지 도착 시 consumer 즉시 wakeup (고정 1초 sleep 대신 wait/get_async)
+- Overflow 정책 명시적 선택 (체결 이벤트 silent drop 방지)
+
+Overflow Policy:
+- "block": 공간이 생길 때까지 producer 대기 (block_timeout_s 초과 시 drop + 카운트)
+- "drop_newest": 새 메시지 드랍
+- "drop_oldest": 가장 오래된 메시지 드랍 (기존 deque(maxlen) 동작)
+- "spill": 메모리 초과분을 JSONL 파일로 spill, 공간이 생기면 순서대로 복원 (무손실)
+
+Design:
+- threading.Condition 기반 (단일 producer/단일 consumer, lock 구간 짧음)
+- spill 중에는 새 메시지도 spill 뒤에 붙임 (FIFO 보장)
+- high-water mark: 메모리 큐 + spill 합산 최대 길이
+
+Exports:
+- BoundedChannel: bounded SPSC channel
+- OVERFLOW_POLICIES: 지원 overflow 정책
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from infrastructure.exchange import json_codec
+
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest", "spill")
+
+
+class BoundedChannel:
+    """
+    Bounded SPSC Channel
+
+    역할:
+    - put(item): producer (WS thread), overflow 정책 적용
+    - drain()/get(): consumer (tick thread)
+    - wait(timeout)/get_async(): 메시지 도착 시 즉시 wakeup
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow_policy: str = "block",
+        block_timeout_s: float = 5.0,
+        spill_path: Optional[Path] = None,
+    ):
+        """
+        Args:
+            maxsize: 메모리 큐 최대 크기
+            overflow_policy: "block" | "drop_newest" | "drop_oldest" | "spill" (기본: block)
+            block_timeout_s: "block" 정책 최대 대기 (초, 초과 시 drop)
+            spill_path: "spill" 정책 JSONL 파일 경로 (필수)
+
+        Raises:
+            ValueError: 잘못된 maxsize/정책, spill 정책에 spill_path 누락
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow_policy: {overflow_policy} (expected one of {OVERFLOW_POLICIES})")
+        if overflow_policy == "spill" and spill_path is None:
+            raise ValueError("spill_path is required for overflow_policy='spill'")
+
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.block_timeout_s = block_timeout_s
+        self.spill_path = Path(spill_path) if spill_path is not None else None
+
+        self._items: Deque[Any] = deque()
+        self._cond = threading.Condition(threading.Lock())
+
+        # Spill 상태 (파일 내 미복원 라인 수 + 읽기 offset)
+        self._spilled = 0
+        self._spill_read_offset = 0
+
+        # 통계
+        self._put_count = 0
+        self._drop_count = 0
+        self._spill_count = 0
+        self._high_water_mark = 0
+
+        if self.spill_path is not None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            # 이전 실행의 잔여 spill은 새 세션과 섞지 않는다
+            self.spill_path.write_bytes(b"")
+
+    def put(self, item: Any) -> bool:
+        """
+        메시지 추가 (producer)
+
+        Args:
+            item: 메시지 (spill 정책이면 JSON 직렬화 가능해야 함)
+
+        Returns:
+            bool: 수락 여부 (spill 포함 True, drop이면 False)
+        """
+        with self._cond:
+            self._put_count += 1
+
+            if self._spilled > 0:
+                # spill 진행 중 → FIFO 유지를 위해 뒤에 붙임
+                self._spill(item)
+                return True
+
+            if len(self._items) >= self.maxsize:
+                if self.overflow_policy == "drop_newest":
+                    self._drop_count += 1
+                    return False
+                if self.overflow_policy == "drop_oldest":
+                    self._items.popleft()
+                    self._drop_count += 1
+                elif self.overflow_policy == "spill":
+                    self._spill(item)
+                    return True
+                else:  # block
+                    deadline = time.monotonic() + self.block_timeout_s
+                    while len(self._items) >= self.maxsize:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._drop_count += 1
+                            return False
+                        self._cond.wait(remaining)
+
+            self._items.append(item)
+            self._update_high_water_mark()
+            self._cond.notify_all()
+            return True
+
+    def _spill(self, item: Any) -> None:
+        """메시지를 spill 파일 끝에 추가 (lock 보유 상태에서 호출)"""
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            f.write(json_codec.dumps(item) + "\n")
+        self._spilled += 1
+        self._spill_count += 1
+        self._update_high_water_mark()
+        self._cond.notify_all()
+
+    def _restore_spilled(self) -> None:
+        """메모리 여유만큼 spill 파일에서 순서대로 복원 (lock 보유 상태에서 호출)"""
+        if self._spilled == 0 or len(self._items) >= self.maxsize:
+            return
+
+        with open(self.spill_path, "r", encoding="utf-8") as f:
+            f.seek(self._spill_read_offset)
+            while self._spilled > 0 and len(self._items) < self.maxsize:
+                line = f.readline()
+                if not line:
+                    break
+                self._items.append(json_codec.loads(line))
+                self._spilled -= 1
+            self._spill_read_offset = f.tell()
+
+        if self._spilled == 0:
+            # spill 완전 복원 → 파일 재사용
+            self.spill_path.write_bytes(b"")
+            self._spill_read_offset = 0
+
+    def _update_high_water_mark(self) -> None:
+        """high-water mark 갱신 (lock 보유 상태에서 호출)"""
+        depth = len(self._items) + self._spilled
+        if depth > self._high_water_mark:
+            self._high_water_mark = depth
+
+    def get_nowait(self) -> Optional[Any]:
+        """
+        메시지 1개 제거 (consumer, 비차단)
+
+        Returns:
+            Optional[Any]: 메시지 (비어 있으면 None)
+        """
+        with self._cond:
+            if not self._items:
+                self._restore_spilled()
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._restore_spilled()
+            self._cond.notify_all()
+            return item
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        메시지 1개 제거 (consumer, 도착할 때까지 최대 timeout 대기)
+
+        Args:
+            timeout: 최대 대기 (초, None이면 무한 대기)
+
+        Returns:
+            Optional[Any]: 메시지 (timeout 시 None)
+        """
+        if not self.wait(timeout):
+            return None
+        return self.get_nowait()
+
+    def drain(self, max_items: Optional[int] = None) -> List[Any]:
+        """
+        쌓인 메시지 일괄 제거 (consumer, 비차단, FIFO)
+
+        Args:
+            max_items: 최대 개수 (None이면 전부, spill 포함)
+
+        Returns:
+            List[Any]: 메시지 목록
+        """
+        items: List[Any] = []
+        with self._cond:
+            while max_items is None or len(items) < max_items:
+                if not self._items:
+                    self._restore_spilled()
+                    if not self._items:
+                        break
+                items.append(self._items.popleft())
+            self._restore_spilled()
+            self._cond.notify_all()
+        return items
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        메시지 도착까지 대기 (consumer wakeup)
+
+        Args:
+            timeout: 최대 대기 (초, None이면 무한 대기)
+
+        Returns:
+            bool: 메시지 존재 여부
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._items) + self._spilled > 0, timeout)
+
+    async def get_async(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        get()의 awaitable 버전 (event loop 비차단, 기본 executor에서 대기)
+
+        Args:
+            timeout: 최대 대기 (초)
+
+        Returns:
+            Optional[Any]: 메시지 (timeout 시 None)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, timeout)
+
+    def qsize(self) -> int:
+        """현재 길이 (메모리 + spill)"""
+        with self._cond:
+            return len(self._items) + self._spilled
+
+    def __len__(self) -> int:
+        return self.qsize()
+
+    @property
+    def drop_count(self) -> int:
+        """Overflow로 드랍된 메시지 수"""
+        return self._drop_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        채널 통계
+
+        Returns:
+            Dict: {"size", "maxsize", "policy", "put_count", "drop_count",
+                   "spill_count", "spilled", "high_water_mark"}
+        """
+        with self._cond:
+            return {
+                "size": len(self._items) + self._spilled,
+                "maxsize": self.maxsize,
+                "policy": self.overflow_policy,
+                "put_count": self._put_count,
+                "drop_count": self._drop_count,
+                "spill_count": self._spill_count,
+                "spilled": self._spilled,
+                "high_water_mark": self._high_water_mark,
+            }
+
+    def close(self) -> None:
+        """spill 파일 정리 (프로세스 종료 시, 미소비 spill은 유실)"""
+        if self.spill_path is not None and self.spill_path.exists() and self._spilled == 0:
+            try:
+                os.remove(self.spill_path)
+            except OSError:
+                pass
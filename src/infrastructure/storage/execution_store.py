@@ -0,0 +1,143 @@
+"""
+src/infrastructure/storage/execution_store.py
+Execution Store (append-only JSONL, execId / execTime index)
+
+Purpose:
+- Bybit execution history 로컬 캐시 (REST 재다운로드 없이 분석/복구/리스크 집계)
+- ExecutionHistorySync가 새 체결만 append, 조회는 메모리 index
+
+Design:
+- 파일: 체결 1건 = JSON 1줄 (Bybit execution 원본 dict), append-only
+- index: execId → row (중복 무시), execTime 정렬 list (bisect 범위 조회)
+- watermark: 저장된 최대 execTime (ms) → 다음 sync 시작점
+- Crash safety: 시작 시 마지막 partial line(개행 없음/JSON 파손) truncate
+
+Exports:
+- ExecutionStore: append-only execution cache
+"""
+
+import bisect
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+def _exec_time(execution: Dict[str, Any]) -> int:
+    """execTime (ms, 없으면 0)"""
+    return int(execution.get("execTime", 0) or 0)
+
+
+class ExecutionStore:
+    """
+    Append-only execution cache
+
+    역할:
+    - append(executions): 새 execId만 파일 끝에 기록 → 추가된 체결 목록
+    - get(exec_id): execId 조회 (O(1))
+    - range(start_ms, end_ms): execTime 구간 조회 (오래된 순, O(log n + k))
+    - watermark: 저장된 최대 execTime (ms, 비어 있으면 None)
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: JSONL 파일 경로 (없으면 첫 append 시 생성)
+        """
+        self.path = Path(path)
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._times: List[int] = []
+        self._rows: List[Dict[str, Any]] = []
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(list(self._rows))
+
+    @property
+    def watermark(self) -> Optional[int]:
+        """저장된 최대 execTime (ms, 비어 있으면 None)"""
+        return self._times[-1] if self._times else None
+
+    def _load(self) -> None:
+        """파일 → index (마지막 partial line은 truncate)"""
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        valid_end = 0
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            offset += len(line)
+            if not line.endswith(b"\n"):
+                break
+            try:
+                execution = json.loads(line)
+            except ValueError:
+                break
+            self._index(execution)
+            valid_end = offset
+
+        if valid_end < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_end)
+
+    def _index(self, execution: Dict[str, Any]) -> bool:
+        """index 반영 (execId 없음/중복이면 False)"""
+        exec_id = execution.get("execId")
+        if not exec_id or exec_id in self._by_id:
+            return False
+        self._by_id[exec_id] = execution
+        ts = _exec_time(execution)
+        if not self._times or ts >= self._times[-1]:
+            self._times.append(ts)
+            self._rows.append(execution)
+        else:
+            i = bisect.bisect_right(self._times, ts)
+            self._times.insert(i, ts)
+            self._rows.insert(i, execution)
+        return True
+
+    def append(self, executions: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        새 체결 기록 (execId 기준 중복 무시, 1회 write + fsync)
+
+        Args:
+            executions: Bybit execution dict 목록 (순서 무관)
+
+        Returns:
+            List[Dict]: 새로 추가된 체결 (execTime 오래된 순)
+        """
+        added = [e for e in sorted(executions, key=_exec_time) if self._index(e)]
+        if not added:
+            return added
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in added)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        return added
+
+    def get(self, exec_id: str) -> Optional[Dict[str, Any]]:
+        """execId로 체결 조회 (없으면 None)"""
+        return self._by_id.get(exec_id)
+
+    def range(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        execTime 구간 조회 (start_ms <= execTime <= end_ms)
+
+        Args:
+            start_ms: 시작 시각 (ms, None이면 처음부터)
+            end_ms: 종료 시각 (ms, None이면 끝까지)
+
+        Returns:
+            List[Dict]: 체결 목록 (오래된 순)
+        """
+        lo = 0 if start_ms is None else bisect.bisect_left(self._times, start_ms)
+        hi = len(self._times) if end_ms is None else bisect.bisect_right(self._times, end_ms)
+        return self._rows[lo:hi]
@@ -9,13 +9,37 @@ DoD:
 - Daily rotation (UTC): Handle swap with pre-rotate flush+fsync
 - Durability policy: batch (10 lines) / periodic (1s) / critical event fsync
 - Crash safety: Startup validation + truncate partial line
+
+Group commit (background_writer=True):
+- append는 bounded queue에 넣고 즉시 반환 (tick thread는 disk write/fsync 대기 없음)
+- 전용 writer thread가 queue에 쌓인 record를 모아 1회 os.write + 정책별 fsync
+- append 반환값 Future: write 완료 시 resolve (critical은 fsync 완료 후 → durable ack)
+- queue full → append block (backpressure, record 유실 없음)
 """
 
 import os
 import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+# writer thread 1회 group commit 최대 record 수
+_MAX_GROUP_COMMIT = 256
+
+
+class _Barrier:
+    """writer queue 제어 항목: 이전 record 모두 write (+ fsync) 후 future resolve"""
+
+    def __init__(self, durable: bool):
+        self.durable = durable
+        self.future: Future = Future()
+
+
+_STOP = object()
 
 
 class LogStorage:
@@ -23,11 +47,11 @@ class LogStorage:
     Log Storage (JSONL)
 
     핵심 원칙:
-    - Single syscall write per line (os.write)
-    - Durable append: flush + fsync policy (batch/periodic/critical)
+    - Single syscall write per line (os.write, group commit 시 batch당 1회)
+    - Durable append: fsync policy (batch/periodic/critical)
     - Rotation: Day boundary (UTC) handle swap with pre-rotate flush+fsync
     - Crash safety: Partial line recovery (truncate last line if JSON parse fails)
-    - Concurrency: Single writer (fd 상시 유지)
+    - Concurrency: Single writer (fd 상시 유지, background_writer면 writer thread 전용)
     """
 
     def __init__(
@@ -35,29 +59,62 @@ class LogStorage:
         log_dir: Path,
         fsync_policy: str = "batch",
         fsync_batch_size: int = 10,
+        fsync_interval_sec: float = 1.0,
+        background_writer: bool = False,
+        queue_size: int = 1024,
+        clock: Optional[Callable[[], float]] = None,
     ):
         """
         Args:
             log_dir: 로그 파일 디렉토리
             fsync_policy: fsync 정책 ("batch", "periodic", "critical")
+                - batch: fsync_batch_size 라인마다 fsync
+                - periodic: 마지막 fsync 후 fsync_interval_sec 경과 시 fsync
+                - critical: is_critical record (및 rotation/close)에서만 fsync
             fsync_batch_size: batch 정책일 때 fsync 호출 간격 (라인 수)
+            fsync_interval_sec: periodic 정책일 때 fsync 간격 (초)
+            background_writer: True면 전용 writer thread + bounded queue (group commit)
+            queue_size: writer queue 최대 길이 (가득 차면 append block)
+            clock: 단조 시계 (기본: time.monotonic, periodic 정책용)
+
+        Raises:
+            ValueError: 알 수 없는 fsync_policy
         """
+        if fsync_policy not in ("batch", "periodic", "critical"):
+            raise ValueError(f"Unknown fsync_policy: {fsync_policy}")
+
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         self.fsync_policy = fsync_policy
         self.fsync_batch_size = fsync_batch_size
+        self.fsync_interval_sec = fsync_interval_sec
+        self.clock = clock or time.monotonic
 
         # 상태
         self.current_time: datetime = datetime.now(timezone.utc)
         self.current_file_fd: Optional[int] = None
         self.current_file_path: Optional[Path] = None
-        self.append_count = 0  # batch fsync용 카운터
+        self.append_count = 0  # 마지막 fsync 이후 write된 라인 수
+        self._last_fsync_at = self.clock()
 
         # 디버그/테스트용 카운터
         self.fsync_count = 0
         self.write_syscall_count = 0
 
+        # fd/카운터 보호 (writer thread ↔ rotate/flush 호출 thread)
+        self._io_lock = threading.Lock()
+
+        # Background writer (opt-in)
+        self._queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        if background_writer:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="log-storage-writer", daemon=True
+            )
+            self._writer_thread.start()
+
         # 초기 파일 열기는 lazy (첫 append 시점에 open)
 
     def set_current_time(self, time: datetime):
@@ -79,42 +136,160 @@ class LogStorage:
         flags = os.O_APPEND | os.O_CREAT | os.O_WRONLY
         self.current_file_fd = os.open(self.current_file_path, flags, 0o644)
 
-    def append_trade_log_v1(self, log_entry: Dict[str, Any], is_critical: bool = False):
+    # ========== Write path ==========
+
+    def append_trade_log_v1(self, log_entry: Dict[str, Any], is_critical: bool = False) -> Future:
         """
         Trade Log를 JSONL로 append한다.
 
         Args:
             log_entry: Trade Log dict
             is_critical: critical event 여부 (HALT/LIQ/ADL) → 즉시 fsync
+
+        Returns:
+            Future: write 완료 시 resolve (is_critical이면 fsync 완료 후 → durable ack)
+                background_writer=False면 이미 완료된 Future
         """
+        # JSON 라인 생성 (newline 포함)
+        json_bytes = (json.dumps(log_entry) + "\n").encode("utf-8")
+
+        if self._queue is not None:
+            # Lazy open은 호출 thread에서 (파일 날짜 = append 시점, writer 처리 시점 아님)
+            if self.current_file_fd is None:
+                with self._io_lock:
+                    if self.current_file_fd is None:
+                        self._open_current_file()
+
+            # Group commit: writer thread로 넘기고 즉시 반환 (queue full → block)
+            future: Future = Future()
+            self._queue.put((json_bytes, is_critical, future))
+            return future
+
+        with self._io_lock:
+            self._write_locked(json_bytes, 1, is_critical)
+        future = Future()
+        future.set_result(None)
+        return future
+
+    def _write_locked(self, data: bytes, records: int, is_critical: bool) -> None:
+        """Single syscall write + fsync policy (호출자가 _io_lock 보유)"""
         # Lazy open: 첫 append 시점 또는 rotation 후
         if self.current_file_fd is None:
             self._open_current_file()
 
-        # JSON 라인 생성 (newline 포함)
-        json_line = json.dumps(log_entry) + "\n"
-        json_bytes = json_line.encode("utf-8")
-
-        # Single syscall write (os.write)
-        os.write(self.current_file_fd, json_bytes)
+        os.write(self.current_file_fd, data)
         self.write_syscall_count += 1
+        self.append_count += records
+
+        if is_critical or self._fsync_due():
+            self._fsync_locked()
+
+    def _fsync_due(self) -> bool:
+        """정책상 fsync 시점인지 (critical 정책은 critical record에서만)"""
+        if self.append_count == 0:
+            return False
+        if self.fsync_policy == "batch":
+            return self.append_count >= self.fsync_batch_size
+        if self.fsync_policy == "periodic":
+            return self.clock() - self._last_fsync_at >= self.fsync_interval_sec
+        return False
+
+    def _fsync_locked(self) -> None:
+        """현재 파일 fsync + 카운터 리셋 (호출자가 _io_lock 보유)"""
+        os.fsync(self.current_file_fd)
+        self.fsync_count += 1
+        self.append_count = 0
+        self._last_fsync_at = self.clock()
+
+    # ========== Background writer ==========
+
+    def _writer_loop(self) -> None:
+        """queue → group commit (STOP 수신 시 남은 항목 처리 후 종료)"""
+        while True:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout())
+            except queue.Empty:
+                # periodic: 새 record 없이 interval 경과 → 남은 dirty 라인 fsync
+                with self._io_lock:
+                    if self.current_file_fd is not None and self._fsync_due():
+                        self._fsync_locked()
+                continue
+
+            items = [item]
+            while len(items) < _MAX_GROUP_COMMIT:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
 
-        # Flush (항상 수행)
-        os.fsync(self.current_file_fd)  # Flush는 fsync에 포함됨
+            self._commit(items)
+            if any(i is _STOP for i in items):
+                return
+
+    def _idle_timeout(self) -> Optional[float]:
+        """queue 대기 timeout (periodic 정책 + dirty 라인 있을 때만)"""
+        if self.fsync_policy != "periodic" or self.append_count == 0:
+            return None
+        return max(0.0, self.fsync_interval_sec - (self.clock() - self._last_fsync_at))
+
+    def _commit(self, items: List[Any]) -> None:
+        """record 묶음 1회 write + fsync, 이후 future/barrier resolve"""
+        records: List[Tuple[bytes, bool, Future]] = [i for i in items if isinstance(i, tuple)]
+        barriers = [i for i in items if isinstance(i, _Barrier)]
+        is_critical = any(r[1] for r in records)
+        durable = any(b.durable for b in barriers)
+
+        error: Optional[BaseException] = None
+        try:
+            with self._io_lock:
+                if records:
+                    self._write_locked(b"".join(r[0] for r in records), len(records), is_critical or durable)
+                elif durable and self.current_file_fd is not None and self.append_count > 0:
+                    self._fsync_locked()
+        except OSError as e:
+            error = e
+
+        for future in [r[2] for r in records] + [b.future for b in barriers]:
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    def flush(self, durable: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        지금까지 append된 record를 모두 write (durable이면 fsync까지) 후 반환
 
-        self.append_count += 1
+        Args:
+            durable: True면 fsync까지 보장
+            timeout: background writer 대기 최대 시간 (초, None이면 무제한)
+        """
+        if self._queue is None:
+            with self._io_lock:
+                if durable and self.current_file_fd is not None and self.append_count > 0:
+                    self._fsync_locked()
+            return
 
-        # Fsync policy
-        if is_critical:
-            # Critical event → 즉시 fsync
-            os.fsync(self.current_file_fd)
-            self.fsync_count += 1
-        elif self.fsync_policy == "batch":
-            # Batch policy → N개마다 fsync
-            if self.append_count >= self.fsync_batch_size:
-                os.fsync(self.current_file_fd)
-                self.fsync_count += 1
-                self.append_count = 0
+        barrier = _Barrier(durable)
+        self._queue.put(barrier)
+        barrier.future.result(timeout=timeout)
+
+    def close(self) -> None:
+        """writer thread 종료 + 남은 record fsync + fd close"""
+        if self._queue is not None:
+            self.flush(durable=True)
+            self._queue.put(_STOP)
+            self._writer_thread.join()
+            self._queue = None
+            self._writer_thread = None
+
+        with self._io_lock:
+            if self.current_file_fd is not None:
+                if self.append_count > 0:
+                    self._fsync_locked()
+                os.close(self.current_file_fd)
+                self.current_file_fd = None
+
+    # ========== Read / Rotation ==========
 
     def read_trade_logs_v1(self, date: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -126,6 +301,10 @@ class LogStorage:
         Returns:
             List[Dict]: 로그 엔트리 리스트
         """
+        if self._queue is not None:
+            # Read-your-writes: queue에 남은 record write 후 읽기
+            self.flush(durable=False)
+
         if date:
             # 특정 날짜 파일 읽기
             filename = f"trades_{date}.jsonl"
@@ -175,29 +354,30 @@ class LogStorage:
         Day boundary (UTC)에서 rotation 수행.
 
         Rotation 절차:
-        1. 현재 파일 flush + fsync (pre-rotate)
-        2. 현재 파일 close
-        3. 새 파일 open
+        1. (background_writer) queue에 남은 record를 현재 파일에 write
+        2. 현재 파일 flush + fsync (pre-rotate)
+        3. 현재 파일 close
+        4. 새 파일 open
         """
-        # 파일이 아직 열리지 않았으면 lazy open
-        if self.current_file_path is None or self.current_file_fd is None:
-            self._open_current_file()
-            return
+        if self._queue is not None:
+            self.flush(durable=False)
 
-        new_filename = self._get_log_filename()
-        current_filename = self.current_file_path.name
+        with self._io_lock:
+            # 파일이 아직 열리지 않았으면 lazy open
+            if self.current_file_path is None or self.current_file_fd is None:
+                self._open_current_file()
+                return
 
-        if new_filename != current_filename:
-            # Day boundary 넘어감 → rotation
-            # 1. Pre-rotate flush+fsync
-            os.fsync(self.current_file_fd)
-            self.fsync_count += 1
+            new_filename = self._get_log_filename()
+            current_filename = self.current_file_path.name
 
-            # 2. Close current file
-            os.close(self.current_file_fd)
+            if new_filename != current_filename:
+                # Day boundary 넘어감 → rotation
+                # 1. Pre-rotate flush+fsync
+                self._fsync_locked()
 
-            # 3. Open new file
-            self._open_current_file()
+                # 2. Close current file
+                os.close(self.current_file_fd)
 
-            # append_count 리셋
-            self.append_count = 0
+                # 3. Open new file
+                self._open_current_file()
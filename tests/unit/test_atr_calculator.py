@@ -6,6 +6,7 @@ Purpose:
 - Kline 데이터 → ATR 계산 검증
 - ATR percentile 계산 검증
 - Grid spacing 계산 검증
+- Streaming ATR state (update/peek/history) = 전체 재계산 검증
 
 SSOT:
 - docs/plans/task_plan.md Phase 12a-2
@@ -166,3 +167,55 @@ class TestATRCalculator:
         # TR = max(50300-50100, 50300-50200, 50200-50100)
         # = max(200, 100, 100) = 200
         assert tr == 200.0
+
+
+class TestATRState:
+    """Streaming ATR state 검증 (calculate_atr와 동일 값)"""
+
+    @staticmethod
+    def _klines(count: int) -> List[Kline]:
+        klines = []
+        close = 50000.0
+        for i in range(count):
+            swing = 100.0 + (i * 37) % 250
+            close += ((i * 53) % 7 - 3) * 40.0
+            klines.append(Kline(high=close + swing / 2, low=close - swing / 2, close=close))
+        return klines
+
+    def test_update_matches_full_recompute(self):
+        """bar별 update/peek = prefix 전체 재계산"""
+        calculator = ATRCalculator()
+        klines = self._klines(60)
+        state = calculator.create_state()
+
+        for i, kline in enumerate(klines):
+            if i + 1 >= calculator.period + 1:
+                assert state.peek(kline) == calculator.calculate_atr(klines[: i + 1])
+            else:
+                assert state.peek(kline) is None
+            state.update(kline)
+
+        assert state.atr == calculator.calculate_atr(klines)
+        assert state.bar_count == 60
+
+    def test_history_matches_prefix_history(self):
+        """rolling history = 기존 prefix 재계산 history (최근 100개)"""
+        calculator = ATRCalculator()
+        klines = self._klines(200)
+        state = calculator.create_state(history_size=100)
+
+        state.backfill(klines[:-1])
+
+        expected = [calculator.calculate_atr(klines[:i]) for i in range(100, 200)]
+        assert list(state.history) == expected
+
+    def test_calculate_atr_series(self):
+        """일괄 series = bar별 calculate_atr"""
+        calculator = ATRCalculator()
+        klines = self._klines(40)
+
+        series = calculator.calculate_atr_series(klines)
+
+        assert len(series) == 40 - calculator.period
+        assert series == [calculator.calculate_atr(klines[:i]) for i in range(15, 41)]
+        assert calculator.calculate_atr_series(klines[:10]) == []
@@ -224,6 +224,80 @@ class TestBybitAdapterWebSocketIntegration:
         assert event.order_qty == 100
 
 
+class TestBybitAdapterPrivateStream:
+    """Private WS position/wallet/order topic → 캐시 반영"""
+
+    def _live_adapter(self):
+        ws_client = MagicMock()
+        ws_client.is_connected.return_value = True
+        ws_client.is_degraded.return_value = False
+        return BybitAdapter(MagicMock(), ws_client, testnet=True)
+
+    def test_position_update_normalizes_entry_price(self):
+        """WS position(entryPrice) → get_position()/get_live_position() (avgPrice)"""
+        adapter = self._live_adapter()
+
+        adapter.on_position_update([
+            {"symbol": "ETHUSDT", "side": "Sell", "size": "1", "entryPrice": "3000"},
+            {"symbol": "BTCUSDT", "side": "Buy", "size": "0.01", "entryPrice": "50000.5"},
+        ])
+
+        assert adapter.get_position()["avgPrice"] == "50000.5"
+        assert adapter.get_live_position()["size"] == "0.01"
+
+    def test_live_position_requires_healthy_stream(self):
+        """Private stream DEGRADED → get_live_position() None (REST 조회로 fallback)"""
+        adapter = self._live_adapter()
+        adapter.on_position_update([{"symbol": "BTCUSDT", "side": "Buy", "size": "0.01", "avgPrice": "50000"}])
+
+        adapter.ws_client.is_degraded.return_value = True
+
+        assert adapter.get_live_position() is None
+
+    def test_wallet_and_order_updates(self):
+        """wallet → equity/available, order 종료 상태 → open order 캐시 제거"""
+        adapter = self._live_adapter()
+
+        adapter.on_wallet_update([{"accountType": "UNIFIED", "totalEquity": "1234.5", "totalAvailableBalance": "1000.0"}])
+        adapter.on_order_update([
+            {"orderId": "a", "orderStatus": "New"},
+            {"orderId": "b", "orderStatus": "New"},
+        ])
+        adapter.on_order_update([{"orderId": "a", "orderStatus": "Filled"}])
+
+        assert adapter.get_equity_usdt() == 1234.5
+        assert adapter.get_available_usdt() == 1000.0
+        assert [o["orderId"] for o in adapter.get_open_orders()] == ["b"]
+
+    def test_live_stream_relaxes_account_polling(self):
+        """Private stream 연결 중 wallet/position은 30초가 아닌 resync 주기로만 REST 조회"""
+        adapter = self._live_adapter()
+        adapter.on_wallet_update([{"accountType": "UNIFIED", "totalEquity": "1000"}])
+        adapter.on_position_update([{"symbol": "BTCUSDT", "side": "None", "size": "0"}])
+
+        due = adapter._get_due_refreshes(time.time() + 60.0)
+
+        assert "wallet" not in due
+        assert "position" not in due
+
+    def test_fetch_missed_executions_for_gap_window(self):
+        """Gap-fill: startTime/endTime(ms)로 조회, 오래된 순 반환"""
+        adapter = self._live_adapter()
+        adapter.rest_client.get_execution_list.return_value = {
+            "result": {"list": [
+                {"execId": "b", "execTime": "1001500"},
+                {"execId": "a", "execTime": "1000500"},
+            ]}
+        }
+
+        missed = adapter.fetch_missed_executions(1000.0, 1002.0)
+
+        assert [e["execId"] for e in missed] == ["a", "b"]
+        adapter.rest_client.get_execution_list.assert_called_once_with(
+            category="linear", symbol="BTCUSDT", limit=100, startTime=1000000, endTime=1002000
+        )
+
+
 class TestBybitAdapterStateCaching:
     """State caching 동작 검증"""
 
@@ -418,3 +492,40 @@ class TestBybitAdapterSessionRiskTracking:
 
         # Assert
         assert loss_streak == 3
+
+    def test_ws_fills_accumulate_without_periodic_execution_pull(self, tmp_path):
+        """시작 시 1회 seed 후 WS 체결로 증분 누적, execution list 재조회 없음 + checkpoint 복원"""
+        # Arrange
+        rest_client = MagicMock()
+        ws_client = MagicMock()
+        now_ms = int(time.time() * 1000)
+        rest_client.get_execution_list.return_value = {
+            "result": {"list": [{"execId": "seed-1", "closedPnl": "-1.0", "execTime": str(now_ms - 5000)}]}
+        }
+        path = tmp_path / "session_risk.json"
+        adapter = BybitAdapter(rest_client, ws_client, testnet=True, session_risk_checkpoint_path=path)
+        assert adapter.get_daily_realized_pnl_usd() is None
+
+        adapter.update_market_data()
+        ws_client.get_execution_events.return_value = [
+            {
+                "execId": "ws-1", "execType": "Trade", "execQty": "0.01", "orderQty": "0.01", "leavesQty": "0",
+                "execPrice": "50000", "execValue": "500", "execFee": "0.55", "markPrice": "49990",
+                "closedSize": "0.01", "execPnl": "-2.0", "isMaker": False, "execTime": str(now_ms - 1000),
+            },
+            {"execId": "seed-1", "execType": "Trade", "closedPnl": "-1.0", "execTime": str(now_ms - 5000)},
+        ]
+        adapter.get_fill_events()
+        adapter._last_ticker_refresh_ts = 0.0
+        adapter.update_market_data()
+
+        # Assert
+        assert rest_client.get_execution_list.call_count == 1
+        assert adapter.get_daily_realized_pnl_usd() == -3.0
+        assert adapter.get_loss_streak_count() == 2
+        assert adapter.get_fee_ratio_history() == pytest.approx([2.0])
+        assert adapter.get_slippage_history()[0]["slippage_usd"] == pytest.approx(0.1)
+
+        restored = BybitAdapter(MagicMock(), MagicMock(), testnet=True, session_risk_checkpoint_path=path)
+        assert restored.get_weekly_realized_pnl_usd() == adapter.get_weekly_realized_pnl_usd()
+        assert restored.get_loss_streak_count() == 2
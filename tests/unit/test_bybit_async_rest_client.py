@@ -0,0 +1,130 @@
+"""
+tests/unit/test_bybit_async_rest_client.py
+Bybit Async REST Client - Contract Tests (네트워크 호출 0)
+
+테스트 범위:
+1. async 메서드 → sync client 위임 (동일 kwargs)
+2. fan_out 동시 실행 (N개 호출 ≈ 1 round trip)
+3. fan_out 예외 격리 (예외는 결과로 반환)
+4. BybitAdapter.update_market_data fan-out 반영
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+from infrastructure.exchange.bybit_async_rest_client import AsyncBybitRestClient
+from infrastructure.exchange.bybit_adapter import BybitAdapter
+from infrastructure.exchange.bybit_rest_client import RateLimitError
+
+
+def test_async_method_delegates_to_sync_client():
+    """async get_tickers → BybitRestClient.get_tickers (동일 kwargs)"""
+    rest_client = MagicMock()
+    rest_client.get_tickers.return_value = {"retCode": 0, "result": {"list": []}}
+    client = AsyncBybitRestClient(rest_client)
+
+    response = asyncio.run(client.get_tickers(symbol="BTCUSDT"))
+
+    assert response == {"retCode": 0, "result": {"list": []}}
+    rest_client.get_tickers.assert_called_once_with(category="linear", symbol="BTCUSDT")
+    client.close()
+
+
+def test_fan_out_runs_calls_concurrently():
+    """5개 호출(각 0.2s) → 순차 1.0s 대신 ~0.2s"""
+    barrier = threading.Barrier(5, timeout=2.0)
+
+    def slow_call(**kwargs):
+        # 5개 호출이 모두 동시에 진행 중이어야 barrier 통과
+        barrier.wait()
+        time.sleep(0.2)
+        return {"retCode": 0, "kwargs": kwargs}
+
+    rest_client = MagicMock()
+    for name in ["get_tickers", "get_wallet_balance", "get_position", "get_execution_list", "get_kline"]:
+        getattr(rest_client, name).side_effect = slow_call
+    client = AsyncBybitRestClient(rest_client, max_concurrency=5)
+
+    start = time.monotonic()
+    results = client.run_fan_out({
+        "tickers": ("get_tickers", {"symbol": "BTCUSDT"}),
+        "wallet": ("get_wallet_balance", {"accountType": "UNIFIED"}),
+        "position": ("get_position", {"symbol": "BTCUSDT"}),
+        "executions": ("get_execution_list", {"limit": 50}),
+        "kline": ("get_kline", {"interval": "60"}),
+    })
+    elapsed = time.monotonic() - start
+
+    assert list(results.keys()) == ["tickers", "wallet", "position", "executions", "kline"]
+    assert results["wallet"]["kwargs"] == {"accountType": "UNIFIED"}
+    assert elapsed < 0.6
+    client.close()
+
+
+def test_fan_out_returns_exceptions_without_cancelling_others():
+    """한 호출 실패 → Exception 결과, 나머지 결과는 보존"""
+    rest_client = MagicMock()
+    rest_client.get_tickers.side_effect = RateLimitError("Rate limit exceeded", retry_after=10.0)
+    rest_client.get_position.return_value = {"retCode": 0}
+    client = AsyncBybitRestClient(rest_client)
+
+    results = client.run_fan_out({
+        "tickers": ("get_tickers", {}),
+        "position": ("get_position", {}),
+    })
+
+    assert isinstance(results["tickers"], RateLimitError)
+    assert results["position"] == {"retCode": 0}
+    client.close()
+
+
+def test_adapter_update_market_data_uses_fan_out():
+    """async_rest_client 주입 → due 조회 전체를 1회 fan-out으로 반영"""
+    rest_client = MagicMock()
+    rest_client.get_tickers.return_value = {
+        "result": {"list": [{"markPrice": "50000.0", "indexPrice": "50001.0", "fundingRate": "0.0001"}]}
+    }
+    rest_client.get_wallet_balance.return_value = {
+        "result": {"list": [{"totalEquity": "1000.0", "totalAvailableBalance": "900.0"}]}
+    }
+    rest_client.get_position.return_value = {
+        "result": {"list": [{"side": "Buy", "size": "0.001", "avgPrice": "49500.0"}]}
+    }
+    rest_client.get_execution_list.return_value = {"result": {"list": []}}
+    rest_client.get_kline.return_value = {"result": {"list": []}}
+
+    async_client = AsyncBybitRestClient(rest_client)
+    adapter = BybitAdapter(rest_client, MagicMock(), testnet=True, async_rest_client=async_client)
+
+    adapter.update_market_data()
+
+    assert adapter.get_mark_price() == 50000.0
+    assert adapter.get_equity_usdt() == 1000.0
+    assert adapter.get_available_usdt() == 900.0
+    assert adapter.get_position()["side"] == "Buy"
+    rest_client.get_tickers.assert_called_once_with(category="linear", symbol="BTCUSDT")
+    rest_client.get_kline.assert_called_once_with(category="linear", symbol="BTCUSDT", interval="60", limit=200)
+    async_client.close()
+
+
+def test_adapter_fan_out_rate_limit_backs_off_only_failed_refresh():
+    """fan-out 중 RateLimitError → 해당 조회만 backoff, 나머지는 반영"""
+    rest_client = MagicMock()
+    rest_client.get_tickers.side_effect = RateLimitError("Rate limit exceeded", retry_after=12.0)
+    rest_client.get_wallet_balance.return_value = {
+        "result": {"list": [{"totalEquity": "1000.0", "totalAvailableBalance": "900.0"}]}
+    }
+
+    async_client = AsyncBybitRestClient(rest_client)
+    adapter = BybitAdapter(rest_client, MagicMock(), testnet=True, async_rest_client=async_client)
+
+    before = time.time()
+    adapter.update_market_data()
+
+    assert adapter._refresh_retry_ts["tickers"] >= before + 12.0
+    assert "wallet" not in adapter._refresh_retry_ts
+    assert adapter.get_mark_price() == 0.0
+    assert adapter.get_equity_usdt() == 1000.0
+    async_client.close()
@@ -0,0 +1,162 @@
+"""
+tests/unit/test_bybit_public_ws_client.py
+Bybit Public WebSocket Client - Contract Tests (네트워크 호출 0)
+
+테스트 범위:
+1. subscribe topic 정확성 (tickers.BTCUSDT, kline.60.BTCUSDT)
+2. Testnet/Mainnet WSS URL 강제 assert
+3. ticker snapshot + delta 병합 → adapter 캐시 반영
+4. kline stream → adapter kline 캐시 병합, 지표는 조회 시 lazy 재계산
+   (ATR/SMA state는 새로 확정된 bar만 반영, ticker 가격으로 MA slope tick 단위 갱신)
+5. stream이 살아 있으면 tickers REST polling 생략 (REST는 fallback)
+
+금지:
+- ❌ 실제 WS 연결 (connect 금지)
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.exchange.bybit_adapter import BybitAdapter
+from infrastructure.exchange.bybit_public_ws_client import BybitPublicWsClient
+from infrastructure.exchange.bybit_rest_client import FatalConfigError
+
+
+TESTNET_PUBLIC_URL = "wss://stream-testnet.bybit.com/v5/public/linear"
+
+
+def _make_adapter():
+    return BybitAdapter(rest_client=MagicMock(), ws_client=MagicMock(), testnet=True)
+
+
+def _rest_kline_rows(count, start_ms=1_700_000_000_000, step_ms=3_600_000):
+    """REST get_kline 형식 row (newest first)"""
+    rows = []
+    for i in range(count):
+        close = 50000.0 + i * 10.0
+        rows.append([
+            str(start_ms + i * step_ms), str(close), str(close + 100.0),
+            str(close - 100.0), str(close), "1.0", "50000.0",
+        ])
+    return list(reversed(rows))
+
+
+def test_subscribe_payload_tickers_and_kline():
+    """subscribe args = [tickers.BTCUSDT, kline.60.BTCUSDT]"""
+    client = BybitPublicWsClient(wss_url=TESTNET_PUBLIC_URL)
+
+    payload = client.get_subscribe_payload()
+
+    assert payload == {"op": "subscribe", "args": ["tickers.BTCUSDT", "kline.60.BTCUSDT"]}
+
+
+def test_mainnet_url_rejected_in_testnet_mode(monkeypatch):
+    """BYBIT_TESTNET=true + Mainnet URL → FatalConfigError"""
+    monkeypatch.setenv("BYBIT_TESTNET", "true")
+
+    with pytest.raises(FatalConfigError):
+        BybitPublicWsClient(wss_url="wss://stream.bybit.com/v5/public/linear")
+
+
+def test_ticker_snapshot_and_delta_merge_into_adapter():
+    """snapshot 후 delta(markPrice만) → 나머지 필드 유지, adapter 캐시 갱신"""
+    adapter = _make_adapter()
+    client = BybitPublicWsClient(wss_url=TESTNET_PUBLIC_URL, clock=lambda: 1000.0)
+    client._on_ticker = adapter.on_ticker_update
+
+    client.handle_message({
+        "topic": "tickers.BTCUSDT",
+        "type": "snapshot",
+        "data": {"symbol": "BTCUSDT", "markPrice": "50000.0", "indexPrice": "49990.0", "fundingRate": "0.0002"},
+    })
+    client.handle_message({
+        "topic": "tickers.BTCUSDT",
+        "type": "delta",
+        "data": {"symbol": "BTCUSDT", "markPrice": "50100.5"},
+    })
+
+    assert adapter.get_current_price() == 50100.5
+    assert adapter.get_index_price() == 49990.0
+    assert adapter.get_funding_rate() == 0.0002
+    assert client.get_ticker()["indexPrice"] == "49990.0"
+    assert client.get_last_message_at() == 1000.0
+
+
+def test_kline_stream_merges_into_adapter_cache():
+    """진행 중 bar 덮어쓰기, 새 bar 추가, 지표는 getter 조회 시에만 재계산"""
+    adapter = _make_adapter()
+    adapter._apply_refresh("kline", {"result": {"list": _rest_kline_rows(30)}}, now=0.0)
+    assert adapter.get_atr() is not None
+    latest_start = adapter._klines.last_start
+
+    client = BybitPublicWsClient(wss_url=TESTNET_PUBLIC_URL)
+    client._on_kline = adapter.on_kline_update
+    atr_computes = adapter.indicators.get_compute_counts()["atr"]
+
+    # 1) 진행 중인 최신 bar 갱신 (confirm=False) → 덮어쓰기, 조회 전까지 재계산 없음
+    client.handle_message({
+        "topic": "kline.60.BTCUSDT",
+        "type": "snapshot",
+        "data": [{"start": latest_start, "open": "50290", "high": "51000", "low": "50100",
+                  "close": "50900", "volume": "2", "turnover": "100000", "confirm": False}],
+    })
+    assert len(adapter._klines) == 30
+    assert adapter._klines.close()[-1] == 50900.0
+    assert adapter.indicators.get_compute_counts()["atr"] == atr_computes
+
+    # 2) 새 bar 확정 → 뒤에 추가, 조회 1회당 재계산 1회 (같은 bar 재조회는 memoized)
+    client.handle_message({
+        "topic": "kline.60.BTCUSDT",
+        "type": "snapshot",
+        "data": [{"start": latest_start + 3_600_000, "open": "50900", "high": "51500", "low": "50800",
+                  "close": "51400", "volume": "3", "turnover": "150000", "confirm": True}],
+    })
+    assert len(adapter._klines) == 31
+    assert adapter._klines.last_start == latest_start + 3_600_000
+    adapter.get_atr()
+    adapter.get_atr()
+    assert adapter.indicators.get_compute_counts()["atr"] == atr_computes + 1
+
+
+def test_fresh_ticker_stream_skips_rest_ticker_polling():
+    """stream ticker 수신 직후 → tickers는 due 아님 (REST는 fallback)"""
+    adapter = _make_adapter()
+
+    adapter.on_ticker_update({"markPrice": "50000.0", "indexPrice": "49990.0", "fundingRate": "0.0001"})
+
+    assert "tickers" not in adapter._get_due_refreshes(time.time())
+
+
+def test_kline_refresh_advances_atr_state_incrementally():
+    """새 bar만 ATR state에 반영, 결과는 전체 재계산과 동일"""
+    from application.atr_calculator import ATRCalculator, Kline
+
+    adapter = _make_adapter()
+    rows = _rest_kline_rows(40)
+    for i, row in enumerate(rows):
+        row[2] = str(float(row[2]) + (i * 37) % 90)
+    adapter._apply_refresh("kline", {"result": {"list": rows[1:]}}, now=0.0)
+    adapter.get_atr()
+    bars_before = adapter._atr_state.bar_count
+
+    adapter._apply_refresh("kline", {"result": {"list": rows}}, now=120.0)
+    atr = adapter.get_atr()
+
+    assert adapter._atr_state.bar_count == bars_before + 1
+    klines = [Kline(high=float(r[2]), low=float(r[3]), close=float(r[4])) for r in reversed(rows)]
+    assert atr == ATRCalculator().calculate_atr(klines)
+
+
+def test_ticker_price_updates_ma_slope_between_klines():
+    """kline 재계산 없이 ticker lastPrice만으로 MA slope/regime 갱신"""
+    adapter = _make_adapter()
+    adapter._apply_refresh("kline", {"result": {"list": _rest_kline_rows(30)}}, now=0.0)
+    slope_before = adapter.get_ma_slope_pct()
+    assert adapter.get_market_regime() is not None
+
+    adapter.on_ticker_update({"markPrice": "60000.0", "lastPrice": "60000.0"})
+
+    assert adapter.get_ma_slope_pct() > slope_before
+    assert adapter.get_ma_readings()[20].slope_pct == adapter.get_ma_slope_pct()
@@ -23,6 +23,7 @@ SSOT:
 - ❌ Mainnet 엔드포인트 접근
 """
 
+import json
 import time
 from typing import Callable
 from unittest.mock import Mock, patch
@@ -93,15 +94,15 @@ def test_place_order_payload_satisfies_bybit_spec():
     )
 
     # When: place_order() 호출 (mock response)
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {}  # 빈 딕셔너리 (rate limit 헤더 없음)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "retCode": 0,
             "retMsg": "OK",
             "result": {"orderId": "test_order_123"},
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         order_link_id = "test_link_123"
@@ -116,7 +117,6 @@ def test_place_order_payload_satisfies_bybit_spec():
         call_kwargs = mock_post.call_args.kwargs
         # POST 요청은 data= 키에 JSON 문자열로 전송됨 (V5 API)
         request_data = call_kwargs.get("data", "{}")
-        import json
         request_json = json.loads(request_data)
 
         # 필수 필드 존재
@@ -163,11 +163,11 @@ def test_order_link_id_max_length_36_chars():
         )
 
     # When/Then: orderLinkId = 36자 → 통과 (mock response)
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {}  # 빈 딕셔너리
-        mock_response.json.return_value = {"retCode": 0, "result": {}}
+        mock_response.content = json.dumps({"retCode": 0, "result": {}}).encode()
         mock_post.return_value = mock_response
 
         client.place_order(
@@ -205,14 +205,14 @@ def test_rate_limit_headers_parsed_correctly():
     )
 
     # When: Rate limit 헤더 포함한 응답 (mock)
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {
             "X-Bapi-Limit-Status": "119",  # 남은 요청 수
             "X-Bapi-Limit-Reset-Timestamp": "1640000060000",  # 리셋 시각 (60초 후)
         }
-        mock_response.json.return_value = {"retCode": 0, "result": {}}
+        mock_response.content = json.dumps({"retCode": 0, "result": {}}).encode()
         mock_post.return_value = mock_response
 
         result = client.place_order(
@@ -255,16 +255,16 @@ def test_retcode_10006_triggers_backoff():
     )
 
     # When: retCode 10006 응답 (mock)
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {
             "X-Bapi-Limit-Reset-Timestamp": "1640000060000",  # 60초 후 리셋
         }
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "retCode": 10006,
             "retMsg": "Too many visits",
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         # Then: RateLimitError 발생
@@ -311,7 +311,7 @@ def test_timeout_triggers_retry():
     )
 
     # When: Timeout 발생 (mock)
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.side_effect = requests.exceptions.Timeout("Connection timeout")
 
         # Then: TimeoutError 발생 (3회 재시도 후)
@@ -485,15 +485,15 @@ def test_cancel_order_payload_satisfies_bybit_spec():
     )
 
     # When: cancel_order() 호출 (mock response)
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {}  # 빈 딕셔너리
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "retCode": 0,
             "retMsg": "OK",
             "result": {"orderId": "cancel_order_123"},
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         client.cancel_order(
@@ -505,10 +505,60 @@ def test_cancel_order_payload_satisfies_bybit_spec():
         call_kwargs = mock_post.call_args.kwargs
         # POST 요청은 data= 키에 JSON 문자열로 전송됨 (V5 API)
         request_data = call_kwargs.get("data", "{}")
-        import json
         request_json = json.loads(request_data)
 
         # 필수 필드 존재
         assert request_json["symbol"] == "BTCUSDT"
         assert request_json["orderId"] == "test_order_123"
         assert request_json["category"] == "linear"  # Default (V5 Linear USDT)
+
+
+def test_pooled_session_counts_new_and_reused_connections():
+    """
+    Keep-alive 연결 풀: 신규/재사용 연결 카운트
+
+    검증:
+    - module-level requests.get 대신 client 소유 Session 사용
+    - 첫 요청 → 신규 연결, 이후 요청 → 재사용 연결 (host별 집계)
+    """
+    from infrastructure.exchange.bybit_rest_client import BybitRestClient
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    client = BybitRestClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        base_url="https://api-testnet.bybit.com",
+        clock=lambda: 1640000000.0,
+        pool_maxsize=4,
+    )
+
+    # Given: connection pool mock (첫 요청에서만 신규 연결 생성)
+    fake_pool = Mock()
+    fake_pool.num_connections = 0
+
+    def fake_send(self, request, **kwargs):
+        if fake_pool.num_connections == 0:
+            fake_pool.num_connections = 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"retCode": 0, "result": {"list": []}}'
+        response.request = request
+        response.url = request.url
+        return response
+
+    with patch.object(HTTPAdapter, "get_connection", return_value=fake_pool), \
+            patch.object(HTTPAdapter, "send", fake_send), \
+            patch("requests.get") as module_get:
+        client.get_tickers()
+        client.get_tickers()
+        client.get_position()
+
+        # Then: module-level requests.get 미사용 (Session 경유)
+        module_get.assert_not_called()
+
+    stats = client.get_connection_stats()
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 2
+    assert stats["per_host"]["api-testnet.bybit.com"] == {"new": 1, "reused": 2}
+    assert client._http_adapter._pool_maxsize == 4
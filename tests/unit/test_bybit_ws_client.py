@@ -189,6 +189,7 @@ def test_ws_queue_maxsize_overflow_policy():
         wss_url="wss://stream-testnet.bybit.com/v5/private",
         clock=fake_clock,
         queue_maxsize=3,  # 최대 3개
+        overflow_policy="drop_oldest",
     )
 
     # When: 4개 메시지 추가 (overflow)
@@ -304,3 +305,148 @@ def test_missing_api_key_prevents_ws_start():
             wss_url="wss://stream-testnet.bybit.com/v5/private",
             clock=fake_clock,
         )
+
+
+def test_subscribe_includes_position_wallet_order_topics():
+    """
+    Subscribe payload에 private position/order/wallet topic 포함
+
+    검증:
+    - position.linear, order.linear, wallet 구독 (REST polling 대체)
+    """
+    from infrastructure.exchange.bybit_ws_client import BybitWsClient
+
+    client = BybitWsClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        wss_url="wss://stream-testnet.bybit.com/v5/private",
+    )
+
+    args = client.get_subscribe_payload()["args"]
+
+    assert args == ["execution.linear", "position.linear", "order.linear", "wallet"]
+
+
+def test_private_topics_dispatch_to_typed_handlers():
+    """
+    position/wallet/order 메시지 → 등록된 handler 호출 (execution 큐에는 쌓이지 않음)
+    """
+    import json
+    from infrastructure.exchange.bybit_ws_client import BybitWsClient
+
+    client = BybitWsClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        wss_url="wss://stream-testnet.bybit.com/v5/private",
+    )
+    on_position, on_wallet, on_order = Mock(), Mock(), Mock()
+    client._on_position = on_position
+    client._on_wallet = on_wallet
+    client._on_order = on_order
+
+    client._on_ws_message(None, json.dumps({"topic": "position.linear", "data": [{"symbol": "BTCUSDT", "size": "0.01"}]}))
+    client._on_ws_message(None, json.dumps({"topic": "wallet", "data": [{"totalEquity": "100"}]}))
+    client._on_ws_message(None, json.dumps({"topic": "order.linear", "data": [{"orderId": "x", "orderStatus": "New"}]}))
+
+    on_position.assert_called_once_with([{"symbol": "BTCUSDT", "size": "0.01"}])
+    on_wallet.assert_called_once_with([{"totalEquity": "100"}])
+    on_order.assert_called_once_with([{"orderId": "x", "orderStatus": "New"}])
+    assert client.get_queue_size() == 0
+
+
+def test_reconnect_backoff_is_jittered_exponential_and_capped():
+    """
+    재연결 backoff: cap = min(max, initial * 2^attempt), 대기 ∈ [cap/2, cap]
+    """
+    import random
+    from infrastructure.exchange.bybit_ws_client import BybitWsClient
+
+    client = BybitWsClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        wss_url="wss://stream-testnet.bybit.com/v5/private",
+        reconnect_initial_backoff_s=1.0,
+        reconnect_max_backoff_s=8.0,
+        rng=random.Random(42),
+    )
+
+    for attempt, cap in [(0, 1.0), (1, 2.0), (2, 4.0), (3, 8.0), (10, 8.0)]:
+        delay = client.get_reconnect_backoff(attempt)
+        assert cap / 2.0 <= delay <= cap
+
+
+def test_resubscribe_after_disconnect_records_recovery_and_gap_fills():
+    """
+    끊김 → 재연결(auth/subscribe 성공) → DEGRADED 해제 + time-to-recover 기록
+    + gap-fill로 누락 execution 보충 (WS로 이미 받은 execId는 제외)
+    """
+    import json
+    from infrastructure.exchange.bybit_ws_client import BybitWsClient
+
+    current_time = [1000.0]
+    client = BybitWsClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        wss_url="wss://stream-testnet.bybit.com/v5/private",
+        clock=lambda: current_time[0],
+        gap_fill_margin_s=5.0,
+    )
+    client._running = True
+    client._ws = MagicMock()
+    gap_fill = Mock(return_value=[
+        {"execId": "e1", "execType": "Trade", "execTime": "999000"},
+        {"execId": "e2", "execType": "Trade", "execTime": "1001000"},
+    ])
+    client._gap_fill = gap_fill
+
+    # WS로 e1 수신 후 끊김
+    client._on_ws_message(None, json.dumps({"topic": "execution.linear", "data": [{"execId": "e1"}]}))
+    client.get_execution_events()
+    client._on_ws_close(None, 1006, "abnormal")
+    assert client.is_degraded() is True
+
+    # 12초 후 재연결: auth → subscribe
+    current_time[0] = 1012.0
+    client._on_ws_message(None, json.dumps({"op": "auth", "success": True}))
+    client._on_ws_message(None, json.dumps({"op": "subscribe", "success": True}))
+
+    assert client.is_degraded() is False
+    gap_fill.assert_called_once_with(995.0, 1012.0)
+    assert [e["execId"] for e in client.get_execution_events()] == ["e2"]
+
+    stats = client.get_reconnect_stats()
+    assert stats["reconnect_count"] == 1
+    assert stats["last_time_to_recover_s"] == 12.0
+    assert stats["gap_fill_events"] == 1
+    assert stats["disconnected"] is False
+
+
+def test_supervisor_reconnects_until_stopped():
+    """
+    run_forever 반환(연결 끊김) → backoff 후 새 WebSocketApp으로 재연결
+    """
+    from infrastructure.exchange.bybit_ws_client import BybitWsClient
+
+    client = BybitWsClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        wss_url="wss://stream-testnet.bybit.com/v5/private",
+        reconnect_initial_backoff_s=0.0,
+    )
+    apps = []
+
+    def fake_create_ws_app():
+        app = MagicMock()
+        apps.append(app)
+        if len(apps) == 3:
+            # 세 번째 연결에서 종료 요청
+            app.run_forever.side_effect = lambda: setattr(client, "_running", False)
+        return app
+
+    client._create_ws_app = fake_create_ws_app
+    client._running = True
+
+    client._run_supervisor()
+
+    assert len(apps) == 3
+    assert client.get_reconnect_stats()["reconnect_attempts"] == 2
@@ -0,0 +1,57 @@
+"""
+tests/unit/test_execution_store.py
+Execution Store 테스트 (append-only JSONL cache)
+
+테스트 범위:
+1. append: execId 중복 무시, 재시작 후 index 복원
+2. range/watermark: execTime 구간 조회 (순서 역전 append 포함)
+3. Crash safety: 마지막 partial line truncate 후 append 정상
+"""
+
+from infrastructure.storage.execution_store import ExecutionStore
+
+
+def _execution(exec_id, exec_time_ms):
+    return {"execId": exec_id, "execTime": str(exec_time_ms), "execPrice": "50000", "execQty": "0.001"}
+
+
+def test_append_dedup_and_reload(tmp_path):
+    """같은 execId 재 append → 무시, 재시작 시 동일 index"""
+    path = tmp_path / "executions.jsonl"
+    store = ExecutionStore(path)
+
+    added = store.append([_execution("b", 2000), _execution("a", 1000)])
+    assert [e["execId"] for e in added] == ["a", "b"]
+    assert store.append([_execution("a", 1000), _execution("c", 3000)]) == [_execution("c", 3000)]
+
+    reloaded = ExecutionStore(path)
+    assert len(reloaded) == 3
+    assert reloaded.get("b") == _execution("b", 2000)
+    assert reloaded.watermark == 3000
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_range_and_out_of_order_append(tmp_path):
+    """늦게 도착한 과거 체결도 시간순 index에 삽입"""
+    store = ExecutionStore(tmp_path / "executions.jsonl")
+    store.append([_execution("a", 1000), _execution("c", 3000)])
+    store.append([_execution("b", 2000)])
+
+    assert [e["execId"] for e in store.range()] == ["a", "b", "c"]
+    assert [e["execId"] for e in store.range(1500, 3000)] == ["b", "c"]
+    assert [e["execId"] for e in store.range(end_ms=1999)] == ["a"]
+    assert store.watermark == 3000
+
+
+def test_partial_line_truncated_on_load(tmp_path):
+    """crash로 잘린 마지막 줄 → 시작 시 truncate, 이후 append 정상"""
+    path = tmp_path / "executions.jsonl"
+    ExecutionStore(path).append([_execution("a", 1000)])
+    with open(path, "a") as f:
+        f.write('{"execId": "b", "execTi')
+
+    store = ExecutionStore(path)
+    assert len(store) == 1
+    store.append([_execution("b", 2000)])
+
+    assert [e["execId"] for e in ExecutionStore(path).range()] == ["a", "b"]
@@ -0,0 +1,107 @@
+"""
+tests/unit/test_execution_sync.py
+Execution History Sync 테스트 (cursor pagination, 네트워크 호출 0)
+
+테스트 범위:
+1. cursor를 따라 전체 페이지 조회 → store 저장
+2. 두 번째 sync는 watermark 이후만 조회 (새 체결만 반환)
+3. 7일 초과 구간 → window 분할
+4. BybitAdapter: 캐시 기반 session risk seed + gap-fill
+"""
+
+import time
+from unittest.mock import MagicMock
+
+from infrastructure.exchange.bybit_adapter import BybitAdapter
+from infrastructure.exchange.execution_sync import ExecutionHistorySync
+from infrastructure.storage.execution_store import ExecutionStore
+
+DAY_MS = 86_400_000
+NOW_MS = 1_800_000_000_000
+
+
+class FakeExecutionApi:
+    """get_execution_list (startTime/endTime/cursor, 최신순 페이지)"""
+
+    def __init__(self, executions, page_size=2):
+        self.executions = executions
+        self.page_size = page_size
+        self.calls = []
+
+    def get_execution_list(self, category, symbol, limit, startTime, endTime, cursor=None):
+        self.calls.append({"startTime": startTime, "endTime": endTime, "cursor": cursor})
+        rows = sorted(
+            (e for e in self.executions if startTime <= int(e["execTime"]) <= endTime),
+            key=lambda e: int(e["execTime"]),
+            reverse=True,
+        )
+        offset = int(cursor or 0)
+        page = rows[offset:offset + self.page_size]
+        next_cursor = str(offset + self.page_size) if offset + self.page_size < len(rows) else ""
+        return {"result": {"list": page, "nextPageCursor": next_cursor}}
+
+
+def _execution(exec_id, exec_time_ms, closed_pnl=None):
+    execution = {"execId": exec_id, "execType": "Trade", "execTime": str(exec_time_ms), "execPrice": "50000"}
+    if closed_pnl is not None:
+        execution["closedPnl"] = str(closed_pnl)
+    return execution
+
+
+def test_sync_follows_cursor_then_fetches_only_new(tmp_path):
+    """5건 / page 2 → 3 request, 재 sync는 watermark 이후 새 체결만"""
+    api = FakeExecutionApi([_execution(f"e{i}", NOW_MS - DAY_MS + i * 1000) for i in range(5)])
+    sync = ExecutionHistorySync(api, ExecutionStore(tmp_path / "executions.jsonl"))
+
+    added = sync.sync(now_ms=NOW_MS)
+    assert [e["execId"] for e in added] == ["e0", "e1", "e2", "e3", "e4"]
+    assert sync.request_count == 3
+    assert [c["cursor"] for c in api.calls] == [None, "2", "4"]
+
+    api.executions.append(_execution("e5", NOW_MS + 1000))
+    api.calls.clear()
+    added = sync.sync(now_ms=NOW_MS + 2000)
+
+    assert [e["execId"] for e in added] == ["e5"]
+    assert api.calls[0]["startTime"] == NOW_MS - DAY_MS + 4000  # watermark
+    assert len(sync.store) == 6
+
+
+def test_sync_splits_long_range_into_7_day_windows(tmp_path):
+    """lookback 20일 → 7일 window 3개, 구간 경계 겹침 없음"""
+    api = FakeExecutionApi([_execution("old", NOW_MS - 15 * DAY_MS), _execution("new", NOW_MS - DAY_MS)])
+    sync = ExecutionHistorySync(api, ExecutionStore(tmp_path / "executions.jsonl"), initial_lookback_ms=20 * DAY_MS)
+
+    added = sync.sync(now_ms=NOW_MS)
+
+    assert [e["execId"] for e in added] == ["old", "new"]
+    windows = [(c["startTime"], c["endTime"]) for c in api.calls]
+    assert len(windows) == 3
+    assert all(end - start <= 7 * DAY_MS for start, end in windows)
+    assert all(windows[i][1] + 1 == windows[i + 1][0] for i in range(2))
+    assert windows[-1][1] == NOW_MS
+
+
+def test_adapter_seeds_session_risk_and_gap_fills_from_cache(tmp_path):
+    """50건 초과 체결도 weekly PnL 반영, gap-fill은 캐시 구간 조회"""
+    now_ms = int(time.time() * 1000)
+    executions = [_execution(f"e{i}", now_ms - 60_000 + i * 100, closed_pnl=-1.0) for i in range(80)]
+    api = FakeExecutionApi(executions, page_size=50)
+    store = ExecutionStore(tmp_path / "executions.jsonl")
+    rest_client = MagicMock()
+    rest_client.get_kline.return_value = {"result": {"list": []}}
+    adapter = BybitAdapter(
+        rest_client, MagicMock(), testnet=True,
+        execution_sync=ExecutionHistorySync(api, store),
+    )
+
+    adapter.update_market_data()
+
+    rest_client.get_execution_list.assert_not_called()
+    assert len(store) == 80
+    assert adapter.get_loss_streak_count() == 80
+    assert adapter.get_daily_realized_pnl_usd() in (-80.0, 0.0)  # 0.0: 테스트가 UTC 자정 직후 실행된 경우
+
+    api.executions.append(_execution("gap", now_ms - 50, closed_pnl=2.0))
+    missed = adapter.fetch_missed_executions((now_ms - 100) / 1000.0, now_ms / 1000.0)
+    assert [e["execId"] for e in missed] == ["gap"]
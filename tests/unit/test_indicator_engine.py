@@ -0,0 +1,91 @@
+"""
+tests/unit/test_indicator_engine.py
+Indicator Engine Unit Tests (lazy dependency graph)
+
+테스트 범위:
+1. get 시에만 계산, 같은 bar/입력이면 memoized
+2. kline 변경 → 해당 interval 지표 + 하위 지표만 재계산 (다른 interval은 유지)
+3. input 변경 → 의존 지표만 재계산, 같은 값 재설정은 무효화 없음
+4. None → default, 중복 등록 거절
+"""
+
+import pytest
+
+from application.indicator_engine import IndicatorEngine
+from infrastructure.exchange.kline_store import KlineStore
+
+START_MS = 1_700_000_000_000
+
+
+def _row(start_ms, close):
+    return [str(start_ms), str(close), str(close + 10.0), str(close - 10.0), str(close), "1.0", "1.0"]
+
+
+def _engine():
+    store = KlineStore(capacity=50)
+    store.series("1").merge_rows([_row(START_MS + i * 60_000, 100.0 + i) for i in range(5)])
+    store.series("60").merge_rows([_row(START_MS + i * 3_600_000, 200.0 + i) for i in range(5)])
+
+    engine = IndicatorEngine(store)
+    engine.register("close_1m", lambda series, deps: float(series.close()[-1]), interval="1")
+    engine.register("close_1h", lambda series, deps: float(series.close()[-1]), interval="60")
+    engine.register(
+        "spread",
+        lambda _, deps: deps["close_1h"] - deps["close_1m"],
+        depends_on=("close_1h", "close_1m"),
+    )
+    engine.register(
+        "spread_pct",
+        lambda _, deps: deps["spread"] / deps["mark_price"] * 100.0 if deps["mark_price"] else None,
+        depends_on=("spread", "mark_price"),
+        default=0.0,
+    )
+    return store, engine
+
+
+def test_lazy_and_memoized_per_bar():
+    """조회 전 계산 없음, 같은 bar 재조회는 compute 0회"""
+    _, engine = _engine()
+    assert engine.get_compute_counts()["spread"] == 0
+
+    assert engine.get("spread") == 100.0
+    engine.get("spread")
+
+    assert engine.get_compute_counts() == {"close_1m": 1, "close_1h": 1, "spread": 1, "spread_pct": 0}
+
+
+def test_kline_change_recomputes_only_dependents():
+    """1m bar 추가 → close_1m/spread 재계산, close_1h 유지"""
+    store, engine = _engine()
+    engine.get("spread")
+
+    store.series("1").merge_rows([_row(START_MS + 5 * 60_000, 110.0)])
+
+    assert engine.get("spread") == 94.0
+    assert engine.get_compute_counts() == {"close_1m": 2, "close_1h": 1, "spread": 2, "spread_pct": 0}
+
+
+def test_input_change_and_default():
+    """input 미설정 → default, 같은 값 재설정 → 재계산 없음"""
+    _, engine = _engine()
+
+    assert engine.get("spread_pct") == 0.0
+
+    engine.set_input("mark_price", 200.0)
+    assert engine.get("spread_pct") == 50.0
+    engine.set_input("mark_price", 200.0)
+    engine.get("spread_pct")
+
+    assert engine.get_compute_counts()["spread_pct"] == 2
+
+
+def test_duplicate_registration_rejected():
+    """같은 이름 / input 이름으로 지표 등록 불가"""
+    _, engine = _engine()
+
+    with pytest.raises(ValueError):
+        engine.register("spread", lambda _, deps: 0.0)
+    with pytest.raises(ValueError):
+        engine.register("mark_price", lambda _, deps: 0.0)
+    with pytest.raises(ValueError):
+        engine.set_input("spread", 1.0)
@@ -0,0 +1,72 @@
+"""
+tests/unit/test_json_codec.py
+JSON Codec 테스트 (backend 무관 동작 동일성)
+
+테스트 범위:
+1. loads/dumps round-trip (bytes/str 입력)
+2. 잘못된 JSON → ValueError
+3. control frame fast path (pong / subscribe ack / data frame 구분)
+4. BybitWsClient: DEBUG 비활성 시 debug 문자열 미생성
+"""
+
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from infrastructure.exchange import json_codec
+
+
+def test_loads_dumps_round_trip_bytes_and_str():
+    """dumps → loads round-trip, bytes/str 모두 허용"""
+    obj = {"topic": "execution.linear", "data": [{"execPrice": "100000.5", "execQty": "0.001"}]}
+
+    text = json_codec.dumps(obj)
+
+    assert isinstance(text, str)
+    assert json_codec.loads(text) == obj
+    assert json_codec.loads(text.encode("utf-8")) == obj
+    assert json_codec.decode_response(Mock(content=text.encode("utf-8"))) == obj
+
+
+def test_invalid_json_raises_value_error():
+    """backend와 무관하게 ValueError"""
+    with pytest.raises(ValueError):
+        json_codec.loads("{not json")
+
+
+def test_control_frame_fast_path():
+    """pong은 파싱 생략, ack는 최소 파싱, data frame은 None"""
+    pong = json_codec.parse_control_frame('{"success":true,"ret_msg":"pong","conn_id":"x","op":"pong"}')
+    ack = json_codec.parse_control_frame('{"success":false,"ret_msg":"auth failed","op":"auth"}')
+    data = json_codec.parse_control_frame('{"topic":"execution.linear","data":[{"op":"pong"}]}')
+
+    assert pong == {"op": "pong", "success": True}
+    assert ack["op"] == "auth" and ack["success"] is False and ack["ret_msg"] == "auth failed"
+    assert data is None
+    assert json_codec.parse_control_frame("{broken") is None
+
+
+def test_ws_client_skips_debug_formatting_when_debug_disabled():
+    """DEBUG 비활성 → logger.debug 호출 자체가 없음"""
+    from infrastructure.exchange import bybit_ws_client
+    from infrastructure.exchange.bybit_ws_client import BybitWsClient
+
+    client = BybitWsClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        wss_url="wss://stream-testnet.bybit.com/v5/private",
+    )
+
+    with patch.object(bybit_ws_client.logger, "isEnabledFor", return_value=False), \
+         patch.object(bybit_ws_client.logger, "debug") as mock_debug:
+        client._on_ws_message(None, '{"op":"pong","success":true}')
+
+    mock_debug.assert_not_called()
+
+    with patch.object(bybit_ws_client.logger, "isEnabledFor",
+                      side_effect=lambda level: level == logging.DEBUG), \
+         patch.object(bybit_ws_client.logger, "debug") as mock_debug:
+        client._on_ws_message(None, '{"op":"pong","success":true}')
+
+    mock_debug.assert_called_once()
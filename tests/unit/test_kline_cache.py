@@ -0,0 +1,97 @@
+"""
+tests/unit/test_kline_cache.py
+Kline Disk Cache 테스트 (columnar .npz, 네트워크 호출 0)
+
+테스트 범위:
+1. save → load: OHLCV/startTime 동일, wrap-around series 포함
+2. 손상 파일 → 0 (빈 series)
+3. tail_request: 누락 tail만 / capacity 미만·장기 단절·gap → 전체 조회
+4. BybitAdapter 재시작: 디스크 적재 후 get_kline은 tail만 조회
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from infrastructure.exchange.bybit_adapter import BybitAdapter
+from infrastructure.exchange.kline_cache import KlineDiskCache
+from infrastructure.exchange.kline_store import KlineStore
+
+HOUR_MS = 3_600_000
+START_MS = 1_699_999_200_000  # hour 정렬
+
+
+def _row(start_ms, close):
+    return [str(start_ms), str(close), str(close + 50.0), str(close - 50.0), str(close), "1.0", "1.0"]
+
+
+def _series(n, capacity=10, first_start=START_MS):
+    series = KlineStore(capacity=capacity).series("60")
+    series.merge_rows([_row(first_start + i * HOUR_MS, 50000.0 + i) for i in range(n)])
+    return series
+
+
+def test_save_load_roundtrip_after_wraparound(tmp_path):
+    """capacity 초과 wrap 후 저장 → 새 series에 동일하게 적재"""
+    cache = KlineDiskCache(tmp_path)
+    series = _series(5)
+    series.merge_rows([_row(START_MS + i * HOUR_MS, 50000.0 + i) for i in range(5, 13)])
+    cache.save(series, "BTCUSDT")
+
+    restored = KlineStore(capacity=10).series("60")
+    assert cache.load(restored, "BTCUSDT") == 10
+
+    np.testing.assert_array_equal(restored.starts(), series.starts())
+    np.testing.assert_array_equal(restored.close(), series.close())
+    np.testing.assert_array_equal(restored.high(), series.high())
+    assert restored.merge_rows([_row(START_MS + 13 * HOUR_MS, 1.0)]) == 1
+    assert restored.close()[-1] == 1.0
+    assert not (tmp_path / "BTCUSDT_60.npz.tmp").exists()
+
+
+def test_corrupt_cache_loads_nothing(tmp_path):
+    """손상된 파일 → 0, series 비어 있음"""
+    cache = KlineDiskCache(tmp_path)
+    cache.path_for("BTCUSDT", "60").write_bytes(b"not a zip")
+    series = KlineStore(capacity=10).series("60")
+
+    assert cache.load(series, "BTCUSDT") == 0
+    assert len(series) == 0
+
+
+def test_tail_request_only_missing_bars():
+    """가득 찬 series → start=마지막 bar, limit=마지막~현재 bar 수"""
+    series = _series(10)
+    last = series.last_start
+
+    assert KlineDiskCache.tail_request(series, last + 30 * 60_000) == {"start": last, "limit": 1}
+    assert KlineDiskCache.tail_request(series, last + 3 * HOUR_MS + 5) == {"start": last, "limit": 4}
+    assert KlineDiskCache.tail_request(series, last + 50 * HOUR_MS) == {"limit": 10}
+    assert KlineDiskCache.tail_request(_series(5), last) == {"limit": 10}
+    assert KlineDiskCache.tail_request(KlineStore(capacity=10).series("60"), last) == {"limit": 10}
+
+
+def test_adapter_restart_fetches_only_tail(tmp_path):
+    """첫 실행 200 bar 조회 → 저장, 재시작 시 디스크 적재 + tail만 조회"""
+    now_ms = int(time.time() * 1000)
+    current = now_ms - now_ms % HOUR_MS
+    rows = [_row(current - i * HOUR_MS, 50000.0 + i) for i in range(200)]  # newest first
+
+    first_rest = MagicMock()
+    first_rest.get_kline.return_value = {"result": {"list": rows}}
+    first = BybitAdapter(first_rest, MagicMock(), testnet=True, kline_cache=KlineDiskCache(tmp_path))
+    first.update_market_data()
+    first_rest.get_kline.assert_called_once_with(category="linear", symbol="BTCUSDT", interval="60", limit=200)
+    atr = first.get_atr()
+    assert atr is not None
+
+    second_rest = MagicMock()
+    second_rest.get_kline.return_value = {"result": {"list": rows[:1]}}
+    second = BybitAdapter(second_rest, MagicMock(), testnet=True, kline_cache=KlineDiskCache(tmp_path))
+    assert second.get_atr() == atr  # REST 조회 전 디스크 캐시만으로 계산
+
+    second.update_market_data()
+    kwargs = second_rest.get_kline.call_args.kwargs
+    assert kwargs["start"] == current
+    assert kwargs["limit"] in (1, 2)  # 2: 테스트 중 시간 경계 통과
@@ -0,0 +1,114 @@
+"""
+tests/unit/test_kline_store.py
+Kline Store Unit Tests (columnar ring buffer)
+
+테스트 범위:
+1. REST row(newest first) seed → oldest-first OHLCV view
+2. 증분 병합: 진행 중 bar 덮어쓰기 / 새 bar 추가 / 과거 bar 무시
+3. capacity 초과 wrap-around 후에도 연속 view + zero-copy
+4. 겹치지 않는 batch / stream gap → 다음 batch에서 전체 재적재
+5. ATR / MA slope: view 입력 결과 = Kline 리스트 입력 결과
+"""
+
+import numpy as np
+
+from application.atr_calculator import ATRCalculator, Kline as ATRKline
+from application.market_regime import MarketRegimeAnalyzer, Kline as RegimeKline
+from infrastructure.exchange.kline_store import KlineStore
+
+HOUR_MS = 3_600_000
+START_MS = 1_700_000_000_000
+
+
+def _row(i, close=None):
+    close = 50000.0 + i * 10.0 if close is None else close
+    return [str(START_MS + i * HOUR_MS), str(close - 5.0), str(close + 100.0 + (i * 37) % 90),
+            str(close - 100.0), str(close), "1.0", "50000.0"]
+
+
+def _rest_rows(first, last):
+    """REST get_kline 형식 (newest first)"""
+    return [_row(i) for i in range(last - 1, first - 1, -1)]
+
+
+def test_seed_from_rest_rows_oldest_first_view():
+    """newest-first REST row → oldest-first view"""
+    series = KlineStore(capacity=10).series("60")
+
+    added = series.merge_rows(_rest_rows(0, 5))
+
+    assert added == 5
+    assert len(series) == 5
+    assert series.starts().tolist() == [START_MS + i * HOUR_MS for i in range(5)]
+    assert series.close().tolist() == [50000.0 + i * 10.0 for i in range(5)]
+    assert series.open()[0] == 49995.0
+    assert series.volume(2).tolist() == [1.0, 1.0]
+
+
+def test_incremental_merge_overwrites_appends_and_ignores_old():
+    """같은 start → 덮어쓰기, 새 start → 추가, 과거 start → 무시"""
+    series = KlineStore(capacity=10).series("60")
+    series.merge_rows(_rest_rows(0, 5))
+
+    assert series.merge_rows([_row(4, close=51000.0)]) == 0
+    assert series.close()[-1] == 51000.0
+
+    assert series.merge_rows([_row(5), _row(6)]) == 2
+    assert len(series) == 7
+    assert series.last_start == START_MS + 6 * HOUR_MS
+
+    series.merge_rows([_row(1, close=1.0)])
+    assert 1.0 not in series.close().tolist()
+    assert len(series) == 7
+
+
+def test_wraparound_keeps_contiguous_zero_copy_views():
+    """capacity 초과 → 최근 capacity개, view는 내부 buffer 공유"""
+    series = KlineStore(capacity=8).series("60")
+    series.merge_rows(_rest_rows(0, 5))
+    for i in range(5, 20):
+        series.merge_rows([_row(i)])
+
+    assert len(series) == 8
+    assert series.starts().tolist() == [START_MS + i * HOUR_MS for i in range(12, 20)]
+    assert series.close(3).tolist() == [50000.0 + i * 10.0 for i in range(17, 20)]
+    assert np.shares_memory(series.close(), series._ohlcv)
+
+
+def test_disjoint_batch_reloads_series():
+    """마지막 bar와 겹치지 않는 multi-row batch → 재적재 (장기 단절)"""
+    series = KlineStore(capacity=10).series("60")
+    series.merge_rows(_rest_rows(0, 5))
+
+    series.merge_rows(_rest_rows(50, 53))
+
+    assert series.starts().tolist() == [START_MS + i * HOUR_MS for i in range(50, 53)]
+
+
+def test_stream_gap_healed_by_next_rest_batch():
+    """stream 단건 gap은 그대로 추가, 다음 REST batch에서 재적재로 복구"""
+    series = KlineStore(capacity=10).series("60")
+    series.merge_rows(_rest_rows(0, 5))
+
+    series.merge_rows([_row(7)])
+    assert series.starts()[-2:].tolist() == [START_MS + 4 * HOUR_MS, START_MS + 7 * HOUR_MS]
+
+    series.merge_rows(_rest_rows(0, 8))
+    assert series.starts().tolist() == [START_MS + i * HOUR_MS for i in range(8)]
+
+
+def test_indicators_from_views_match_list_inputs():
+    """ATR state / MA slope: numpy view 입력 = dataclass 리스트 입력"""
+    series = KlineStore(capacity=60).series("60")
+    series.merge_rows(_rest_rows(0, 60))
+    rows = list(reversed(_rest_rows(0, 60)))
+    atr_klines = [ATRKline(high=float(r[2]), low=float(r[3]), close=float(r[4])) for r in rows]
+    regime_klines = [RegimeKline(close=float(r[4])) for r in rows]
+
+    calculator = ATRCalculator()
+    state = calculator.create_state()
+    state.backfill_arrays(series.high(), series.low(), series.close())
+    analyzer = MarketRegimeAnalyzer(ma_period=20)
+
+    assert state.atr == calculator.calculate_atr(atr_klines)
+    assert analyzer.calculate_ma_slope_from_closes(series.close()) == analyzer.calculate_ma_slope(regime_klines)
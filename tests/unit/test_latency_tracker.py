@@ -0,0 +1,108 @@
+"""
+tests/unit/test_latency_tracker.py
+REST Latency Tracker 테스트 (1분 rolling window, p50/p95/p99)
+
+테스트 범위:
+1. Nearest-rank percentile (endpoint별 / 전체)
+2. Window 밖 sample evict
+3. Ring buffer maxlen (bounded memory)
+4. BybitRestClient 기록 + BybitAdapter.get_rest_latency_p95_1m → Emergency gate
+"""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from infrastructure.exchange.latency_tracker import LatencyTracker
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_percentiles_per_endpoint_and_overall():
+    """endpoint별/전체 p50/p95/p99"""
+    clock = FakeClock()
+    tracker = LatencyTracker(window_s=60.0, clock=clock)
+
+    for i in range(1, 101):
+        tracker.record("/v5/market/tickers", i / 1000.0)  # 1ms ~ 100ms
+    tracker.record("/v5/order/create", 2.0)
+
+    assert tracker.get_percentile(50.0, "/v5/market/tickers") == pytest.approx(0.050)
+    assert tracker.get_percentile(95.0, "/v5/market/tickers") == pytest.approx(0.095)
+    assert tracker.get_percentile(99.0, "/v5/market/tickers") == pytest.approx(0.099)
+    assert tracker.get_percentile(95.0, "/v5/order/create") == 2.0
+
+    summary = tracker.get_summary()
+    assert summary["/v5/market/tickers"]["count"] == 100
+    assert summary["overall"]["count"] == 101
+    assert summary["overall"]["max"] == 2.0
+
+
+def test_samples_outside_window_are_evicted():
+    """60초 지난 sample → percentile에서 제외"""
+    clock = FakeClock()
+    tracker = LatencyTracker(window_s=60.0, clock=clock)
+
+    tracker.record("/v5/position/list", 6.0)
+    clock.now += 30.0
+    tracker.record("/v5/position/list", 0.1)
+    assert tracker.get_percentile(95.0) == 6.0
+
+    clock.now += 31.0
+    assert tracker.get_percentile(95.0) == 0.1
+
+    clock.now += 60.0
+    assert tracker.get_percentile(95.0) == 0.0
+    assert "/v5/position/list" not in tracker.get_summary()
+
+
+def test_ring_buffer_is_bounded():
+    """maxlen 초과 → 가장 오래된 sample부터 drop"""
+    tracker = LatencyTracker(window_s=60.0, max_samples_per_endpoint=10, clock=FakeClock())
+
+    for i in range(100):
+        tracker.record("/v5/market/kline", float(i))
+
+    assert tracker.get_summary()["/v5/market/kline"]["count"] == 10
+    assert tracker.get_percentile(50.0, "/v5/market/kline") == 94.0
+
+
+def test_adapter_p95_reflects_rest_client_latency():
+    """REST 요청 latency 기록 → BybitAdapter.get_rest_latency_p95_1m → emergency block"""
+    from infrastructure.exchange.bybit_rest_client import BybitRestClient
+    from infrastructure.exchange.bybit_adapter import BybitAdapter
+    from application.emergency import check_emergency
+
+    client = BybitRestClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        base_url="https://api-testnet.bybit.com",
+        clock=lambda: 1640000000.0,
+    )
+    adapter = BybitAdapter(client, MagicMock(), testnet=True)
+    assert adapter.get_rest_latency_p95_1m() == 0.0
+
+    # perf_counter: 호출마다 (시작, 종료) 쌍 → 6초 지연
+    with patch("requests.Session.get") as mock_get, \
+            patch("infrastructure.exchange.bybit_rest_client.time.perf_counter",
+                  side_effect=[100.0, 106.0]):
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.content = json.dumps({"retCode": 0, "result": {"list": []}}).encode()
+        mock_get.return_value = mock_response
+        client.get_tickers()
+
+    assert adapter.get_rest_latency_p95_1m() == pytest.approx(6.0)
+    assert adapter.get_rest_latency_stats()["/v5/market/tickers"]["p95"] == pytest.approx(6.0)
+
+    adapter._mark_price = 50000.0
+    adapter._equity_usdt = 1000.0
+    status = check_emergency(adapter)
+    assert status.is_blocked is True
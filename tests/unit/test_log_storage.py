@@ -298,3 +298,134 @@ def test_rotate_if_needed_handles_none_path():
         # lazy open이 수행되어 파일이 열려야 함
         assert storage.current_file_path is not None
         assert storage.current_file_fd is not None
+
+
+# ========== Group commit background writer + fsync policies ==========
+
+
+def test_log_storage_no_fsync_outside_policy(temp_log_dir, monkeypatch):
+    """
+    정책 밖의 fsync 없음: critical 정책에서 일반 record는 os.fsync를 호출하지 않는다.
+    """
+    from src.infrastructure.storage import log_storage as module
+
+    calls = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(module.os, "fsync", lambda fd: (calls.append(fd), real_fsync(fd)))
+
+    storage = module.LogStorage(log_dir=temp_log_dir, fsync_policy="critical")
+    for i in range(5):
+        storage.append_trade_log_v1({"order_id": f"log{i}", "schema_version": "1.0"})
+    assert calls == []
+    assert storage.fsync_count == 0
+
+    storage.append_trade_log_v1({"order_id": "halt", "event_type": "HALT"}, is_critical=True)
+    assert len(calls) == 1
+    assert storage.fsync_count == 1
+
+
+def test_log_storage_fsync_policy_periodic(temp_log_dir):
+    """
+    Fsync policy: periodic - 마지막 fsync 이후 interval 경과 후 append에서 fsync
+    """
+    from src.infrastructure.storage.log_storage import LogStorage
+
+    now = [100.0]
+    storage = LogStorage(
+        log_dir=temp_log_dir, fsync_policy="periodic", fsync_interval_sec=1.0, clock=lambda: now[0]
+    )
+
+    for i in range(20):
+        storage.append_trade_log_v1({"order_id": f"log{i}"})
+    assert storage.fsync_count == 0
+
+    now[0] = 101.0
+    storage.append_trade_log_v1({"order_id": "after_interval"})
+    assert storage.fsync_count == 1
+
+    now[0] = 101.5
+    storage.append_trade_log_v1({"order_id": "within_interval"})
+    assert storage.fsync_count == 1
+
+
+def test_log_storage_unknown_fsync_policy_rejected(temp_log_dir):
+    """알 수 없는 fsync_policy → ValueError"""
+    from src.infrastructure.storage.log_storage import LogStorage
+
+    with pytest.raises(ValueError):
+        LogStorage(log_dir=temp_log_dir, fsync_policy="always")
+
+
+def test_log_storage_background_group_commit(temp_log_dir):
+    """
+    background_writer: writer thread가 쌓인 record를 묶어 write → write syscall < record 수,
+    순서 유지, read_trade_logs_v1은 queue flush 후 읽음 (read-your-writes)
+    """
+    from src.infrastructure.storage.log_storage import LogStorage
+
+    storage = LogStorage(log_dir=temp_log_dir, background_writer=True, fsync_batch_size=1000)
+    storage.rotate_if_needed()  # lazy open
+    # writer thread가 첫 항목을 처리하기 전에 queue를 채우도록 io lock을 잡아 둔다
+    with storage._io_lock:
+        futures = [storage.append_trade_log_v1({"order_id": f"log{i}"}) for i in range(50)]
+    logs = storage.read_trade_logs_v1()
+
+    assert [log["order_id"] for log in logs] == [f"log{i}" for i in range(50)]
+    assert all(f.done() for f in futures)
+    assert storage.write_syscall_count < 50
+    assert storage.fsync_count == 0
+    storage.close()
+
+
+def test_log_storage_background_critical_durable_ack(temp_log_dir):
+    """
+    background_writer: critical record Future는 fsync 완료 후 resolve (durable ack)
+    """
+    from src.infrastructure.storage.log_storage import LogStorage
+
+    storage = LogStorage(log_dir=temp_log_dir, background_writer=True, fsync_batch_size=1000)
+    storage.append_trade_log_v1({"order_id": "normal"})
+    ack = storage.append_trade_log_v1({"order_id": "halt", "event_type": "HALT"}, is_critical=True)
+
+    assert ack.result(timeout=5) is None
+    assert storage.fsync_count == 1
+    assert storage.append_count == 0
+    storage.close()
+
+
+def test_log_storage_background_close_flushes_queue(temp_log_dir):
+    """
+    close(): queue에 남은 record를 모두 write + fsync 후 writer thread 종료
+    """
+    from src.infrastructure.storage.log_storage import LogStorage
+
+    storage = LogStorage(log_dir=temp_log_dir, background_writer=True, fsync_batch_size=1000)
+    for i in range(10):
+        storage.append_trade_log_v1({"order_id": f"log{i}"})
+    storage.close()
+
+    assert storage.current_file_fd is None
+    assert storage.fsync_count == 1
+    with open(storage.current_file_path, "r") as f:
+        assert len(f.readlines()) == 10
+
+
+def test_log_storage_background_rotation_keeps_queued_lines(temp_log_dir):
+    """
+    background_writer: rotation 전 queue에 남은 record는 이전 날짜 파일에 기록된다.
+    """
+    from src.infrastructure.storage.log_storage import LogStorage
+    from datetime import datetime, timezone
+
+    storage = LogStorage(log_dir=temp_log_dir, background_writer=True)
+    storage.set_current_time(datetime(2026, 1, 24, 23, 59, 50, tzinfo=timezone.utc))
+    for i in range(7):
+        storage.append_trade_log_v1({"order_id": f"day1_log{i}"})
+
+    storage.set_current_time(datetime(2026, 1, 25, 0, 0, 0, tzinfo=timezone.utc))
+    storage.rotate_if_needed()
+    storage.append_trade_log_v1({"order_id": "day2_log0"})
+    storage.close()
+
+    assert len(storage.read_trade_logs_v1(date="2026-01-24")) == 7
+    assert len(storage.read_trade_logs_v1(date="2026-01-25")) == 1
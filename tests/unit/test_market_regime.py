@@ -5,6 +5,7 @@ Market Regime Analyzer Unit Tests
 Purpose:
 - Kline 데이터 → MA slope 계산 검증
 - Regime 분류 검증 (trending_up/down/ranging/high_vol)
+- RollingMA (rolling-sum SMA) slope/acceleration = 전체 재계산 검증
 
 SSOT:
 - docs/plans/task_plan.md Phase 12a-2
@@ -14,7 +15,7 @@ SSOT:
 import pytest
 from typing import List
 
-from application.market_regime import MarketRegimeAnalyzer, Kline
+from application.market_regime import MarketRegimeAnalyzer, Kline, RollingMA
 
 
 class TestMarketRegimeMASlope:
@@ -149,3 +150,53 @@ class TestMarketRegimeClassification:
         # atr_percentile = 70% (경계)
         regime2 = analyzer.classify_regime(ma_slope_pct=0.1, atr_percentile=70.0)
         assert regime2 in ["ranging", "high_vol"]  # 구현에 따라 다를 수 있음
+
+
+class TestRollingMA:
+    """Rolling-sum SMA state"""
+
+    @staticmethod
+    def _closes(count: int) -> List[float]:
+        return [50000.0 + i * 15.0 + ((i * 37) % 11 - 5) * 20.0 for i in range(count)]
+
+    def test_update_slope_matches_full_recompute(self):
+        """bar별 slope = calculate_ma_slope (period 20/50)"""
+        closes = self._closes(120)
+        state = RollingMA(periods=(20, 50), resum_interval=7)
+
+        for i, close in enumerate(closes):
+            readings = state.update(close)
+            window = [Kline(close=c) for c in closes[: i + 1]]
+            for period in (20, 50):
+                if i + 1 >= period + 1:
+                    expected = MarketRegimeAnalyzer(ma_period=period).calculate_ma_slope(window)
+                    assert readings[period].slope_pct == pytest.approx(expected, abs=1e-9)
+                    assert readings[period].ma == pytest.approx(sum(closes[i + 1 - period: i + 1]) / period)
+                else:
+                    assert period not in readings
+
+    def test_peek_does_not_mutate_and_reports_acceleration(self):
+        """peek = update 결과, 상태 불변 / accel = slope 변화량"""
+        closes = self._closes(30)
+        state = RollingMA(periods=(20,))
+        state.backfill(closes[:-1])
+
+        peeked = state.peek(closes[-1])
+        assert state.bar_count == 29
+        updated = state.update(closes[-1])
+
+        assert peeked[20].slope_pct == pytest.approx(updated[20].slope_pct)
+        expected_prev = MarketRegimeAnalyzer(ma_period=20).calculate_ma_slope([Kline(close=c) for c in closes[:-1]])
+        assert updated[20].accel_pct == pytest.approx(updated[20].slope_pct - expected_prev, abs=1e-9)
+
+    def test_evaluate_regime_from_readings(self):
+        """ma_period reading → classify_regime, 데이터 부족 → None"""
+        analyzer = MarketRegimeAnalyzer(ma_period=20)
+        state = analyzer.create_ma_state(periods=(50,))
+
+        assert state.periods == (20, 50)
+        assert analyzer.evaluate(state.update(50000.0), atr_percentile=50.0) is None
+
+        readings = state.backfill([50000.0 + i * 200.0 for i in range(30)])
+        assert analyzer.evaluate(readings, atr_percentile=50.0) == "trending_up"
+        assert analyzer.evaluate(readings, atr_percentile=90.0) == "high_vol"
@@ -0,0 +1,92 @@
+"""
+tests/unit/test_price_history.py
+Price History 테스트 (time-indexed ring buffer, 네트워크 호출 0)
+
+테스트 범위:
+1. price_ago: bucket close, 빈 bucket carry-forward, history 부족 시 None
+2. window_min/max: ring wrap-around 포함 선형 scan과 동일
+3. return_over: history 부족 시 가장 오래된 가격 기준
+4. BybitAdapter ticker stream → price_drop_1m/5m → check_emergency COOLDOWN
+"""
+
+from unittest.mock import MagicMock
+
+from application.emergency import check_emergency
+from infrastructure.exchange.bybit_adapter import BybitAdapter
+from infrastructure.exchange.price_history import PriceHistory
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_price_ago_with_carry_forward():
+    """bucket close 반환, 기록 없는 구간은 직전 가격 유지"""
+    clock = FakeClock()
+    history = PriceHistory(window_s=60.0, resolution_s=1.0, clock=clock)
+
+    history.record(100.0, ts=1000.2)
+    history.record(101.0, ts=1000.8)  # 같은 bucket → close 갱신
+    history.record(90.0, ts=1010.0)
+    clock.now = 1010.5
+
+    assert history.price_ago(10.0) == 101.0
+    assert history.price_ago(5.0) == 101.0  # carry-forward
+    assert history.price_ago(0.0) == 90.0
+    assert history.price_ago(30.0) is None  # 기록 이전
+
+
+def test_window_min_max_matches_scan_across_wraparound():
+    """capacity 여러 바퀴 기록 후에도 구간 min/max = 선형 scan"""
+    clock = FakeClock()
+    history = PriceHistory(window_s=30.0, resolution_s=1.0, clock=clock)
+    prices = {}
+    for t in range(200):
+        price = 100.0 + ((t * 37) % 23) - 11.0
+        history.record(price, ts=1000.0 + t)
+        prices[1000 + t] = price
+    clock.now = 1199.5
+
+    for seconds in (1.0, 5.0, 17.0, 30.0):
+        window = [prices[t] for t in range(int(1199.5 - seconds), 1200)]
+        assert history.window_min(seconds) == min(window)
+        assert history.window_max(seconds) == max(window)
+    assert len(history) == history.capacity
+
+
+def test_return_over_clamps_to_oldest_price():
+    """history < window → 가장 오래된 가격 기준, 기록 없음 → 0.0"""
+    clock = FakeClock()
+    history = PriceHistory(window_s=600.0, clock=clock)
+    assert history.return_over(60.0) == 0.0
+
+    history.record(100.0, ts=1000.0)
+    history.record(88.0, ts=1020.0)
+    clock.now = 1020.0
+
+    assert history.return_over(60.0) == (88.0 - 100.0) / 100.0
+    assert history.window_min(60.0) == 88.0
+    assert history.window_max(60.0) == 100.0
+
+
+def test_adapter_price_stream_triggers_emergency_cooldown():
+    """ticker stream 가격 급락 → price_drop_1m <= -10% → COOLDOWN"""
+    adapter = BybitAdapter(rest_client=MagicMock(), ws_client=MagicMock(), testnet=True)
+    adapter.rest_client.latency_tracker.get_percentile.return_value = 0.1
+    adapter._equity_usdt = 1000.0
+    clock = FakeClock()
+    adapter._price_history.clock = clock
+
+    adapter.on_ticker_update({"markPrice": "50000.0"})
+    clock.now += 30.0
+    adapter.on_ticker_update({"markPrice": "44000.0"})
+
+    assert adapter.get_price_drop_1m() == (44000.0 - 50000.0) / 50000.0
+    assert adapter.get_price_drop_5m() == adapter.get_price_drop_1m()
+    status = check_emergency(adapter)
+    assert status.is_cooldown
+    assert status.reason.startswith("price_drop_1m")
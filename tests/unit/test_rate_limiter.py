@@ -0,0 +1,144 @@
+"""
+tests/unit/test_rate_limiter.py
+Client-side Token Bucket Rate Limiter 테스트 (네트워크 호출 0)
+
+테스트 범위:
+1. endpoint group별 bucket 분리
+2. X-Bapi-Limit / X-Bapi-Limit-Status 헤더 → bucket 보정
+3. critical(주문/Stop) 호출 우선 (reserve token)
+4. background 호출 선제 거절 (retry_after)
+5. retCode 10006 → 해당 group만 reset까지 차단
+6. BybitRestClient 통합 (선제 거절 시 네트워크 호출 없음)
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from infrastructure.exchange.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """수동 진행 clock + sleep 기록"""
+
+    def __init__(self, now: float = 1640000000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_groups_have_independent_buckets():
+    """market group 소진 → position group에는 영향 없음"""
+    clock = FakeClock()
+    limiter = RateLimiter(
+        clock=clock,
+        sleep=clock.sleep,
+        group_limits={"market": 5, "position": 5},
+        max_background_wait_s=0.1,
+    )
+
+    # market: reserve(1) 제외 4개까지 즉시 허용
+    for _ in range(4):
+        assert limiter.acquire("/v5/market/tickers") == (True, 0.0)
+    granted, retry_after = limiter.acquire("/v5/market/kline")
+
+    assert granted is False
+    assert retry_after == pytest.approx(0.2)
+    assert limiter.acquire("/v5/position/list") == (True, 0.0)
+
+
+def test_headers_update_bucket_tokens_and_capacity():
+    """X-Bapi-Limit=20, Status=3 → capacity 20, tokens 3"""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+    limiter.update_from_headers("/v5/position/list", {
+        "X-Bapi-Limit": "20",
+        "X-Bapi-Limit-Status": "3",
+        "X-Bapi-Limit-Reset-Timestamp": "1640000000000",
+    })
+
+    status = limiter.get_group_status()["position"]
+    assert status["capacity"] == 20.0
+    assert status["tokens"] == 3.0
+    assert status["reserve"] == 4.0
+
+    # tokens(3) < reserve+1 → background는 대기 필요 (0.1s 이하면 pacing)
+    granted, wait = limiter.acquire("/v5/position/list")
+    assert granted is True
+    assert wait == pytest.approx(0.1)
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_critical_stop_amendment_uses_reserve_ahead_of_background():
+    """background가 거절되는 상황에서 trading-stop은 즉시 진행"""
+    clock = FakeClock()
+    limiter = RateLimiter(
+        clock=clock,
+        sleep=clock.sleep,
+        group_limits={"position": 10},
+        max_background_wait_s=0.0,
+    )
+
+    limiter.update_from_headers("/v5/position/list", {"X-Bapi-Limit-Status": "2"})
+
+    granted, _ = limiter.acquire("/v5/position/list")
+    assert granted is False
+
+    assert limiter.acquire("/v5/position/trading-stop") == (True, 0.0)
+    assert limiter.acquire("/v5/position/trading-stop") == (True, 0.0)
+    assert limiter.rejected_count == 1
+
+
+def test_rate_limited_group_blocked_until_reset():
+    """retCode 10006 → reset 시각까지 차단, critical은 최대 대기 후 진행"""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep, max_critical_wait_s=2.0)
+
+    limiter.on_rate_limited("/v5/order/create", reset_timestamp_ms=int((clock.now + 0.5) * 1000))
+
+    granted, wait = limiter.acquire("/v5/order/create")
+    assert granted is True
+    assert wait == pytest.approx(0.6)  # reset 대기 0.5s + token 1개 refill 0.1s
+
+    # 다른 group은 영향 없음
+    assert limiter.acquire("/v5/market/tickers") == (True, 0.0)
+
+
+def test_rest_client_rejects_background_call_without_network():
+    """token 부족한 background 조회 → RateLimitError, requests 호출 없음"""
+    from infrastructure.exchange.bybit_rest_client import BybitRestClient, RateLimitError
+
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    client = BybitRestClient(
+        api_key="test_key",
+        api_secret="test_secret",
+        base_url="https://api-testnet.bybit.com",
+        clock=clock,
+        rate_limiter=limiter,
+    )
+
+    with patch("requests.Session.get") as mock_get:
+        mock_response = Mock()
+        mock_response.headers = {
+            "X-Bapi-Limit": "50",
+            "X-Bapi-Limit-Status": "0",
+            "X-Bapi-Limit-Reset-Timestamp": str(int((clock.now + 1.0) * 1000)),
+        }
+        mock_response.content = json.dumps({"retCode": 0, "result": {}}).encode()
+        mock_get.return_value = mock_response
+
+        client.get_wallet_balance()
+        with pytest.raises(RateLimitError) as exc_info:
+            client.get_wallet_balance()
+
+        assert mock_get.call_count == 1
+        assert exc_info.value.retry_after > 1.0
@@ -0,0 +1,64 @@
+"""
+tests/unit/test_rolling_percentile.py
+Rolling Percentile Unit Tests
+
+테스트 범위:
+1. rank = ATRCalculator.calculate_atr_percentile (선형 scan)와 동일
+2. window 초과 시 가장 오래된 값 evict (중복 값 포함)
+3. quantile (nearest-rank)
+4. ATRState.percentile_rank / quantile 연동
+"""
+
+from application.atr_calculator import ATRCalculator, Kline
+from application.rolling_percentile import RollingPercentile
+
+
+def test_rank_matches_linear_scan_over_sliding_window():
+    """매 add 후 rank = 최근 window 값 선형 scan 결과"""
+    calculator = ATRCalculator()
+    window = RollingPercentile(window=20)
+    values = [float((i * 37) % 23) for i in range(100)]
+
+    for i, value in enumerate(values):
+        window.add(value)
+        recent = values[max(0, i - 19): i + 1]
+        for probe in (0.0, 5.5, 11.0, 22.0, 30.0):
+            assert window.rank(probe) == calculator.calculate_atr_percentile(probe, recent)
+
+    assert len(window) == 20
+    assert list(window.values) == values[-20:]
+
+
+def test_empty_window_defaults():
+    """값 없음 → rank 50.0, quantile 0.0"""
+    window = RollingPercentile(window=10)
+
+    assert window.rank(1.0) == 50.0
+    assert window.quantile(95.0) == 0.0
+
+
+def test_quantile_nearest_rank():
+    """1~100 → p50=50, p95=95, p100=100, p0=1"""
+    window = RollingPercentile(window=100)
+    for value in range(100, 0, -1):
+        window.add(float(value))
+
+    assert window.quantile(50.0) == 50.0
+    assert window.quantile(95.0) == 95.0
+    assert window.quantile(100.0) == 100.0
+    assert window.quantile(0.0) == 1.0
+
+
+def test_atr_state_percentile_rank_and_quantile():
+    """ATRState history 기반 percentile = 기존 list 계산"""
+    calculator = ATRCalculator()
+    klines = [
+        Kline(high=50000.0 + (i * 31) % 400, low=49800.0 - (i * 17) % 300, close=49900.0 + (i * 13) % 200)
+        for i in range(150)
+    ]
+    state = calculator.create_state(history_size=100)
+    state.backfill(klines[:-1])
+    current = state.peek(klines[-1])
+
+    assert state.percentile_rank(current) == calculator.calculate_atr_percentile(current, list(state.history))
+    assert state.quantile(100.0) == max(state.history)
@@ -7,6 +7,7 @@ Purpose:
 - Loss streak 계산 검증
 - Fee ratio / Slippage tracking 검증
 - UTC boundary 인식 검증
+- SessionRiskAggregator: 체결 단위 증분 누적 = stateless 재계산, rollover, checkpoint
 
 SSOT:
 - docs/plans/task_plan.md Phase 12a-2
@@ -17,7 +18,7 @@ import pytest
 from datetime import datetime, timezone
 from typing import List, Dict, Any
 
-from application.session_risk_tracker import SessionRiskTracker, Trade, FillEvent
+from application.session_risk_tracker import SessionRiskAggregator, SessionRiskTracker, Trade, FillEvent
 
 
 class TestSessionRiskTrackerDailyPnL:
@@ -282,3 +283,111 @@ class TestSessionRiskTrackerSlippage:
 
         # Assert
         assert slippage_history == []
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSessionRiskAggregator:
+    """Incremental session risk aggregates"""
+
+    def test_weekly_pnl_matches_full_recompute_beyond_50_trades(self):
+        """120 trades 증분 누적 = 전체 trade list stateless 계산 (50개 제한 없음)"""
+        # 2026-01-28 (Wed) 12:00 UTC
+        now = datetime(2026, 1, 28, 12, 0, 0, tzinfo=timezone.utc)
+        clock = FakeClock(now.timestamp())
+        aggregator = SessionRiskAggregator(clock=clock)
+        trades = [
+            Trade(closed_pnl=((i * 7) % 11) - 6.0, timestamp=now.timestamp() - 200_000 + i * 1500)
+            for i in range(120)
+        ]
+        for trade in trades:
+            aggregator.record_trade(trade.closed_pnl, trade.timestamp)
+
+        tracker = SessionRiskTracker()
+        assert aggregator.weekly_pnl() == pytest.approx(tracker.track_weekly_pnl(trades, now))
+        assert aggregator.daily_pnl() == pytest.approx(tracker.track_daily_pnl(trades, now))
+        assert aggregator.loss_streak() == tracker.calculate_loss_streak(trades)
+        assert aggregator.trade_count == 120
+
+    def test_utc_day_and_week_rollover(self):
+        """Sunday 거래 → Monday 00:00 UTC 이후 daily/weekly 모두 0"""
+        sunday = datetime(2026, 2, 1, 23, 0, 0, tzinfo=timezone.utc).timestamp()
+        clock = FakeClock(sunday)
+        aggregator = SessionRiskAggregator(clock=clock)
+        aggregator.record_trade(-4.0, sunday)
+        assert aggregator.daily_pnl() == -4.0
+        assert aggregator.weekly_pnl() == -4.0
+
+        clock.now = sunday + 7200  # Monday 01:00 UTC
+        assert aggregator.daily_pnl() == 0.0
+        assert aggregator.weekly_pnl() == 0.0
+        assert aggregator.loss_streak() == 1  # streak은 경계와 무관
+
+        aggregator.record_trade(3.0, clock.now)
+        clock.now += 86400  # Tuesday
+        assert aggregator.daily_pnl() == 0.0
+        assert aggregator.weekly_pnl() == 3.0
+        assert aggregator.loss_streak() == 0
+
+    def test_out_of_order_trade_does_not_change_streak(self):
+        """마지막 거래보다 과거 체결은 합계만 반영, streak 유지"""
+        now = datetime(2026, 1, 28, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+        aggregator = SessionRiskAggregator(clock=FakeClock(now))
+        aggregator.record_trade(-1.0, now - 10)
+        aggregator.record_trade(-2.0, now - 5)
+        aggregator.record_trade(5.0, now - 30)
+
+        assert aggregator.loss_streak() == 2
+        assert aggregator.daily_pnl() == 2.0
+
+    def test_fee_ratio_and_slippage(self):
+        """fee ratio = actual / estimated, slippage = 가격 차 × 수량 (윈도우 내)"""
+        now = 1_800_000_000.0
+        clock = FakeClock(now)
+        aggregator = SessionRiskAggregator(slippage_window_seconds=600, clock=clock)
+        aggregator.record_fill(
+            FillEvent(fee=0.055, notional=100.0, expected_price=50000.0, filled_price=50010.0, timestamp=now - 700),
+            fee_rate=0.00055,
+        )
+        aggregator.record_fill(
+            FillEvent(fee=0.11, notional=100.0, expected_price=50000.0, filled_price=50000.0, timestamp=now - 60),
+            fee_rate=0.00055,
+        )
+
+        assert aggregator.fee_ratio_history() == pytest.approx([1.0, 2.0])
+        assert aggregator.slippage_history() == [{"slippage_usd": 0.0, "timestamp": now - 60}]
+
+    def test_checkpoint_roundtrip_and_exec_id_dedup(self, tmp_path):
+        """checkpoint 복원 후 누적값 동일, 이미 반영한 execId는 무시"""
+        now = datetime(2026, 1, 28, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+        path = tmp_path / "state" / "session_risk.json"
+        aggregator = SessionRiskAggregator(checkpoint_path=path, clock=FakeClock(now))
+        assert aggregator.mark_execution("e1")
+        aggregator.record_trade(-2.5, now - 100)
+        aggregator.record_fill(FillEvent(fee=0.05, notional=100.0, timestamp=now - 100), fee_rate=0.0005)
+        aggregator.checkpoint()
+
+        restored = SessionRiskAggregator(checkpoint_path=path, clock=FakeClock(now))
+
+        assert restored.to_dict() == aggregator.to_dict()
+        assert restored.daily_pnl() == -2.5
+        assert restored.loss_streak() == 1
+        assert not restored.mark_execution("e1")
+        assert restored.mark_execution("e2")
+        assert not (tmp_path / "state" / "session_risk.json.tmp").exists()
+
+    def test_corrupt_checkpoint_starts_empty(self, tmp_path):
+        """손상된 checkpoint → 빈 상태로 시작"""
+        path = tmp_path / "session_risk.json"
+        path.write_text("{not json")
+
+        aggregator = SessionRiskAggregator(checkpoint_path=path)
+
+        assert aggregator.trade_count == 0
+        assert aggregator.daily_pnl() == 0.0
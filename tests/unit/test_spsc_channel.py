@@ -0,0 +1,90 @@
+"""
+tests/unit/test_spsc_channel.py
+BoundedChannel (SPSC) Unit Tests
+
+테스트 범위:
+1. drop_newest / drop_oldest overflow + drop count
+2. block 정책: consumer가 공간을 만들면 producer 진행, timeout 시 drop
+3. spill 정책: 무손실 + FIFO 순서 유지 + high-water mark
+4. wait()/get_async(): 메시지 도착 시 즉시 wakeup
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from infrastructure.exchange.spsc_channel import BoundedChannel
+
+
+def test_drop_newest_and_drop_oldest_policies():
+    """maxsize=2에 3개 put → drop_newest는 [1,2], drop_oldest는 [2,3]"""
+    newest = BoundedChannel(maxsize=2, overflow_policy="drop_newest")
+    oldest = BoundedChannel(maxsize=2, overflow_policy="drop_oldest")
+
+    for i in (1, 2, 3):
+        newest.put(i)
+        oldest.put(i)
+
+    assert newest.drain() == [1, 2]
+    assert oldest.drain() == [2, 3]
+    assert newest.drop_count == 1
+    assert oldest.drop_count == 1
+
+
+def test_block_policy_waits_for_consumer_then_times_out():
+    """block: consumer drain 후 put 진행 / consumer 없으면 timeout → drop"""
+    channel = BoundedChannel(maxsize=1, overflow_policy="block", block_timeout_s=2.0)
+    channel.put("a")
+
+    consumer = threading.Timer(0.05, channel.drain)
+    consumer.start()
+    assert channel.put("b") is True
+    consumer.join()
+    assert channel.drain() == ["b"]
+
+    channel.block_timeout_s = 0.01
+    channel.put("c")
+    assert channel.put("d") is False
+    assert channel.drop_count == 1
+
+
+def test_spill_policy_is_lossless_and_fifo(tmp_path):
+    """spill: 메모리 초과분 파일로 spill → drain 시 순서대로 전부 복원"""
+    spill_path = tmp_path / "spill.jsonl"
+    channel = BoundedChannel(maxsize=2, overflow_policy="spill", spill_path=spill_path)
+
+    for i in range(5):
+        assert channel.put({"id": i}) is True
+
+    stats = channel.get_stats()
+    assert stats["spilled"] == 3
+    assert stats["high_water_mark"] == 5
+    assert channel.drop_count == 0
+
+    # 일부 소비 후 추가 put → spill 뒤에 붙어 FIFO 유지
+    assert channel.get_nowait() == {"id": 0}
+    channel.put({"id": 5})
+
+    assert [m["id"] for m in channel.drain()] == [1, 2, 3, 4, 5]
+    assert channel.qsize() == 0
+    assert spill_path.read_text() == ""
+
+
+def test_spill_requires_path():
+    """spill 정책 + spill_path 누락 → ValueError"""
+    with pytest.raises(ValueError):
+        BoundedChannel(maxsize=2, overflow_policy="spill")
+
+
+def test_wait_wakes_consumer_on_put():
+    """wait(timeout=2.0) 중 put → 즉시 반환 (고정 sleep 없음)"""
+    channel = BoundedChannel(maxsize=4)
+    threading.Timer(0.05, channel.put, args=("fill",)).start()
+
+    started = time.monotonic()
+    assert channel.wait(timeout=2.0) is True
+    assert time.monotonic() - started < 1.0
+
+    assert asyncio.run(channel.get_async(timeout=1.0)) == "fill"
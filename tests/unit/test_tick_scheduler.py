@@ -0,0 +1,111 @@
+"""
+tests/unit/test_tick_scheduler.py
+TickScheduler Unit Tests (event-driven run_tick wakeup)
+
+테스트 범위:
+1. execution event 도착 → 즉시 wakeup
+2. 가격 threshold 이상 변동 → price_move wakeup
+3. pending order timeout 도달 → pending_timeout wakeup (deadline당 1회)
+4. 이벤트 없음 → heartbeat floor
+5. 미소비 이벤트가 남아도 busy loop 없음 + metrics
+"""
+
+import threading
+import time
+
+from application.tick_scheduler import TickScheduler
+from infrastructure.exchange.spsc_channel import BoundedChannel
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _scheduler(clock, price, wait_for_events=None, deadline=None, **kwargs):
+    def fake_wait(timeout):
+        clock.sleep(timeout)
+        return False
+
+    return TickScheduler(
+        wait_for_events=wait_for_events or fake_wait,
+        get_price=lambda: price[0],
+        get_pending_deadline=(lambda: deadline[0]) if deadline is not None else None,
+        clock=clock,
+        wall_clock=clock,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+def test_execution_event_wakes_immediately():
+    """실제 channel: heartbeat 5초 대기 중 put → 즉시 execution wakeup"""
+    channel = BoundedChannel(maxsize=10)
+    scheduler = TickScheduler(
+        wait_for_events=channel.wait,
+        get_price=lambda: 50000.0,
+        heartbeat_s=5.0,
+    )
+    scheduler.wait_next()
+    scheduler.record_tick(0.001)
+
+    threading.Timer(0.05, channel.put, args=({"topic": "execution.linear"},)).start()
+    started = time.monotonic()
+    reason = scheduler.wait_next()
+
+    assert reason == "execution"
+    assert time.monotonic() - started < 1.0
+
+
+def test_price_move_and_heartbeat():
+    """0.05% 미만 변동 → heartbeat, 이상 변동 → price_move"""
+    clock = FakeClock()
+    price = [50000.0]
+    scheduler = _scheduler(clock, price, heartbeat_s=1.0, price_move_pct=0.05)
+    scheduler.wait_next()
+    scheduler.record_tick(0.0)
+
+    price[0] = 50010.0  # 0.02%
+    assert scheduler.wait_next() == "heartbeat"
+    assert clock.now >= 1.0
+    scheduler.record_tick(0.0)
+
+    price[0] = 50040.0  # 0.06% vs 50010
+    assert scheduler.wait_next() == "price_move"
+
+
+def test_pending_timeout_fires_once_per_deadline():
+    """pending deadline 도달 → pending_timeout 1회, 이후 heartbeat"""
+    clock = FakeClock(100.0)
+    deadline = [100.5]
+    scheduler = _scheduler(clock, [50000.0], deadline=deadline, heartbeat_s=2.0)
+    scheduler.wait_next()
+    scheduler.record_tick(0.0)
+
+    assert scheduler.wait_next() == "pending_timeout"
+    assert 100.5 <= clock.now < 101.0
+    scheduler.record_tick(0.0)
+
+    assert scheduler.wait_next() == "heartbeat"
+
+
+def test_unconsumed_events_do_not_spin_and_metrics_recorded():
+    """tick이 이벤트를 소비하지 않으면 heartbeat까지 대기 (execution 연속 wakeup 없음)"""
+    clock = FakeClock()
+    scheduler = _scheduler(clock, [50000.0], wait_for_events=lambda timeout: True, heartbeat_s=1.0)
+
+    assert scheduler.wait_next() == "heartbeat"
+    scheduler.record_tick(0.002)
+    assert scheduler.wait_next() == "heartbeat"
+    scheduler.record_tick(0.004)
+
+    metrics = scheduler.get_metrics()
+    assert metrics["wakeups"] == {"execution": 0, "price_move": 0, "pending_timeout": 0, "heartbeat": 2}
+    assert metrics["tick_duration_s"]["count"] == 2
+    assert metrics["tick_duration_s"]["max"] == 0.004
@@ -0,0 +1,110 @@
+"""
+tests/unit/test_vectorized_indicators.py
+Vectorized Indicators 테스트 (scalar 구현과 bit 단위 동일)
+
+테스트 범위:
+1. true_range / atr_series(ema) == ATRCalculator.calculate_atr_series
+2. atr_series(wilder): alpha = 1/period
+3. rolling_percentile_rank == RollingPercentile add → rank (chunk 경계 포함)
+4. sma_slope_series == MarketRegimeAnalyzer.calculate_ma_slope_from_closes
+5. fetch_kline_history: end 이동 paging → oldest-first columnar
+"""
+
+import numpy as np
+import pytest
+
+import application.vectorized_indicators as vectorized
+from application.atr_calculator import ATRCalculator, Kline
+from application.market_regime import MarketRegimeAnalyzer
+from application.rolling_percentile import RollingPercentile
+from application.vectorized_indicators import atr_series, rolling_percentile_rank, sma_slope_series, true_range
+from infrastructure.exchange.kline_cache import fetch_kline_history
+
+
+def _bars(n, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 50000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.005, n)))
+    spread = np.abs(rng.normal(0.0, 0.004, n)) * close
+    return close + spread, close - spread, close
+
+
+def test_atr_series_matches_scalar_exactly():
+    """EMA ATR: seed 이전 NaN, 이후 calculate_atr_series와 완전 동일"""
+    high, low, close = _bars(600)
+    klines = [Kline(high=h, low=l, close=c) for h, l, c in zip(high.tolist(), low.tolist(), close.tolist())]
+    calculator = ATRCalculator(period=14)
+
+    atr = atr_series(high, low, close, period=14)
+
+    assert np.isnan(atr[:14]).all()
+    assert atr[14:].tolist() == calculator.calculate_atr_series(klines)
+    assert atr[-1] == calculator.calculate_atr(klines)
+    tr = true_range(high, low, close)
+    assert tr[5] == calculator.calculate_true_range(klines[5], klines[4].close)
+
+
+def test_atr_series_wilder_and_short_input():
+    """Wilder smoothing (alpha=1/period), 데이터 부족 → 전부 NaN"""
+    high, low, close = _bars(40)
+    tr = true_range(high, low, close)
+    atr = atr_series(high, low, close, period=14, smoothing="wilder")
+
+    assert atr[14] == pytest.approx(np.mean(tr[1:15]))
+    assert atr[15] == pytest.approx(tr[15] / 14 + atr[14] * 13 / 14)
+    assert np.isnan(atr_series(high[:14], low[:14], close[:14], period=14)).all()
+    with pytest.raises(ValueError):
+        atr_series(high, low, close, smoothing="sma")
+
+
+def test_rolling_percentile_rank_matches_scalar(monkeypatch):
+    """부분 window + chunk 경계에서도 RollingPercentile 결과와 동일 (동률 포함)"""
+    monkeypatch.setattr(vectorized, "_RANK_CHUNK_ROWS", 7)
+    values = np.round(np.random.default_rng(5).normal(100.0, 10.0, 300), 0)
+    rolling = RollingPercentile(window=25)
+    expected = []
+    for value in values.tolist():
+        rolling.add(value)
+        expected.append(rolling.rank(value))
+
+    assert rolling_percentile_rank(values, window=25).tolist() == expected
+
+
+def test_sma_slope_series_matches_scalar():
+    """i번째 slope == closes[:i+1] 기준 calculate_ma_slope_from_closes"""
+    _, _, close = _bars(400)
+    closes = close.tolist()
+    analyzer = MarketRegimeAnalyzer(ma_period=20)
+
+    slope = sma_slope_series(close, period=20)
+
+    assert np.isnan(slope[:20]).all()
+    assert slope[20:].tolist() == [
+        analyzer.calculate_ma_slope_from_closes(closes[:i + 1]) for i in range(20, len(closes))
+    ]
+    assert sma_slope_series(np.zeros(25), period=20)[20:].tolist() == [0.0] * 5
+
+
+class FakeKlineApi:
+    """get_kline(start, end, limit): 구간 내 최신 limit개 (newest first)"""
+
+    def __init__(self, starts):
+        self.starts = starts
+        self.calls = 0
+
+    def get_kline(self, category, symbol, interval, limit, start, end):
+        self.calls += 1
+        rows = [s for s in self.starts if start <= s <= end][::-1][:limit]
+        return {"result": {"list": [[str(s), "1", "2", "0.5", str(s), "3", "4"] for s in rows]}}
+
+
+def test_fetch_kline_history_pages_backwards():
+    """25 bar / page 10 → 3 page, oldest-first 중복 없음"""
+    starts = [1_000 + i * 60 for i in range(25)]
+    api = FakeKlineApi(starts)
+
+    got_starts, ohlcv = fetch_kline_history(api, start_ms=starts[0], end_ms=starts[-1], page_limit=10)
+
+    assert got_starts.tolist() == starts
+    assert ohlcv.shape == (5, 25)
+    assert ohlcv[3].tolist() == [float(s) for s in starts]
+    assert api.calls == 3